@@ -2,15 +2,54 @@
 ASGI config for backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP requests are served by Django, WebSocket connections by the handlers of
+``websocket_routes``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
 import os
+import re
+from typing import Any, Awaitable, Callable
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# pylint: disable=wrong-import-position
+from todos.websocket import board_events  # noqa: E402
+
+websocket_routes: list[tuple[re.Pattern, Callable[..., Awaitable[None]]]] = [
+    (
+        re.compile(
+            r"^/api/v1/boards/(?P<board_id>[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-"
+            r"[0-9a-fA-F]{4}-[0-9a-fA-F]{12})/events/$"
+        ),
+        board_events,
+    ),
+]
+
+
+async def application(scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+    """Route WebSocket connections to their handler and everything else to Django.
+
+    Args:
+        scope (dict[str, Any]): The ASGI connection scope.
+        receive (Callable): Awaits the next message from the client.
+        send (Callable): Sends a message to the client.
+    """
+    if scope["type"] != "websocket":
+        await django_application(scope, receive, send)
+        return
+
+    for pattern, handler in websocket_routes:
+        match: re.Match | None = pattern.match(scope["path"])
+        if match is not None:
+            await handler(scope, receive, send, **match.groupdict())
+            return
+
+    await receive()
+    await send({"type": "websocket.close"})
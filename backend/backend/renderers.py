@@ -0,0 +1,69 @@
+"""
+Response renderers of the backend project.
+
+DRF's `JSONRenderer` encodes responses with the stdlib `json` module and converts
+every UUID and datetime through `JSONEncoder.default`. The renderer of this module
+encodes with `orjson` instead, which serializes UUIDs, datetimes, enums and the
+dict and list subclasses of DRF natively, with the same output. It falls back to
+the stdlib encoder when `orjson` (the `orjson` extra) is not installed and for
+indented responses, e.g. of the browsable API.
+
+Classes:
+    FastJSONRenderer: JSON renderer backed by `orjson`.
+
+Example:
+    from backend.renderers import FastJSONRenderer
+"""
+
+from typing import Any
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+ORJSON_OPTIONS: int = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSON renderer backed by `orjson`.
+
+    Values `orjson` does not support, e.g. decimals or lazy translations, are
+    converted by DRF's `JSONEncoder`.
+
+    Methods:
+        render: Renders the data into JSON.
+    """
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None,
+    ) -> bytes:
+        """Render the data into JSON, returning a bytestring.
+
+        Args:
+            data (Any): The response data.
+            accepted_media_type (str | None): The media type accepted by the client.
+            renderer_context (dict[str, Any] | None): The context of the view.
+
+        Returns:
+            bytes: The compact UTF-8 encoded JSON.
+        """
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        content: bytes = orjson.dumps(data, default=JSONEncoder().default, option=ORJSON_OPTIONS)
+        # Like DRF, escape the line separators that are not valid in JavaScript strings.
+        return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
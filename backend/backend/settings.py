@@ -48,6 +48,7 @@ EMAIL_PORT: int = int(os.environ.get("DJANGO_EMAIL_PORT", 587))
 EMAIL_USE_TLS: bool = os.environ.get("DJANGO_EMAIL_USE_TLS", "True") == "True"
 EMAIL_HOST_USER: str | None = os.environ.get("DJANGO_EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD: str | None = os.environ.get("DJANGO_EMAIL_HOST_PASSWORD")
+DEFAULT_FROM_EMAIL: str = os.environ.get("DJANGO_DEFAULT_FROM_EMAIL", "noreply@yourdomain.com")
 
 
 INSTALLED_APPS: list[str] = [
@@ -58,6 +59,7 @@ INSTALLED_APPS: list[str] = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework_simplejwt",
     "drf_spectacular",
@@ -99,7 +101,27 @@ TEMPLATES: list[dict[str, Any]] = [
 WSGI_APPLICATION: str = "backend.wsgi.application"
 
 
-DATABASES: dict[str, dict[str, str | None]] = {
+# Interface the application is served through by startup.sh: "asgi" (uvicorn) or "wsgi".
+SERVER_INTERFACE: str = os.environ.get("DJANGO_SERVER_INTERFACE", "asgi")
+
+# Number of worker processes started by startup.sh in production (the development server
+# runs one).
+SERVER_WORKERS: int = 1 if DEBUG else int(os.environ.get("DJANGO_SERVER_WORKERS", "4"))
+
+# Per-worker psycopg connection pool (enabled by default under ASGI, where connections
+# are not reused across requests). Persistent connections are used otherwise.
+DATABASE_POOL: bool = (
+    os.environ.get("DJANGO_DATABASE_POOL", str(SERVER_INTERFACE == "asgi")) == "True"
+)
+DATABASE_OPTIONS: dict[str, Any] = {}
+if DATABASE_POOL:
+    DATABASE_OPTIONS["pool"] = {
+        "min_size": int(os.environ.get("DJANGO_DATABASE_POOL_MIN_SIZE", 2)),
+        "max_size": int(os.environ.get("DJANGO_DATABASE_POOL_MAX_SIZE", 10)),
+        "timeout": float(os.environ.get("DJANGO_DATABASE_POOL_TIMEOUT", 10)),
+    }
+
+DATABASES: dict[str, dict[str, Any]] = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
         "NAME": os.environ.get("DJANGO_DATABASE_NAME"),
@@ -107,6 +129,13 @@ DATABASES: dict[str, dict[str, str | None]] = {
         "PASSWORD": os.environ.get("DJANGO_DATABASE_PASSWORD"),
         "HOST": os.environ.get("DJANGO_DATABASE_HOST"),
         "PORT": os.environ.get("DJANGO_DATABASE_PORT"),
+        "CONN_MAX_AGE": (
+            0 if DATABASE_POOL else int(os.environ.get("DJANGO_DATABASE_CONN_MAX_AGE", 60))
+        ),
+        "CONN_HEALTH_CHECKS": (
+            os.environ.get("DJANGO_DATABASE_CONN_HEALTH_CHECKS", "True") == "True"
+        ),
+        "OPTIONS": DATABASE_OPTIONS,
     }
 }
 
@@ -125,11 +154,45 @@ AUTH_PASSWORD_VALIDATORS: list[dict[str, str]] = [
     },
 ]
 
+# Cache shared by all workers of a host ("file") or all hosts ("redis", needs the `redis`
+# extra). "locmem" is a per-process stand-in for tests. The request throttles are only
+# exact on "redis": the `backend.W001` system check warns about the others in production.
+CACHE_BACKENDS: dict[str, str] = {
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+}
+CACHE_BACKEND: str = os.environ.get("DJANGO_CACHE_BACKEND", "file")
+
+CACHES: dict[str, dict[str, Any]] = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": os.environ.get("DJANGO_CACHE_LOCATION", "/var/tmp/django_cache"),
+        "OPTIONS": (
+            {}
+            if CACHE_BACKEND == "redis"
+            else {"MAX_ENTRIES": int(os.environ.get("DJANGO_CACHE_MAX_ENTRIES", 10000))}
+        ),
+    }
+}
+
+# JSON renderer of the API: "orjson" (falls back to the stdlib when the `orjson` extra is
+# not installed) or "stdlib" (DRF's default renderer).
+JSON_RENDERERS: dict[str, str] = {
+    "orjson": "backend.renderers.FastJSONRenderer",
+    "stdlib": "rest_framework.renderers.JSONRenderer",
+}
+JSON_RENDERER: str = os.environ.get("DJANGO_JSON_RENDERER", "orjson")
+
 REST_FRAMEWORK: dict[str, Any] = {
+    "DEFAULT_RENDERER_CLASSES": [
+        JSON_RENDERERS[JSON_RENDERER],
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": ("users.authenticate.CustomCookiesAuthentication",),
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "backend.throttling.AnonSlidingWindowThrottle",
+        "backend.throttling.UserSlidingWindowThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": "1000/day",
@@ -148,6 +211,34 @@ REST_FRAMEWORK: dict[str, Any] = {
     ],
 }
 
+# Compatibility flag: respond with 404 instead of an empty page when a user has no boards.
+TODOS_EMPTY_BOARD_LIST_404: bool = (
+    os.environ.get("DJANGO_TODOS_EMPTY_BOARD_LIST_404", "False") == "True"
+)
+
+# Keep per-status task counters denormalized on Board instead of counting tasks on read.
+TODOS_BOARD_TASK_COUNTERS: bool = (
+    os.environ.get("DJANGO_TODOS_BOARD_TASK_COUNTERS", "False") == "True"
+)
+
+# Serve the board and task read endpoints with async handlers (enabled by default under ASGI).
+TODOS_ASYNC_VIEWS: bool = (
+    os.environ.get("DJANGO_TODOS_ASYNC_VIEWS", str(SERVER_INTERFACE == "asgi")) == "True"
+)
+
+# Delta sync (`?since=`): maximum number of rows per response, and the window before the
+# current time that is returned again by the next request, for writes still committing.
+TODOS_SYNC_MAX_ROWS: int = int(os.environ.get("DJANGO_TODOS_SYNC_MAX_ROWS", "1000"))
+TODOS_SYNC_OVERLAP_SECONDS: int = int(os.environ.get("DJANGO_TODOS_SYNC_OVERLAP_SECONDS", "5"))
+
+# Real-time board events over WebSocket: "local" (in-process, reaches the connections of the
+# same worker only, so it is rejected by a system check with more than one `SERVER_WORKERS`),
+# "redis" (pub/sub shared by all workers and nodes) or "none".
+TODOS_REALTIME_BROKER: str = os.environ.get("DJANGO_TODOS_REALTIME_BROKER", "local")
+TODOS_REALTIME_REDIS_URL: str = os.environ.get(
+    "DJANGO_TODOS_REALTIME_REDIS_URL", "redis://redis:6379/1"
+)
+
 SIMPLE_JWT: dict[str, Any] = {
     "ACCESS_TOKEN_NAME": "access_token",
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=5),
@@ -162,6 +253,16 @@ SIMPLE_JWT: dict[str, Any] = {
     "AUTH_COOKIE_SAMESITE": "Lax",
 }
 
+# Cache of the users resolved during authentication: "local", "django" or "none".
+USERS_AUTH_CACHE_BACKEND: str = os.environ.get("DJANGO_USERS_AUTH_CACHE_BACKEND", "local")
+USERS_AUTH_CACHE_ALIAS: str = os.environ.get("DJANGO_USERS_AUTH_CACHE_ALIAS", "default")
+USERS_AUTH_CACHE_TTL: int = int(os.environ.get("DJANGO_USERS_AUTH_CACHE_TTL", 30))
+USERS_AUTH_CACHE_MAX_SIZE: int = int(os.environ.get("DJANGO_USERS_AUTH_CACHE_MAX_SIZE", 10000))
+# Per-process cache of validated access tokens, kept until they expire (0 disables).
+USERS_AUTH_TOKEN_CACHE_MAX_SIZE: int = int(
+    os.environ.get("DJANGO_USERS_AUTH_TOKEN_CACHE_MAX_SIZE", 10000)
+)
+
 CORS_ALLOW_CREDENTIALS: bool = True
 
 LANGUAGE_CODE: str = "en-us"
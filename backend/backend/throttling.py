@@ -0,0 +1,142 @@
+"""
+Request throttles of the backend project.
+
+DRF's rate throttles store the timestamp of every request of a client within the
+rate duration, so with a rate of 10000/day a single client may hold a list of ten
+thousand floats in the cache. The throttles of this module approximate a sliding
+window with two fixed windows instead, storing only the index of the current
+window and the request counts of the current and previous one per client:
+
+    estimated = previous_count * (1 - elapsed_in_window / duration) + current_count
+
+The counts are read and written with a cache get and set, which only a shared cache
+makes exact across workers: `check_throttle_cache` warns about the others.
+
+Classes:
+    SlidingWindowThrottleMixin: Sliding window counter for `SimpleRateThrottle` subclasses.
+    AnonSlidingWindowThrottle: Limits the rate of anonymous requests per IP address.
+    UserSlidingWindowThrottle: Limits the rate of authenticated requests per user.
+
+Functions:
+    check_throttle_cache: Warn when the throttles run on a cache that is not shared.
+
+Example:
+    from backend.throttling import UserSlidingWindowThrottle
+"""
+
+from typing import Any
+
+from django.conf import settings
+from django.core import checks
+from rest_framework.request import Request
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+
+WindowState = tuple[int, int, int]
+
+UNSHARED_CACHE_BACKENDS: dict[str, str] = {
+    "django.core.cache.backends.filebased.FileBasedCache": (
+        "its get and set are not atomic, so concurrent requests of a client lose counts"
+    ),
+    "django.core.cache.backends.locmem.LocMemCache": (
+        "it is per process, so every worker counts the requests of a client separately"
+    ),
+}
+
+
+class SlidingWindowThrottleMixin:
+    """Sliding window counter for `SimpleRateThrottle` subclasses.
+
+    Methods:
+        allow_request: Checks the estimated number of requests in the sliding window.
+        wait: Returns the number of seconds until the next request is allowed.
+    """
+
+    def allow_request(self, request: Request, view: Any) -> bool:
+        """Check whether the estimated number of requests in the window is below the rate.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            view (APIView): The view handling the request.
+
+        Returns:
+            bool: True if the request is allowed, False if it is throttled.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        duration: int = self.duration
+        self.now = self.timer()
+        window: int = int(self.now // duration)
+        elapsed: float = self.now - window * duration
+
+        current, previous = self._counts(self.cache.get(self.key), window)
+        estimated: float = previous * (1 - elapsed / duration) + current
+
+        if estimated >= self.num_requests:
+            self._wait = self._wait_time(current, previous, elapsed)
+            return self.throttle_failure()
+
+        self.cache.set(self.key, (window, current + 1, previous), 2 * duration)
+        return True
+
+    def wait(self) -> float | None:
+        """Return the number of seconds until the next request is allowed.
+
+        Returns:
+            float | None: The recommended waiting time.
+        """
+        return getattr(self, "_wait", None)
+
+    @staticmethod
+    def _counts(state: WindowState | None, window: int) -> tuple[int, int]:
+        """Return the request counts of the current and previous window."""
+        if state is None:
+            return 0, 0
+        stored_window, current, previous = state
+        if stored_window == window:
+            return current, previous
+        if stored_window == window - 1:
+            return 0, current
+        return 0, 0
+
+    def _wait_time(self, current: int, previous: int, elapsed: float) -> float:
+        """Return the seconds until the estimated number of requests drops below the rate."""
+        duration: int = self.duration
+        if current >= self.num_requests:
+            return duration - elapsed + duration * (1 - self.num_requests / current)
+        return max(duration * (1 - (self.num_requests - current) / previous) - elapsed, 0.0)
+
+
+class AnonSlidingWindowThrottle(SlidingWindowThrottleMixin, AnonRateThrottle):
+    """Limits the rate of anonymous requests per IP address (scope "anon")."""
+
+
+class UserSlidingWindowThrottle(SlidingWindowThrottleMixin, UserRateThrottle):
+    """Limits the rate of requests per user, or per IP address if anonymous (scope "user")."""
+
+
+def check_throttle_cache(
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> list[checks.CheckMessage]:
+    """Warn when the throttles run on the file or local memory cache in production.
+
+    Returns:
+        list[checks.CheckMessage]: A warning if the default cache is not shared by the workers.
+    """
+    backend: str = settings.CACHES["default"]["BACKEND"]
+    throttles: list[str] = settings.REST_FRAMEWORK.get("DEFAULT_THROTTLE_CLASSES", [])
+    if settings.DEBUG or not throttles or backend not in UNSHARED_CACHE_BACKENDS:
+        return []
+    return [
+        checks.Warning(
+            f"The request throttles use the {backend} cache, but "
+            f"{UNSHARED_CACHE_BACKENDS[backend]}.",
+            hint='Set DJANGO_CACHE_BACKEND to "redis" to enforce the rates exactly.',
+            id="backend.W001",
+        )
+    ]
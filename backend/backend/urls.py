@@ -32,6 +32,8 @@ from drf_spectacular.views import (
 )
 from users.views import CookieTokenRefreshViewV1
 
+from backend.views import DatabasePoolMetricsView
+
 api_urls_v1: URLPattern = [
     path("api/", include(("users.urls", "users"), namespace="users_v1")),
     path("api/", include(("todos.urls", "todos"), namespace="todos_v1")),
@@ -59,5 +61,6 @@ urlpatterns: list[Union[URLPattern, URLResolver]] = [
     *api_urls_v1,
     *documentation_urls_v1,
     path("api/v1/token/refresh/", CookieTokenRefreshViewV1.as_view(), name="token_refresh"),
+    path("api/v1/metrics/db-pool/", DatabasePoolMetricsView.as_view(), name="db_pool_metrics"),
     path("admin/", admin.site.urls, name="admin_site"),
 ]
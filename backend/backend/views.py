@@ -0,0 +1,69 @@
+"""
+Operational views of the backend project.
+
+Classes:
+    DatabasePoolMetricsView: Returns the connection pool metrics of the current worker.
+
+Example:
+    from backend.views import DatabasePoolMetricsView
+"""
+
+import os
+from typing import Any, List, Type
+
+from django.db import connections
+from rest_framework import status
+from rest_framework.permissions import BasePermission, IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class DatabasePoolMetricsView(APIView):
+    """Return the connection pool metrics of the worker serving the request.
+
+    Every worker process has its own pool, so the response carries the process id
+    and repeated requests sample the workers one by one. Databases without a pool
+    are reported with `"pool": false`.
+
+    Attributes:
+        permission_classes (list[BasePermission]): List of permission classes
+                                                   required to access the endpoint.
+
+    Methods:
+        get: Returns the pool metrics of every configured database.
+    """
+
+    permission_classes: List[Type[BasePermission]] = [IsAdminUser]
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        """Return the pool metrics of every configured database.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Returns:
+            Response: A Response object containing the metrics keyed by database alias.
+        """
+        databases: dict[str, dict[str, Any]] = {}
+
+        for alias in connections:
+            pool: Any = getattr(connections[alias], "pool", None)
+            if pool is None:
+                databases[alias] = {"pool": False}
+                continue
+
+            stats: dict[str, int] = pool.get_stats()
+            databases[alias] = {
+                "pool": True,
+                "checked_out": stats.get("pool_size", 0) - stats.get("pool_available", 0),
+                "available": stats.get("pool_available", 0),
+                "waiting": stats.get("requests_waiting", 0),
+                "created": stats.get("connections_num", 0),
+                "size": stats.get("pool_size", 0),
+                "min_size": stats.get("pool_min", 0),
+                "max_size": stats.get("pool_max", 0),
+                "timeouts": stats.get("requests_errors", 0),
+            }
+
+        return Response({"pid": os.getpid(), "databases": databases}, status=status.HTTP_200_OK)
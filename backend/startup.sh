@@ -14,10 +14,21 @@ poetry run python manage.py createadmin
 echo "[ALERT] Collect static files..."
 poetry run python manage.py collectstatic --noinput
 
+SERVER_INTERFACE="${DJANGO_SERVER_INTERFACE:-asgi}"
+
+if [ "$SERVER_INTERFACE" = "asgi" ]; then
+  APPLICATION="backend.asgi:application"
+  WORKER_CLASS="uvicorn_worker.UvicornWorker"
+else
+  APPLICATION="backend.wsgi:application"
+  WORKER_CLASS="sync"
+fi
+
 if [ "$DJANGO_PRODUCTION" = "True" ]; then
-  echo "Running production server"
-  poetry run gunicorn backend.wsgi:application --bind 0.0.0.0:8000 --workers 4 --log-level info
+  SERVER_WORKERS="${DJANGO_SERVER_WORKERS:-4}"
+  echo "Running production server ($SERVER_INTERFACE)"
+  poetry run gunicorn "$APPLICATION" --worker-class "$WORKER_CLASS" --bind 0.0.0.0:8000 --workers "$SERVER_WORKERS" --log-level info
 else
-  echo "Running developing server"
-  poetry run gunicorn backend.wsgi:application --bind 0.0.0.0:8000 --reload --log-level info
+  echo "Running developing server ($SERVER_INTERFACE)"
+  poetry run gunicorn "$APPLICATION" --worker-class "$WORKER_CLASS" --bind 0.0.0.0:8000 --reload --log-level info
 fi
@@ -5,6 +5,7 @@ This file defines the application configuration for the Todos app.
 """
 
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class TodosConfig(AppConfig):
@@ -12,3 +13,16 @@ class TodosConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "todos"
+
+    def ready(self) -> None:
+        """Register the system checks and the signal handlers of the Todos application.
+
+        The signal handlers only maintain the denormalized board task counters, so they are
+        connected only when that mode is enabled. Without receivers, Django can delete
+        tasks with a single DELETE statement instead of loading every row first.
+        """
+        # pylint: disable=import-outside-toplevel,unused-import
+        from todos import checks  # noqa: F401
+
+        if settings.TODOS_BOARD_TASK_COUNTERS:
+            from todos import signals  # noqa: F401
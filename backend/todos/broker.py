@@ -0,0 +1,216 @@
+"""
+Broker of the real-time board events.
+
+Writes to the tasks of a board publish small diff events on the channel of the board,
+which the WebSocket connections of that board (see `todos.websocket`) forward to
+their clients. The broker is selected by the `TODOS_REALTIME_BROKER` setting:
+- "local": an in-process broker. Events only reach the connections served by the
+  same worker process, so it is for a single worker only, and a system check (see
+  `todos.checks`) fails the startup when more `SERVER_WORKERS` are configured.
+- "redis": Redis pub/sub at `TODOS_REALTIME_REDIS_URL` (needs the `redis` extra),
+  shared by all workers and nodes.
+Any other value disables the real-time events.
+
+Every event is a JSON object with the `event` ("created", "updated" or "deleted")
+and the `tasks` it applies to; deleted tasks only carry their `id`. Archiving and
+restoring a board publish the "archived" and "unarchived" board events without
+tasks, after which clients reload the board.
+
+Classes:
+    InProcessBroker: Thread-safe broker delivering events within the current process.
+    RedisBroker: Broker delivering events through Redis pub/sub.
+
+Functions:
+    get_broker: Return the broker configured in the settings.
+    board_channel: Return the channel name of a board.
+    publish_board_event: Publish an event to the subscribers of a board on commit.
+
+Example:
+    from todos.broker import publish_board_event
+"""
+
+import asyncio
+import json
+import threading
+from functools import lru_cache
+from typing import Any, AsyncIterator
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework.utils.encoders import JSONEncoder
+
+Message = dict[str, Any]
+
+BOARD_EVENTS: tuple[str, ...] = ("archived", "unarchived")
+
+
+class InProcessBroker:
+    """Thread-safe broker delivering events within the current process.
+
+    Views publish from the threads of the worker while subscribers wait on its event
+    loop, so every subscriber is a bounded queue fed with `call_soon_threadsafe`.
+    Events are dropped for a subscriber whose queue is full.
+
+    Attributes:
+        queue_size (int): Maximum number of pending events per subscriber.
+
+    Methods:
+        publish: Deliver a message to the subscribers of a channel.
+        subscribe: Yield the messages published on a channel.
+    """
+
+    def __init__(self, queue_size: int = 100) -> None:
+        """Initialize a broker without subscribers.
+
+        Args:
+            queue_size (int): Maximum number of pending events per subscriber.
+        """
+        self.queue_size: int = queue_size
+        self._subscribers: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def publish(self, channel: str, message: Message) -> None:
+        """Deliver a message to the subscribers of a channel.
+
+        Args:
+            channel (str): The channel name.
+            message (Message): The JSON serializable message.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._put, queue, message)
+            except RuntimeError:
+                # The loop of the subscriber is already closed.
+                continue
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, message: Message) -> None:
+        """Queue the message, dropping it if the subscriber falls behind."""
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            pass
+
+    async def subscribe(self, channel: str) -> AsyncIterator[Message]:
+        """Yield the messages published on a channel until the iteration is closed.
+
+        Args:
+            channel (str): The channel name.
+
+        Yields:
+            Message: The published messages.
+        """
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(self.queue_size))
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscriber)
+        try:
+            while True:
+                yield await subscriber[1].get()
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(channel, set())
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    self._subscribers.pop(channel, None)
+
+
+class RedisBroker:
+    """Broker delivering events through Redis pub/sub.
+
+    Attributes:
+        url (str): The URL of the Redis server.
+
+    Methods:
+        publish: Publish a message on a channel.
+        subscribe: Yield the messages published on a channel.
+    """
+
+    def __init__(self, url: str) -> None:
+        """Initialize the broker, connecting lazily.
+
+        Args:
+            url (str): The URL of the Redis server.
+        """
+        import redis  # pylint: disable=import-outside-toplevel
+
+        self.url: str = url
+        self._client = redis.Redis.from_url(url)
+
+    def publish(self, channel: str, message: Message) -> None:
+        """Publish a message on a channel.
+
+        Args:
+            channel (str): The channel name.
+            message (Message): The JSON serializable message.
+        """
+        self._client.publish(channel, json.dumps(message, cls=JSONEncoder))
+
+    async def subscribe(self, channel: str) -> AsyncIterator[Message]:
+        """Yield the messages published on a channel until the iteration is closed.
+
+        Args:
+            channel (str): The channel name.
+
+        Yields:
+            Message: The published messages.
+        """
+        from redis import asyncio as aioredis  # pylint: disable=import-outside-toplevel
+
+        client = aioredis.Redis.from_url(self.url)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                yield json.loads(message["data"])
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+            await client.aclose()
+
+
+@lru_cache(maxsize=None)
+def get_broker() -> InProcessBroker | RedisBroker | None:
+    """Return the broker configured in the settings.
+
+    Returns:
+        InProcessBroker | RedisBroker | None: The broker, or None if disabled.
+    """
+    backend: str = settings.TODOS_REALTIME_BROKER
+    if backend == "local":
+        return InProcessBroker()
+    if backend == "redis":
+        return RedisBroker(settings.TODOS_REALTIME_REDIS_URL)
+    return None
+
+
+def board_channel(board_id: UUID | str) -> str:
+    """Return the channel name of a board.
+
+    Args:
+        board_id (UUID | str): The id of the board.
+
+    Returns:
+        str: The channel name.
+    """
+    return f"todos.board.{board_id}"
+
+
+def publish_board_event(board_id: UUID | str, event: str, tasks: list[Message]) -> None:
+    """Publish an event to the subscribers of a board once the transaction commits.
+
+    Args:
+        board_id (UUID | str): The id of the board.
+        event (str): "created", "updated" or "deleted", or the board event "archived"
+                     or "unarchived".
+        tasks (list[Message]): The serialized tasks, or their ids for "deleted", empty
+                               for the board events.
+    """
+    broker: InProcessBroker | RedisBroker | None = get_broker()
+    if broker is None or not (tasks or event in BOARD_EVENTS):
+        return
+
+    message: Message = {"event": event, "tasks": tasks}
+    transaction.on_commit(lambda: broker.publish(board_channel(board_id), message))
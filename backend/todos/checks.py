@@ -0,0 +1,36 @@
+"""
+System checks of the Todos application settings.
+
+The checks run on every management command, including the `migrate` run by
+startup.sh, so a deployment that would silently lose data fails to start instead.
+
+Functions:
+    check_realtime_broker: Reject the in-process broker when several workers serve the app.
+"""
+
+from typing import Any
+
+from django.conf import settings
+from django.core.checks import CheckMessage, Error, register
+
+
+@register()
+def check_realtime_broker(**kwargs: Any) -> list[CheckMessage]:  # pylint: disable=unused-argument
+    """Reject the in-process real-time broker when several workers serve the app.
+
+    The "local" broker only delivers an event to the WebSocket connections of the worker
+    that handled the write, so with more workers most clients miss most events.
+
+    Returns:
+        list[CheckMessage]: An error if the "local" broker is used with several workers.
+    """
+    if settings.TODOS_REALTIME_BROKER != "local" or settings.SERVER_WORKERS <= 1:
+        return []
+    return [
+        Error(
+            f'The "local" real-time broker only reaches the connections of one worker, '
+            f"but {settings.SERVER_WORKERS} workers are configured.",
+            hint='Set DJANGO_TODOS_REALTIME_BROKER to "redis", or DJANGO_SERVER_WORKERS to 1.',
+            id="todos.E001",
+        )
+    ]
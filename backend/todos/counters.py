@@ -0,0 +1,190 @@
+"""
+Per-status task counters of boards.
+
+This module computes how many non-archived tasks of each status a board holds. The
+counts are either aggregated on read in one grouped query, or, when the
+`TODOS_BOARD_TASK_COUNTERS` setting is enabled, read from the denormalized counter
+columns of `Board` which are kept up to date on task save and delete.
+
+A counter change is computed from the values a task was loaded with. The task API
+locks the row while updating or deleting it, and status moves are conditional
+UPDATEs, so their changes are exact. Other writes computing from a stale instance,
+e.g. the admin or a shell saving a task changed concurrently, can make the counters
+drift: `manage.py recountboards` is the remedy, and should be run periodically when
+such writers exist.
+
+Functions:
+    annotate_task_counts: Annotate a board queryset with the per-status task counts.
+    get_task_counts: Return the per-status task counts of an annotated board.
+    refresh_task_counters: Recompute the denormalized counters of the given boards.
+    track_task_counters: Update the denormalized counters after a task was saved or deleted.
+    track_task_move: Update the denormalized counters after a task changed its status.
+
+Example:
+    from todos.counters import annotate_task_counts
+"""
+
+from typing import Any, Iterable
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import Count, F, OuterRef, Q, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce
+from todos.models import Board, Task
+from todos.models.task import StatusChoices
+
+TASK_COUNTER_FIELDS: dict[str, str] = {
+    StatusChoices.TODO: "todo_count",
+    StatusChoices.IN_PROGRESS: "in_progress_count",
+    StatusChoices.DONE: "done_count",
+}
+
+CounterKey = tuple[UUID, str] | None
+
+
+def _annotation_name(field: str) -> str:
+    """Return the name of the annotation holding the value of a counter field."""
+    return f"total_{field}"
+
+
+def annotate_task_counts(queryset: QuerySet[Board]) -> QuerySet[Board]:
+    """Annotate a board queryset with the per-status task counts.
+
+    Args:
+        queryset (QuerySet[Board]): The queryset of boards to annotate.
+
+    Returns:
+        QuerySet[Board]: The queryset annotated with one `total_<status>_count` per status.
+    """
+    if settings.TODOS_BOARD_TASK_COUNTERS:
+        return queryset.annotate(
+            **{_annotation_name(field): F(field) for field in TASK_COUNTER_FIELDS.values()}
+        )
+
+    return queryset.annotate(
+        **{
+            _annotation_name(field): Count(
+                "boards", filter=Q(boards__status=task_status, boards__is_archived=False)
+            )
+            for task_status, field in TASK_COUNTER_FIELDS.items()
+        }
+    )
+
+
+def get_task_counts(board: Board) -> dict[str, int]:
+    """Return the per-status task counts of a board annotated by `annotate_task_counts`.
+
+    Args:
+        board (Board): The annotated board instance.
+
+    Returns:
+        dict[str, int]: Number of tasks keyed by task status.
+    """
+    return {
+        task_status: getattr(board, _annotation_name(field))
+        for task_status, field in TASK_COUNTER_FIELDS.items()
+    }
+
+
+def refresh_task_counters(board_ids: Iterable[UUID] | None = None) -> int:
+    """Recompute the denormalized counters of the given boards in one UPDATE.
+
+    Args:
+        board_ids (Iterable[UUID] | None): Boards to refresh, or None for all boards.
+
+    Returns:
+        int: Number of refreshed boards.
+    """
+    boards: QuerySet[Board] = Board.objects.all()
+    if board_ids is not None:
+        boards = boards.filter(pk__in=list(board_ids))
+
+    return boards.update(
+        **{
+            field: Coalesce(
+                Subquery(
+                    Task.objects.filter(board=OuterRef("pk"), status=task_status, is_archived=False)
+                    .order_by()
+                    .values("board")
+                    .annotate(total=Count("pk"))
+                    .values("total")
+                ),
+                Value(0),
+            )
+            for task_status, field in TASK_COUNTER_FIELDS.items()
+        }
+    )
+
+
+def _counter_key(values: dict[str, Any]) -> CounterKey:
+    """Return the board and status under which a task is counted, if any."""
+    if values["is_archived"]:
+        return None
+    return values["board_id"], values["status"]
+
+
+def _current_values(task: Task) -> dict[str, Any]:
+    """Return the counter related values of a task instance."""
+    return {"board_id": task.board_id, "status": task.status, "is_archived": task.is_archived}
+
+
+def _change_counter(key: CounterKey, delta: int) -> None:
+    """Add `delta` to the counter identified by `key`."""
+    if key is None or key[1] not in TASK_COUNTER_FIELDS:
+        return
+    field: str = TASK_COUNTER_FIELDS[key[1]]
+    Board.objects.filter(pk=key[0]).update(**{field: F(field) + delta})
+
+
+def track_task_counters(task: Task, created: bool = False, deleted: bool = False) -> None:
+    """Update the denormalized counters after a task was saved or deleted.
+
+    The previous state of the task is taken from the values it was loaded with, which
+    is only exact if the row was locked since, see the module docstring. When that
+    state is unknown, e.g. the task was loaded with deferred counter fields, the
+    affected board is recounted instead.
+
+    Args:
+        task (Task): The saved or deleted task.
+        created (bool): Whether the task was just inserted.
+        deleted (bool): Whether the task was just deleted.
+    """
+    if not settings.TODOS_BOARD_TASK_COUNTERS:
+        return
+
+    current: dict[str, Any] = _current_values(task)
+    loaded: dict[str, Any] | None = getattr(task, "_loaded_values", None)
+
+    if created:
+        old_key: CounterKey = None
+    elif loaded is not None and all(name in loaded for name in current):
+        old_key = _counter_key(loaded)
+    else:
+        refresh_task_counters([task.board_id])
+        task._loaded_values = current  # pylint: disable=protected-access
+        return
+
+    new_key: CounterKey = None if deleted else _counter_key(current)
+
+    if old_key != new_key:
+        _change_counter(old_key, -1)
+        _change_counter(new_key, 1)
+
+    task._loaded_values = current  # pylint: disable=protected-access
+
+
+def track_task_move(board_id: UUID, previous_status: str, status: str) -> None:
+    """Update the denormalized counters after a task changed its status.
+
+    Used by writes that bypass the model signals, e.g. the conditional UPDATE of a
+    status transition.
+
+    Args:
+        board_id (UUID): The board of the task.
+        previous_status (str): The status the task had before the change.
+        status (str): The new status of the task.
+    """
+    if not settings.TODOS_BOARD_TASK_COUNTERS or previous_status == status:
+        return
+    _change_counter((board_id, previous_status), -1)
+    _change_counter((board_id, status), 1)
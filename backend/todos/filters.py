@@ -0,0 +1,229 @@
+"""
+Query parameter filtering and ordering of task lists.
+
+The task list accepts the query parameters below, which are translated into a
+single SQL statement backed by the partial indexes of the non-archived tasks:
+
+    status=todo,in progress      tasks with one of the statuses
+    completed=true               completed (or, with false, open) tasks
+    created_after=<ISO 8601>     tasks created at or after the date and time
+    created_before=<ISO 8601>    tasks created before the date and time
+    completed_after=<ISO 8601>   tasks completed at or after the date and time
+    completed_before=<ISO 8601>  tasks completed before the date and time
+    ordering=-updated_at         one of the whitelisted fields, descending with `-`
+
+Invalid values are rejected with 400 instead of being ignored.
+
+Classes:
+    TaskFilter: Filter backend of the status, completion and date query parameters.
+    TaskOrderingFilter: Ordering filter of the whitelisted task fields.
+
+Functions:
+    get_datetime_param: Return the date and time of a query parameter, if any.
+
+Example:
+    from todos.filters import TaskFilter, TaskOrderingFilter
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+
+from django.db.models import Model, Q, QuerySet
+from django.utils import timezone as django_timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+from rest_framework.request import Request
+from todos.models.task import StatusChoices
+
+STATUS_QUERY_PARAM: str = "status"
+COMPLETED_QUERY_PARAM: str = "completed"
+DATE_RANGE_QUERY_PARAMS: dict[str, str] = {
+    "created_after": "created_at__gte",
+    "created_before": "created_at__lt",
+    "completed_after": "completed_at__gte",
+    "completed_before": "completed_at__lt",
+}
+BOOLEAN_VALUES: dict[str, bool] = {"true": True, "1": True, "false": False, "0": False}
+
+
+def get_datetime_param(request: Request, name: str) -> datetime | None:
+    """Return the date and time of a query parameter, if any.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        name (str): The name of the query parameter.
+
+    Returns:
+        datetime | None: The aware date and time, UTC if no offset was given,
+                         or None if the parameter was not passed.
+
+    Raises:
+        ValidationError: If the parameter is not an ISO 8601 date and time.
+    """
+    value: str | None = request.query_params.get(name)
+    if value is None:
+        return None
+
+    try:
+        parsed: datetime | None = parse_datetime(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: ["Expected an ISO 8601 date and time."]})
+
+    if django_timezone.is_naive(parsed):
+        parsed = django_timezone.make_aware(parsed, timezone.utc)
+    return parsed
+
+
+class TaskFilter(BaseFilterBackend):
+    """Filter backend of the status, completion and date query parameters.
+
+    Methods:
+        get_filter: Returns the condition of the query parameters of the request.
+        filter_queryset: Returns the tasks matching the query parameters.
+        get_schema_operation_parameters: Returns the OpenAPI description of the parameters.
+    """
+
+    def get_filter(self, request: Request) -> Q:
+        """Return the condition of the query parameters of the request.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Returns:
+            Q: The condition, empty if no filter was passed.
+
+        Raises:
+            ValidationError: If a query parameter has an invalid value.
+        """
+        condition: Q = Q()
+
+        statuses: str | None = request.query_params.get(STATUS_QUERY_PARAM)
+        if statuses is not None:
+            values: list[str] = [value.strip() for value in statuses.split(",")]
+            invalid: list[str] = [value for value in values if value not in StatusChoices.values]
+            if invalid:
+                expected: str = ", ".join(StatusChoices.values)
+                raise ValidationError({STATUS_QUERY_PARAM: [f"Expected one of: {expected}."]})
+            condition &= Q(status__in=values)
+
+        completed: str | None = request.query_params.get(COMPLETED_QUERY_PARAM)
+        if completed is not None:
+            if completed.lower() not in BOOLEAN_VALUES:
+                raise ValidationError({COMPLETED_QUERY_PARAM: ["Expected true or false."]})
+            condition &= Q(completed=BOOLEAN_VALUES[completed.lower()])
+
+        for name, lookup in DATE_RANGE_QUERY_PARAMS.items():
+            bound: datetime | None = get_datetime_param(request, name)
+            if bound is not None:
+                condition &= Q(**{lookup: bound})
+
+        return condition
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet[Model], view: Any
+    ) -> QuerySet[Model]:
+        """Return the tasks matching the query parameters.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            queryset (QuerySet[Model]): The tasks of the list.
+            view (Any): The view of the list.
+
+        Returns:
+            QuerySet[Model]: The filtered tasks.
+        """
+        condition: Q = self.get_filter(request)
+        return queryset.filter(condition) if condition else queryset
+
+    def get_schema_operation_parameters(self, view: Any) -> list[dict[str, Any]]:
+        """Return the OpenAPI description of the query parameters.
+
+        Args:
+            view (Any): The view of the list.
+
+        Returns:
+            list[dict[str, Any]]: The query parameters of the filter.
+        """
+        parameters: list[dict[str, Any]] = [
+            {
+                "name": STATUS_QUERY_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Comma separated statuses of the tasks.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": COMPLETED_QUERY_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Whether the tasks are completed.",
+                "schema": {"type": "boolean"},
+            },
+        ]
+        parameters += [
+            {
+                "name": name,
+                "required": False,
+                "in": "query",
+                "description": f"Tasks with `{lookup.split('__')[0]}` "
+                f"{'at or after' if lookup.endswith('gte') else 'before'} the date and time.",
+                "schema": {"type": "string", "format": "date-time"},
+            }
+            for name, lookup in DATE_RANGE_QUERY_PARAMS.items()
+        ]
+        return parameters
+
+
+class TaskOrderingFilter(OrderingFilter):
+    """Ordering filter of the whitelisted task fields.
+
+    The ordering is completed with `created_at` and `id`, in the direction of the
+    first field, so every row has a unique position for the keyset cursor of
+    `TaskCursorPagination`. Only fields backed by an index of the board tasks are
+    allowed; nullable fields, e.g. `completed_at`, cannot be a cursor position.
+
+    Attributes:
+        ordering_fields (tuple[str, ...]): Fields the tasks may be ordered by.
+        ordering (tuple[str, ...]): Default ordering of the tasks.
+
+    Methods:
+        get_ordering: Returns the requested ordering completed with the tie-breakers.
+    """
+
+    ordering_fields: tuple[str, ...] = ("created_at", "updated_at", "status")
+    ordering: tuple[str, ...] = ("created_at", "id")
+
+    def get_ordering(self, request: Request, queryset: QuerySet[Model], view: Any) -> list[str]:
+        """Return the requested ordering completed with the tie-breakers.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            queryset (QuerySet[Model]): The tasks of the list.
+            view (Any): The view of the list.
+
+        Returns:
+            list[str]: The fields to order by.
+
+        Raises:
+            ValidationError: If an ordering field is not whitelisted.
+        """
+        params: str | None = request.query_params.get(self.ordering_param)
+        if params:
+            requested: list[str] = [param.strip() for param in params.split(",")]
+            invalid: list[str] = [
+                field for field in requested if field.lstrip("-") not in self.ordering_fields
+            ]
+            if invalid:
+                expected: str = ", ".join(self.ordering_fields)
+                raise ValidationError({self.ordering_param: [f"Expected one of: {expected}."]})
+        else:
+            requested = []
+
+        # The tie-breakers follow the direction of the first field, so a descending
+        # order is read backwards from the same index as the ascending one.
+        direction: str = "-" if requested and requested[0].startswith("-") else ""
+        named: set[str] = {field.lstrip("-") for field in requested}
+        return requested + [direction + field for field in self.ordering if field not in named]
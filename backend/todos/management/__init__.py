@@ -0,0 +1 @@
+"""Package containing management commands related to todos in the ToDo app."""
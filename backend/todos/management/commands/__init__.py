@@ -0,0 +1,6 @@
+"""
+Management commands of the todos app.
+
+Commands:
+- recountboards: Recompute the denormalized task counters of all boards.
+"""
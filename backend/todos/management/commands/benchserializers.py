@@ -0,0 +1,114 @@
+"""
+Command to benchmark the serialization of large board and task lists.
+
+This command fills a throwaway board with `--tasks` tasks and a throwaway user with
+`--boards` boards, then times the model serializer path and the `values_list()`
+row path of the list endpoints (fetch, serialize and render to JSON) and checks that
+both produce the same bytes. Everything runs in a transaction rolled back at the
+end, so it is safe to run against any database, e.g.:
+
+    python manage.py benchserializers --tasks 10000 --repeat 5
+"""
+
+import statistics
+import sys
+import time
+from typing import Any, Callable, Type
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import ModelSerializer
+from todos.models import Board, Task
+from todos.serializers import BoardSerializerV1, RowSerializer, TaskSerializerV1
+
+
+class Command(BaseCommand):
+    """Command to benchmark the serialization of large board and task lists."""
+
+    help = "Compare the model serializer and values_list() paths of the list endpoints."
+
+    def add_arguments(self, parser) -> None:
+        """Add the command arguments.
+
+        Args:
+            parser (CommandParser): The parser of the command arguments.
+        """
+        parser.add_argument("--tasks", type=int, default=10000)
+        parser.add_argument("--boards", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def _time(self, render: Callable[[], bytes], repeat: int) -> tuple[float, bytes]:
+        """Return the median duration in seconds of the renders and the rendered bytes."""
+        durations: list[float] = []
+        content: bytes = b""
+        for _ in range(repeat):
+            start: float = time.perf_counter()
+            content = render()
+            durations.append(time.perf_counter() - start)
+        return statistics.median(durations), content
+
+    def _compare(
+        self,
+        label: str,
+        queryset: QuerySet[Model],
+        serializer_class: Type[ModelSerializer],
+        repeat: int,
+    ) -> None:
+        """Time both serialization paths of the queryset and print the results."""
+        renderer: JSONRenderer = JSONRenderer()
+        row_serializer: RowSerializer | None = RowSerializer.for_serializer(serializer_class)
+        if row_serializer is None:
+            sys.stdout.write(f"{label}: {serializer_class.__name__} is not supported \n")
+            return
+
+        model_time, model_content = self._time(
+            lambda: renderer.render(serializer_class(list(queryset), many=True).data), repeat
+        )
+        rows_time, rows_content = self._time(
+            lambda: renderer.render(row_serializer.serialize(list(row_serializer.rows(queryset)))),
+            repeat,
+        )
+
+        sys.stdout.write(
+            f"{label}: serializer {model_time * 1000:.1f} ms, "
+            f"values_list {rows_time * 1000:.1f} ms, "
+            f"{model_time / rows_time:.1f}x faster, "
+            f"identical output: {model_content == rows_content} \n"
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Fill throwaway rows, benchmark both paths and roll everything back."""
+        repeat: int = options["repeat"]
+
+        with transaction.atomic():
+            user: Any = get_user_model().objects.create_user(
+                username="benchserializers", email="benchserializers@example.com"
+            )
+            board: Board = Board.objects.create(title="benchserializers", user_id=user)
+            Board.objects.bulk_create(
+                Board(title=f"Board {index}", user_id=user) for index in range(options["boards"])
+            )
+            Task.objects.bulk_create(
+                (
+                    Task(board=board, title=f"Task {index}", description="Description " * 20)
+                    for index in range(options["tasks"])
+                ),
+                batch_size=1000,
+            )
+
+            self._compare(
+                f"{options['tasks']} tasks",
+                Task.objects.filter(board=board).order_by("created_at", "id"),
+                TaskSerializerV1,
+                repeat,
+            )
+            self._compare(
+                f"{options['boards'] + 1} boards",
+                Board.objects.filter(user_id=user).order_by("created_at", "id"),
+                BoardSerializerV1,
+                repeat,
+            )
+            transaction.set_rollback(True)
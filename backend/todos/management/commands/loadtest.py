@@ -0,0 +1,97 @@
+"""
+Command to load test the read endpoints of running servers.
+
+This command fires concurrent authenticated GET requests at one or more running
+servers and prints the throughput and latency percentiles of each, so the WSGI and
+ASGI serving modes of startup.sh can be compared side by side, e.g.:
+
+    python manage.py loadtest --url http://localhost:8001 --url http://localhost:8000
+"""
+
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+class Command(BaseCommand):
+    """Command to load test the read endpoints of running servers."""
+
+    help = "Fire concurrent GET requests at running servers and print their latency."
+
+    def add_arguments(self, parser) -> None:
+        """Add the command arguments.
+
+        Args:
+            parser (CommandParser): The parser of the command arguments.
+        """
+        parser.add_argument(
+            "--url", action="append", required=True, help="Base URL of a running server."
+        )
+        parser.add_argument("--path", type=str, default="/api/v1/boards/")
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--username", type=str, default=None)
+
+    def _request(self, url: str, cookie: str) -> float | None:
+        """Send one GET request and return its duration in seconds, or None on error."""
+        request: urllib.request.Request = urllib.request.Request(url, headers={"Cookie": cookie})
+        start: float = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:  # nosec B310
+                response.read()
+        except (urllib.error.URLError, TimeoutError):
+            return None
+        return time.perf_counter() - start
+
+    def _run(self, url: str, cookie: str, requests: int, concurrency: int) -> None:
+        """Load test one server and print its results."""
+        self._request(url, cookie)
+
+        start: float = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results: list[float | None] = list(
+                executor.map(lambda _: self._request(url, cookie), range(requests))
+            )
+        elapsed: float = time.perf_counter() - start
+
+        durations: list[float] = sorted(result for result in results if result is not None)
+        errors: int = len(results) - len(durations)
+        if len(durations) < 2:
+            sys.stdout.write(f"{url}: {errors} of {requests} requests failed \n")
+            return
+
+        percentiles: list[float] = statistics.quantiles(durations, n=100)
+        sys.stdout.write(
+            f"{url}: {len(durations) / elapsed:.1f} req/s, "
+            f"p50 {percentiles[49] * 1000:.1f} ms, "
+            f"p95 {percentiles[94] * 1000:.1f} ms, "
+            f"p99 {percentiles[98] * 1000:.1f} ms, "
+            f"{errors} errors \n"
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Load test every given server with the same authenticated requests."""
+        users = get_user_model().objects.filter(is_active=True)
+        if options["username"]:
+            users = users.filter(username=options["username"])
+        user = users.first()
+        if user is None:
+            raise CommandError("An active user is required to run the load test.")
+
+        cookie: str = f"{settings.SIMPLE_JWT['AUTH_COOKIE']}={AccessToken.for_user(user)}"
+
+        for base_url in options["url"]:
+            self._run(
+                f"{base_url.rstrip('/')}{options['path']}",
+                cookie,
+                options["requests"],
+                options["concurrency"],
+            )
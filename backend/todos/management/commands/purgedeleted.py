@@ -0,0 +1,75 @@
+"""
+Command to purge the soft deleted boards and tasks.
+
+Deleting a board or a task through the API only marks it deleted. This command
+removes the rows deleted longer than `--older-than` seconds ago, which leaves
+delta sync clients time to see the tombstones. Rows are deleted in batches of
+`--batch-size`, each in its own short transaction, so purging a large board never
+holds locks for long or writes its whole cascade to the WAL at once. The tasks of
+a deleted board are purged before the board, leaving nothing for the cascade.
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+from todos.models import Board, Task
+
+
+class Command(BaseCommand):
+    """Command to purge the soft deleted boards and tasks."""
+
+    help = "Delete the soft deleted boards and tasks in bounded batches."
+
+    def add_arguments(self, parser) -> None:
+        """Add the command arguments.
+
+        Args:
+            parser (CommandParser): The parser of the command arguments.
+        """
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--older-than", type=int, default=7 * 24 * 3600, help="Grace period in seconds."
+        )
+        parser.add_argument(
+            "--pause", type=float, default=0, help="Seconds to sleep between batches."
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Purge the deleted tasks, the tasks of deleted boards and the deleted boards."""
+        cutoff: datetime = timezone.now() - timedelta(seconds=options["older_than"])
+        batch_size: int = options["batch_size"]
+        pause: float = options["pause"]
+
+        tasks: int = self.purge(Task.objects.filter(deleted_at__lt=cutoff), batch_size, pause)
+        tasks += self.purge(Task.objects.filter(board__deleted_at__lt=cutoff), batch_size, pause)
+        boards: int = self.purge(Board.objects.filter(deleted_at__lt=cutoff), batch_size, pause)
+
+        sys.stdout.write(f"Purged {boards} boards and {tasks} tasks. \n")
+
+    def purge(self, queryset: QuerySet[Model], batch_size: int, pause: float) -> int:
+        """Delete the rows of the queryset in batches, one transaction per batch.
+
+        Args:
+            queryset (QuerySet[Model]): The rows to delete.
+            batch_size (int): Maximum number of rows deleted per transaction.
+            pause (float): Seconds to sleep between batches.
+
+        Returns:
+            int: Number of deleted rows.
+        """
+        purged: int = 0
+        while True:
+            with transaction.atomic():
+                ids: list = list(queryset.values_list("pk", flat=True)[:batch_size])
+                if not ids:
+                    return purged
+                queryset.model.objects.filter(pk__in=ids).delete()
+            purged += len(ids)
+
+            if pause:
+                time.sleep(pause)
@@ -0,0 +1,23 @@
+"""
+Command to recompute the denormalized task counters of all boards.
+
+The counters are maintained on task save and delete only while the
+`TODOS_BOARD_TASK_COUNTERS` setting is enabled, so this command has to be run
+once after enabling it, or after bulk writes that bypass model signals.
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand
+from todos.counters import refresh_task_counters
+
+
+class Command(BaseCommand):
+    """Command to recompute the denormalized task counters of all boards."""
+
+    help = "Recompute the denormalized per-status task counters of all boards."
+
+    def handle(self, *args, **options) -> None:
+        """Recompute the denormalized task counters of all boards."""
+        refreshed: int = refresh_task_counters()
+        sys.stdout.write(f"Refreshed task counters of {refreshed} boards. \n")
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0003_alter_task_board"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["board", "is_archived", "created_at", "id"],
+                name="task_board_arch_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0004_task_task_board_arch_created_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(
+                fields=["user_id", "is_archived", "created_at", "id"],
+                name="board_user_arch_created_idx",
+            ),
+        ),
+    ]
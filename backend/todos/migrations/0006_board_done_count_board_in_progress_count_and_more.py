@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0005_board_board_user_arch_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="board",
+            name="done_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="board",
+            name="in_progress_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="board",
+            name="todo_count",
+            field=models.IntegerField(default=0),
+        ),
+    ]
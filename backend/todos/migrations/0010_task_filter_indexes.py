@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0009_full_text_search"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_board_arch_created_idx",
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_archived", False)),
+                fields=["board", "created_at", "id"],
+                name="task_board_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_archived", False)),
+                fields=["board", "status", "created_at", "id"],
+                name="task_board_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_archived", False)),
+                fields=["board", "completed", "completed_at"],
+                name="task_board_completed_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:21
+
+from django.db import migrations, models
+
+
+def flag_tasks_of_archived_boards(apps, schema_editor):
+    """Flag the tasks of the boards archived before the flag existed.
+
+    They were restored together with their board, so restoring the board keeps
+    restoring them.
+    """
+    Task = apps.get_model("todos", "Task")
+    Task.objects.filter(
+        board__is_archived=True,
+        board__deleted_at__isnull=True,
+        is_archived=True,
+        deleted_at__isnull=True,
+    ).update(archived_with_board=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0010_task_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="archived_with_board",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(flag_tasks_of_archived_boards, migrations.RunPython.noop),
+    ]
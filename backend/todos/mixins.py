@@ -0,0 +1,515 @@
+"""
+Viewset mixins for the todos app.
+
+This module provides a mixin serving the read endpoints of a viewset with async
+handlers, so under ASGI a single worker overlaps the database waits of many
+concurrent requests instead of blocking a thread on each of them, a mixin
+answering conditional GET requests of list endpoints with 304 Not Modified, a
+mixin serializing list pages from `values_list()` rows, or streaming whole lists,
+and a mixin returning only the fields requested with `?fields=`.
+
+Classes:
+    AsyncReadMixin: Serve the read actions of a viewset with async handlers.
+    ConditionalListMixin: Validate list responses with ETag and Last-Modified headers.
+    FastListMixin: Serialize list responses from `values_list()` rows, or stream them.
+    SparseFieldsMixin: Return and fetch only the fields requested with `?fields=`.
+
+Example:
+    from todos.mixins import AsyncReadMixin
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Max, Model, QuerySet
+from django.http import HttpRequest, HttpResponseBase, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer, ListSerializer
+from todos.serializers import RowSerializer
+
+FIELDS_QUERY_PARAM: str = "fields"
+
+
+class AsyncReadMixin:
+    """Serve the read actions of a viewset with async handlers.
+
+    When `async_reads` is enabled (`TODOS_ASYNC_VIEWS` by default), the view is
+    dispatched as a coroutine. The action listed in `async_actions` is handled by the
+    viewset's `a<action>` coroutine, e.g. `alist`, while authentication, permissions
+    and the remaining actions keep their sync implementation and run in a thread
+    through `sync_to_async`. When disabled, the viewset behaves exactly as before.
+
+    Attributes:
+        async_reads (bool): Whether the view is dispatched as a coroutine.
+        async_actions (tuple[str, ...]): Actions served by the `a<action>` coroutines.
+
+    Methods:
+        as_view: Returns the view function, marked as a coroutine function if enabled.
+        dispatch: Dispatches the request synchronously or asynchronously.
+        adispatch: Dispatches the request, awaiting the async handler of the action.
+        apaginate_queryset: Returns a single page of results.
+    """
+
+    async_reads: bool = False
+    async_actions: tuple[str, ...] = ("list", "retrieve")
+
+    @classmethod
+    def as_view(cls, actions: dict[str, str] | None = None, **initkwargs) -> Callable[..., Any]:
+        """Return the view function, marked as a coroutine function if enabled.
+
+        Args:
+            actions (dict[str, str] | None): Mapping of HTTP methods to actions.
+            **initkwargs: Attributes set on every viewset instance.
+
+        Returns:
+            Callable[..., Any]: The view function.
+        """
+        initkwargs.setdefault("async_reads", settings.TODOS_ASYNC_VIEWS)
+        view: Callable[..., Any] = super().as_view(actions, **initkwargs)  # type: ignore[misc]
+        if initkwargs["async_reads"]:
+            markcoroutinefunction(view)
+        return view
+
+    def dispatch(self, request: HttpRequest, *args, **kwargs) -> Any:
+        """Dispatch the request, returning a coroutine when async reads are enabled.
+
+        Args:
+            request (HttpRequest): The incoming HTTP request.
+
+        Returns:
+            Any: The response, or a coroutine returning it.
+        """
+        if not self.async_reads:
+            return super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+        return self.adispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request: HttpRequest, *args, **kwargs) -> Response:
+        """Dispatch the request, awaiting the async handler of the action.
+
+        Mirrors `APIView.dispatch`; only the database-bound steps run in a thread.
+
+        Args:
+            request (HttpRequest): The incoming HTTP request.
+
+        Returns:
+            Response: The finalized response.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.args = args
+        self.kwargs = kwargs
+        drf_request: Request = self.initialize_request(request, *args, **kwargs)
+        self.request = drf_request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(drf_request, *args, **kwargs)
+
+            method: str = drf_request.method.lower()
+            handler: Callable[..., Any] = self.http_method_not_allowed
+            if method in self.http_method_names:
+                handler = getattr(self, method, self.http_method_not_allowed)
+
+            async_handler: Callable[..., Awaitable[Response]] | None = None
+            if self.action in self.async_actions:
+                async_handler = getattr(self, f"a{self.action}", None)
+
+            if async_handler is not None and iscoroutinefunction(async_handler):
+                response: Response = await async_handler(drf_request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(drf_request, *args, **kwargs)
+
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(drf_request, response, *args, **kwargs)
+        return self.response
+
+    async def apaginate_queryset(self, queryset: QuerySet[Model]) -> list[Model] | None:
+        """Return a single page of results, or None if pagination is disabled.
+
+        The page query runs in a thread the same way Django's async ORM runs its
+        queries, as DRF paginators only provide a sync interface.
+
+        Args:
+            queryset (QuerySet[Model]): The queryset to paginate.
+
+        Returns:
+            list[Model] | None: The objects of the requested page.
+        """
+        return await sync_to_async(self.paginate_queryset)(queryset)
+
+
+class ConditionalListMixin:
+    """Validate list responses with ETag and Last-Modified headers.
+
+    The version of a list is the latest `updated_at` and the row count of the
+    querysets returned by `get_version_querysets`, so any insert, update or delete
+    changes it. The ETag also covers the user and the full path, e.g. the cursor.
+    A request whose `If-None-Match` matches gets a 304 response before the page is
+    fetched or serialized.
+
+    Pages after the first one are loaded once, on demand, so they are not validated:
+    they would run the aggregate over the whole list for every page.
+
+    Methods:
+        is_validated_list: Returns whether the list of the request is validated.
+        get_version_querysets: Returns the querysets whose rows make up the list.
+        get_list_validators: Returns the ETag and Last-Modified date of the list.
+        aget_list_validators: Returns the ETag and Last-Modified date of the list.
+        get_not_modified_response: Returns a 304 response if the client copy is current.
+        set_list_validators: Adds the ETag and Last-Modified headers to a response.
+    """
+
+    def is_validated_list(self) -> bool:
+        """Return whether the list of the request is validated, i.e. not a cursor page.
+
+        Returns:
+            bool: False for the pages following a cursor, True otherwise.
+        """
+        cursor_param: str | None = getattr(self.paginator, "cursor_query_param", None)
+        return cursor_param is None or cursor_param not in self.request.query_params
+
+    def get_version_querysets(self) -> list[QuerySet[Model]]:
+        """Return the querysets whose rows make up the list.
+
+        Returns:
+            list[QuerySet[Model]]: Querysets of models with an `updated_at` field.
+        """
+        return [self.get_queryset()]
+
+    @staticmethod
+    def _aggregates() -> dict[str, Any]:
+        """Return the aggregates computing the version of a queryset."""
+        return {"last_modified": Max("updated_at"), "count": Count("pk")}
+
+    def _validators(self, versions: list[dict[str, Any]]) -> tuple[str, datetime | None]:
+        """Return the ETag and Last-Modified date from the versions of the querysets."""
+        dates: list[datetime] = [v["last_modified"] for v in versions if v["last_modified"]]
+        last_modified: datetime | None = max(dates) if dates else None
+
+        parts: list[str] = [str(self.request.user.id), self.request.get_full_path()]
+        parts += [f"{v['last_modified']}:{v['count']}" for v in versions]
+        digest: str = hashlib.md5("|".join(parts).encode(), usedforsecurity=False).hexdigest()
+        return quote_etag(digest), last_modified
+
+    def get_list_validators(self) -> tuple[str | None, datetime | None]:
+        """Return the ETag and Last-Modified date of the list.
+
+        Returns:
+            tuple[str | None, datetime | None]: The ETag and the latest `updated_at`,
+                                                both None for a cursor page.
+        """
+        if not self.is_validated_list():
+            return None, None
+        return self._validators(
+            [
+                queryset.order_by().aggregate(**self._aggregates())
+                for queryset in self.get_version_querysets()
+            ]
+        )
+
+    async def aget_list_validators(self) -> tuple[str | None, datetime | None]:
+        """Return the ETag and Last-Modified date of the list using the async ORM.
+
+        Returns:
+            tuple[str | None, datetime | None]: The ETag and the latest `updated_at`,
+                                                both None for a cursor page.
+        """
+        if not self.is_validated_list():
+            return None, None
+        return self._validators(
+            [
+                await queryset.order_by().aaggregate(**self._aggregates())
+                for queryset in self.get_version_querysets()
+            ]
+        )
+
+    def get_not_modified_response(
+        self, etag: str | None, last_modified: datetime | None
+    ) -> HttpResponseBase | None:
+        """Return a 304 response if `If-None-Match` matches the ETag of the list.
+
+        `If-Modified-Since` alone is not honored, as deleting a row does not move
+        the Last-Modified date.
+
+        Args:
+            etag (str | None): The ETag of the list, None if it is not validated.
+            last_modified (datetime | None): The latest `updated_at` of the list.
+
+        Returns:
+            HttpResponseBase | None: The 304 response, or None if the list changed.
+        """
+        if etag is None:
+            return None
+        response: HttpResponseBase | None = get_conditional_response(self.request, etag=etag)
+        if response is not None:
+            self.set_list_validators(response, etag, last_modified)
+        return response
+
+    @staticmethod
+    def set_list_validators(
+        response: HttpResponseBase, etag: str | None, last_modified: datetime | None
+    ) -> HttpResponseBase:
+        """Add the ETag and Last-Modified headers to a response.
+
+        Args:
+            response (HttpResponseBase): The response of the list.
+            etag (str | None): The ETag of the list, None if it is not validated.
+            last_modified (datetime | None): The latest `updated_at` of the list.
+
+        Returns:
+            HttpResponseBase: The same response.
+        """
+        if etag is None:
+            return response
+        response.headers["ETag"] = etag
+        if last_modified is not None:
+            response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
+
+
+class FastListMixin:
+    """Serialize list responses from `values_list()` rows, or stream them.
+
+    When the serializer of the list is supported by `RowSerializer`, the list
+    fetches tuples instead of model instances and builds the response data directly,
+    with the same output as the serializer. Otherwise both methods fall back to
+    model instances and the serializer.
+
+    A streamed list is a JSON array encoded chunk by chunk while the rows come off a
+    server-side cursor, so the memory used does not grow with the size of the list.
+
+    Attributes:
+        fast_list (bool): Whether list responses use the row serializer.
+        stream_chunk_size (int): Number of rows fetched and encoded at once when streaming.
+
+    Methods:
+        get_row_serializer: Returns the row serializer of the current serializer class.
+        get_list_rows: Returns the queryset fetching the objects of the list.
+        serialize_list: Returns the serialized data of the fetched objects.
+        get_streaming_response: Returns the whole list as a streamed JSON array.
+        aget_streaming_response: Returns the whole list as a streamed JSON array.
+    """
+
+    fast_list: bool = True
+    stream_chunk_size: int = 2000
+
+    def get_row_serializer(self) -> RowSerializer | None:
+        """Return the row serializer of the current serializer class.
+
+        Returns:
+            RowSerializer | None: The row serializer, or None if unsupported or disabled.
+        """
+        if not self.fast_list:
+            return None
+        return RowSerializer.for_serializer(self.get_serializer_class())
+
+    def get_list_rows(self, queryset: QuerySet[Model]) -> QuerySet[Model]:
+        """Return the queryset fetching the objects of the list.
+
+        Args:
+            queryset (QuerySet[Model]): The queryset of the list.
+
+        Returns:
+            QuerySet[Model]: A `values_list()` queryset, or the queryset itself.
+        """
+        row_serializer: RowSerializer | None = self.get_row_serializer()
+        return queryset if row_serializer is None else row_serializer.rows(queryset)
+
+    def serialize_list(self, objects: list[Any]) -> Any:
+        """Return the serialized data of the objects fetched by `get_list_rows`.
+
+        Args:
+            objects (list[Any]): The rows or model instances of the list.
+
+        Returns:
+            Any: The serialized list.
+        """
+        row_serializer: RowSerializer | None = self.get_row_serializer()
+        if row_serializer is None:
+            return self.get_serializer(objects, many=True).data
+        return row_serializer.serialize(objects)
+
+    def _encode_chunk(self, objects: list[Any], first: bool) -> bytes:
+        """Return the items of a chunk encoded as a part of the streamed JSON array."""
+        content: bytes = self.renderer_classes[0]().render(self.serialize_list(objects))
+        return content[1:-1] if first else b"," + content[1:-1]
+
+    def _stream(self, queryset: QuerySet[Model]) -> Iterator[bytes]:
+        """Yield the streamed JSON array of the queryset."""
+        yield b"["
+        chunk: list[Any] = []
+        first: bool = True
+        for row in queryset.iterator(chunk_size=self.stream_chunk_size):
+            chunk.append(row)
+            if len(chunk) == self.stream_chunk_size:
+                yield self._encode_chunk(chunk, first)
+                chunk, first = [], False
+        if chunk:
+            yield self._encode_chunk(chunk, first)
+        yield b"]"
+
+    async def _astream(self, queryset: QuerySet[Model]) -> AsyncIterator[bytes]:
+        """Yield the streamed JSON array of the queryset using the async ORM."""
+        yield b"["
+        chunk: list[Any] = []
+        first: bool = True
+        async for row in queryset.aiterator(chunk_size=self.stream_chunk_size):
+            chunk.append(row)
+            if len(chunk) == self.stream_chunk_size:
+                yield self._encode_chunk(chunk, first)
+                chunk, first = [], False
+        if chunk:
+            yield self._encode_chunk(chunk, first)
+        yield b"]"
+
+    def get_streaming_response(self, queryset: QuerySet[Model]) -> StreamingHttpResponse:
+        """Return the whole list as a JSON array streamed from a server-side cursor.
+
+        Args:
+            queryset (QuerySet[Model]): The queryset returned by `get_list_rows`.
+
+        Returns:
+            StreamingHttpResponse: The streamed response.
+        """
+        return StreamingHttpResponse(self._stream(queryset), content_type="application/json")
+
+    def aget_streaming_response(self, queryset: QuerySet[Model]) -> StreamingHttpResponse:
+        """Return the whole list as a streamed JSON array, fetched with the async ORM.
+
+        ASGI servers consume sync iterators in full before sending them, so async
+        handlers have to stream from an async iterator.
+
+        Args:
+            queryset (QuerySet[Model]): The queryset returned by `get_list_rows`.
+
+        Returns:
+            StreamingHttpResponse: The streamed response.
+        """
+        return StreamingHttpResponse(self._astream(queryset), content_type="application/json")
+
+
+class SparseFieldsMixin:
+    """Return and fetch only the fields requested with `?fields=id,title,status`.
+
+    The requested fields are applied to the serializer of the read actions and to
+    the SQL: `sparse_queryset` defers the other columns with `only()` and the row
+    serializer of `FastListMixin` fetches only the requested columns, plus the
+    ordering fields of the paginator. Unknown fields are rejected with 400.
+
+    Attributes:
+        sparse_actions (tuple[str, ...]): Actions honoring the `fields` parameter.
+
+    Methods:
+        initial: Validates the requested fields before the action runs.
+        get_requested_fields: Returns the requested field names, if any.
+        get_serializer: Returns the serializer limited to the requested fields.
+        get_row_serializer: Returns the row serializer limited to the requested fields.
+        sparse_queryset: Returns the queryset loading only the requested columns.
+    """
+
+    sparse_actions: tuple[str, ...] = ("list", "retrieve")
+
+    def initial(self, request: Request, *args, **kwargs) -> None:
+        """Validate the requested fields before the action runs.
+
+        Args:
+            request (Request): The incoming HTTP request.
+        """
+        super().initial(request, *args, **kwargs)  # type: ignore[misc]
+        self.get_requested_fields()
+
+    def get_requested_fields(self) -> list[str] | None:
+        """Return the field names requested with `?fields=`, if any.
+
+        Returns:
+            list[str] | None: The requested fields, or None to return every field.
+
+        Raises:
+            ValidationError: If a requested field is not a field of the serializer.
+        """
+        value: str | None = self.request.query_params.get(FIELDS_QUERY_PARAM)
+        if not value or self.action not in self.sparse_actions:
+            return None
+
+        requested: list[str] = [name.strip() for name in value.split(",") if name.strip()]
+        available: Any = self.get_serializer_class()().fields
+        unknown: list[str] = [name for name in requested if name not in available]
+        if unknown:
+            raise ValidationError({FIELDS_QUERY_PARAM: [f"Unknown fields: {', '.join(unknown)}."]})
+        return requested
+
+    def get_serializer(self, *args, **kwargs) -> BaseSerializer:
+        """Return the serializer limited to the requested fields.
+
+        Returns:
+            BaseSerializer: The serializer instance.
+        """
+        serializer: BaseSerializer = super().get_serializer(*args, **kwargs)  # type: ignore[misc]
+        requested: list[str] | None = self.get_requested_fields()
+        if requested is not None:
+            child: BaseSerializer = (
+                serializer.child if isinstance(serializer, ListSerializer) else serializer
+            )
+            for name in list(child.fields):
+                if name not in requested:
+                    child.fields.pop(name)
+        return serializer
+
+    def _ordering_fields(self) -> list[str]:
+        """Return the fields the paginator orders by, needed to build the cursors."""
+        paginator: Any = self.paginator
+        if hasattr(paginator, "get_ordering"):
+            ordering: Any = paginator.get_ordering(self.request, self.get_queryset(), self)
+        else:
+            ordering = getattr(paginator, "ordering", None) or ()
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        return [field.lstrip("-") for field in ordering]
+
+    def get_row_serializer(self) -> RowSerializer | None:
+        """Return the row serializer of `FastListMixin` limited to the requested fields.
+
+        Returns:
+            RowSerializer | None: The row serializer, or None if unsupported or disabled.
+        """
+        row_serializer: RowSerializer | None = super().get_row_serializer()  # type: ignore[misc]
+        requested: list[str] | None = self.get_requested_fields()
+        if row_serializer is None or requested is None:
+            return row_serializer
+
+        model: type[Model] = self.get_serializer_class().Meta.model
+        extra_columns: list[str] = [
+            model._meta.get_field(field).attname for field in self._ordering_fields()
+        ]
+        return row_serializer.select(requested, extra_columns)
+
+    def sparse_queryset(self, queryset: QuerySet[Model]) -> QuerySet[Model]:
+        """Return the queryset loading only the columns of the requested fields.
+
+        Args:
+            queryset (QuerySet[Model]): The queryset of the action.
+
+        Returns:
+            QuerySet[Model]: The queryset limited with `only()`, or the queryset itself.
+        """
+        requested: list[str] | None = self.get_requested_fields()
+        if requested is None:
+            return queryset
+
+        fields: Any = self.get_serializer_class()().fields
+        columns: list[str] = self._ordering_fields()
+        for name in requested:
+            try:
+                columns.append(queryset.model._meta.get_field(fields[name].source).name)
+            except FieldDoesNotExist:
+                continue
+        return queryset.only(*columns)
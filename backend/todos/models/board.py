@@ -2,7 +2,11 @@
 
 import uuid
 
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.utils import timezone
+from todos.search import SearchVectorDeferringManager, search_document
 from users.models import User
 
 
@@ -17,8 +21,17 @@ class Board(models.Model):
         created_at (datetime): The date and time when the board was created.
         updated_at (datetime): The date and time when the board was last updated.
         is_archived (bool): Indicates whether the board is archived.
+        deleted_at (datetime): The date and time when the board was deleted.
+        todo_count (int): Denormalized number of non-archived tasks with the todo status.
+        in_progress_count (int): Denormalized number of non-archived tasks in progress.
+        done_count (int): Denormalized number of non-archived tasks with the done status.
+        search_vector (SearchVectorField): Full-text search vector of the title and description,
+                                           generated by the database.
 
     Methods:
+        archive: Archives the board and all its tasks.
+        unarchive: Restores the board and the tasks archived with it.
+        soft_delete: Marks the board as deleted, leaving the purge to a background job.
         __str__: Returns the title of the board.
     """
 
@@ -29,6 +42,91 @@ class Board(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_archived = models.BooleanField(default=False)
+    deleted_at = models.DateTimeField(blank=True, null=True)
+    todo_count = models.IntegerField(default=0)
+    in_progress_count = models.IntegerField(default=0)
+    done_count = models.IntegerField(default=0)
+    search_vector = models.GeneratedField(
+        expression=search_document(), output_field=SearchVectorField(), db_persist=True
+    )
+
+    objects = SearchVectorDeferringManager()
+
+    class Meta:
+        """Meta options for Board.
+
+        Attributes:
+            indexes (list[models.Index]): Composite indexes backing the keyset pagination
+                                          of the non-archived boards of a user and the
+                                          delta sync of the boards changed by a user, and
+                                          the GIN index of the full-text search.
+        """
+
+        indexes = [
+            models.Index(
+                fields=["user_id", "is_archived", "created_at", "id"],
+                name="board_user_arch_created_idx",
+            ),
+            models.Index(fields=["user_id", "updated_at"], name="board_user_updated_idx"),
+            GinIndex(fields=["search_vector"], name="board_search_idx"),
+        ]
+
+    def _set_archived(self, archived: bool) -> int:
+        """Set `is_archived` of the board and its tasks with set-based UPDATE statements.
+
+        Archiving flags the tasks it archives with `archived_with_board`, and restoring
+        only restores the flagged tasks, so the tasks archived on their own before the
+        board stay archived.
+
+        Args:
+            archived (bool): The new value of `is_archived`.
+
+        Returns:
+            int: Number of updated tasks.
+        """
+        now = timezone.now()
+        if archived:
+            tasks: models.QuerySet = self.boards.filter(is_archived=False)
+        else:
+            tasks = self.boards.filter(archived_with_board=True, deleted_at__isnull=True)
+
+        with transaction.atomic():
+            Board.objects.filter(pk=self.pk).update(is_archived=archived, updated_at=now)
+            updated: int = tasks.update(
+                is_archived=archived, archived_with_board=archived, updated_at=now
+            )
+
+        self.is_archived = archived
+        self.updated_at = now
+        return updated
+
+    def archive(self) -> int:
+        """Archive the board and all its tasks in one transaction.
+
+        The rows are updated by two UPDATE statements whatever the number of tasks, and
+        `updated_at` is bumped so the delta sync reports them as removed.
+
+        Returns:
+            int: Number of archived tasks.
+        """
+        return self._set_archived(True)
+
+    def unarchive(self) -> int:
+        """Restore the board and the tasks archived with it in one transaction.
+
+        Tasks archived on their own before the board, and soft deleted tasks waiting
+        for the purge, stay archived.
+
+        Returns:
+            int: Number of restored tasks.
+        """
+        return self._set_archived(False)
+
+    def soft_delete(self) -> None:
+        """Mark the board as deleted, leaving its rows to the `purgedeleted` command."""
+        self.deleted_at = timezone.now()
+        self.is_archived = True
+        self.save(update_fields=["deleted_at", "is_archived", "updated_at"])
 
     def __str__(self) -> str:
         """Return the title of the board."""
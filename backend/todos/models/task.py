@@ -1,8 +1,14 @@
 """Defines the Task model."""
 
 import uuid
+from datetime import datetime
+from typing import Any
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.utils import timezone
+from todos.search import SearchVectorDeferringManager, search_document
 
 from .board import Board
 
@@ -37,8 +43,15 @@ class Task(models.Model):
         completed_at (datetime): The date and time when the task was completed.
         deleted_at (datetime): The date and time when the task was deleted.
         is_archived (bool): Indicates whether the task is archived.
+        archived_with_board (bool): Indicates whether the task was archived by archiving
+                                    its board, so restoring the board restores it.
+        search_vector (SearchVectorField): Full-text search vector of the title and description,
+                                           generated by the database.
 
     Methods:
+        from_db: Creates an instance from the database row and remembers the loaded values.
+        completion_values: Returns the completion fields matching a status change.
+        soft_delete: Marks the task as deleted, keeping the row as a tombstone.
         __str__: Returns the title of the task.
     """
 
@@ -57,6 +70,92 @@ class Task(models.Model):
     completed_at: models.DateTimeField = models.DateTimeField(blank=True, null=True)
     deleted_at: models.DateTimeField = models.DateTimeField(blank=True, null=True)
     is_archived: models.BooleanField = models.BooleanField(default=False)
+    archived_with_board: models.BooleanField = models.BooleanField(default=False)
+    search_vector: models.GeneratedField = models.GeneratedField(
+        expression=search_document(), output_field=SearchVectorField(), db_persist=True
+    )
+
+    objects: SearchVectorDeferringManager = SearchVectorDeferringManager()
+
+    class Meta:
+        """Meta options for Task.
+
+        Attributes:
+            indexes (list[models.Index]): Composite indexes backing the keyset pagination
+                                          of the non-archived tasks of a board and the
+                                          delta sync of the tasks changed on a board,
+                                          partial indexes of the non-archived tasks
+                                          backing the status and completion filters, and
+                                          the GIN index of the full-text search.
+        """
+
+        indexes: list[models.Index] = [
+            models.Index(
+                fields=["board", "created_at", "id"],
+                condition=models.Q(is_archived=False),
+                name="task_board_created_idx",
+            ),
+            models.Index(
+                fields=["board", "status", "created_at", "id"],
+                condition=models.Q(is_archived=False),
+                name="task_board_status_idx",
+            ),
+            models.Index(
+                fields=["board", "completed", "completed_at"],
+                condition=models.Q(is_archived=False),
+                name="task_board_completed_idx",
+            ),
+            models.Index(fields=["board", "updated_at"], name="task_board_updated_idx"),
+            GinIndex(fields=["search_vector"], name="task_search_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Create an instance from the database row and remember the loaded values.
+
+        The loaded values are used to detect which columns changed since the row
+        was read, e.g. to keep the board task counters up to date.
+
+        Args:
+            db (str): The alias of the database the row was loaded from.
+            field_names (list[str]): Names of the loaded fields.
+            values (list[Any]): Values of the loaded fields.
+
+        Returns:
+            Task: The task instance.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    @staticmethod
+    def completion_values(
+        status: str, previous_status: str | None, now: datetime
+    ) -> dict[str, Any]:
+        """Return the completion fields matching a status change.
+
+        A task is completed exactly when it is done. `completed_at` is set when the task
+        enters the done status and cleared when it leaves it.
+
+        Args:
+            status (str): The new status of the task.
+            previous_status (str | None): The status the task had before the change.
+            now (datetime): The time of the change.
+
+        Returns:
+            dict[str, Any]: The values of `completed` and, if it changes, `completed_at`.
+        """
+        if status != StatusChoices.DONE:
+            return {"completed": False, "completed_at": None}
+        if previous_status == StatusChoices.DONE:
+            return {"completed": True}
+        return {"completed": True, "completed_at": now}
+
+    def soft_delete(self) -> None:
+        """Mark the task as deleted, keeping the row as a tombstone for the delta sync."""
+        self.deleted_at = timezone.now()
+        self.is_archived = True
+        self.save(update_fields=["deleted_at", "is_archived", "updated_at"])
 
     def __str__(self):
         """Return the title of the task."""
@@ -0,0 +1,283 @@
+"""
+Pagination classes for the todos app.
+
+This module provides the pagination classes used by the todos viewsets, a helper
+for the explicit opt-out of pagination kept for backward compatibility and a helper
+for the streamed unpaginated lists.
+
+Classes:
+    KeysetCursorPagination: Cursor pagination positioned on every ordering field.
+    BoardCursorPagination: Keyset (cursor) pagination for boards ordered by creation time.
+    TaskCursorPagination: Keyset (cursor) pagination for tasks ordered by creation time.
+    SearchPagination: Limit/offset pagination of search results without a COUNT query.
+
+Functions:
+    is_pagination_disabled: Check whether the request explicitly opted out of pagination.
+    is_streaming_requested: Check whether the request asked for a streamed list.
+
+Example:
+    from todos.pagination import TaskCursorPagination
+"""
+
+import json
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+PAGINATION_QUERY_PARAM: str = "paginate"
+STREAM_QUERY_PARAM: str = "stream"
+
+
+def is_pagination_disabled(request: Request) -> bool:
+    """Check whether the request explicitly opted out of pagination.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Returns:
+        bool: True if the request contains `?paginate=false`, False otherwise.
+    """
+    return request.query_params.get(PAGINATION_QUERY_PARAM, "").lower() == "false"
+
+
+def is_streaming_requested(request: Request) -> bool:
+    """Check whether the request asked for the whole list as a streamed response.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Returns:
+        bool: True if the request contains `?stream=true`, False otherwise.
+    """
+    return request.query_params.get(STREAM_QUERY_PARAM, "").lower() == "true"
+
+
+class KeysetCursorPagination(CursorPagination):
+    """Cursor pagination positioned on every ordering field.
+
+    DRF's `CursorPagination` positions the cursor on the first ordering field only
+    and skips the rows sharing its value with an offset capped at `offset_cutoff`,
+    so pages repeat once many rows share a value, e.g. a status. This cursor keeps
+    the values of all the ordering fields, which end with the unique `id`, and a page
+    starts right after the row of the cursor: `(a, b, id) > (a0, b0, id0)` in the
+    direction of every field. Any page is a single range scan of the matching index.
+
+    Methods:
+        paginate_queryset: Returns the page following or preceding the cursor.
+    """
+
+    @staticmethod
+    def _field_names(ordering: tuple[str, ...]) -> list[str]:
+        """Return the field names of the ordering, without the direction prefix."""
+        return [field.lstrip("-") for field in ordering]
+
+    def _get_position_from_instance(self, instance: Any, ordering: tuple[str, ...]) -> str:
+        """Return the values of all the ordering fields of a row, encoded as JSON."""
+        values: list[Any] = [
+            instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            for name in self._field_names(ordering)
+        ]
+        return json.dumps([str(value) for value in values])
+
+    def _decode_position(self, queryset: QuerySet[Model], position: str) -> list[Any]:
+        """Return the values of the ordering fields stored in the cursor position.
+
+        Raises:
+            NotFound: If the position does not match the ordering of the request.
+        """
+        try:
+            values: Any = json.loads(position)
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError(position)
+            return [
+                queryset.model._meta.get_field(name).to_python(value)
+                for name, value in zip(self._field_names(self.ordering), values)
+            ]
+        except (ValueError, TypeError, FieldDoesNotExist, DjangoValidationError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+    def _after(self, values: list[Any], reverse: bool) -> Q:
+        """Return the condition of the rows following the position in the page direction."""
+        condition: Q = Q()
+        equal: Q = Q()
+        for field, value in zip(self.ordering, values):
+            name: str = field.lstrip("-")
+            lookup: str = "lt" if field.startswith("-") != reverse else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+
+        # The redundant bound on the first field lets the database start the index
+        # scan at the position instead of filtering the expanded condition.
+        first: str = self.ordering[0]
+        bound: str = "lte" if first.startswith("-") != reverse else "gte"
+        return Q(**{f"{first.lstrip('-')}__{bound}": values[0]}) & condition
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Model], request: Request, view: Any = None
+    ) -> list[Model] | None:
+        """Return the page following, or with a reverse cursor preceding, the cursor.
+
+        Args:
+            queryset (QuerySet[Model]): The queryset to paginate.
+            request (Request): The incoming HTTP request.
+            view (APIView): The view paginating the queryset.
+
+        Returns:
+            list[Model] | None: The objects of the page, or None if pagination is disabled.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse: bool = self.cursor is not None and self.cursor.reverse
+        position: str | None = self.cursor.position if self.cursor is not None else None
+
+        ordering: list[str] = list(self.ordering)
+        if reverse:
+            ordering = [field[1:] if field.startswith("-") else f"-{field}" for field in ordering]
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(
+                self._after(self._decode_position(queryset, position), reverse)
+            )
+
+        page_size: int = self.page_size
+        fetched: int = page_size + 1
+        results: list[Model] = list(queryset[:fetched])
+        self.page = results[:page_size]
+        following: str | None = None
+        if len(results) > page_size:
+            following = self._get_position_from_instance(results[-1], self.ordering)
+
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.next_position = position is not None, position
+            self.has_previous, self.previous_position = following is not None, following
+        else:
+            self.has_next, self.next_position = following is not None, following
+            self.has_previous, self.previous_position = position is not None, position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+
+class BoardCursorPagination(KeysetCursorPagination):
+    """Keyset (cursor) pagination for boards.
+
+    Boards are ordered by `(created_at, id)`, which matches the composite index
+    on `Board`, so a page is fetched with a single query and no COUNT.
+
+    Attributes:
+        ordering (tuple[str, ...]): Fields used to order the paginated queryset.
+        page_size_query_param (str): Query parameter used to override the page size.
+        max_page_size (int): Upper bound for the page size requested by the client.
+    """
+
+    ordering: tuple[str, ...] = ("created_at", "id")
+    page_size_query_param: str = "page_size"
+    max_page_size: int = 1000
+
+
+class TaskCursorPagination(KeysetCursorPagination):
+    """Keyset (cursor) pagination for tasks.
+
+    Tasks are ordered by `(created_at, id)`, which matches the composite index
+    on `Task`, so fetching any page costs the same as fetching the first one. The
+    `ordering` parameter of `TaskOrderingFilter` on the view overrides the order,
+    e.g. `(status, created_at, id)` matching the partial index of the statuses.
+
+    Attributes:
+        ordering (tuple[str, ...]): Fields used to order the paginated queryset.
+        page_size_query_param (str): Query parameter used to override the page size.
+        max_page_size (int): Upper bound for the page size requested by the client.
+    """
+
+    ordering: tuple[str, ...] = ("created_at", "id")
+    page_size_query_param: str = "page_size"
+    max_page_size: int = 1000
+
+
+class SearchPagination(LimitOffsetPagination):
+    """Limit/offset pagination of search results without a COUNT query.
+
+    Search results are ordered by rank, which is not unique, so they cannot be
+    paginated with a cursor. Counting every match of a broad query would cost as much
+    as ranking them, so a page fetches one extra row to know whether a next page exists.
+
+    Attributes:
+        default_limit (int): Number of results per page when no limit is requested.
+        max_limit (int): Upper bound for the limit requested by the client.
+    """
+
+    default_limit: int = 20
+    max_limit: int = 100
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Model], request: Request, view: Any = None
+    ) -> list[Model]:
+        """Return a single page of results.
+
+        Args:
+            queryset (QuerySet[Model]): The ordered search results.
+            request (Request): The incoming HTTP request.
+            view (APIView): The view paginating the results.
+
+        Returns:
+            list[Model]: The results of the requested page.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = self.get_offset(request)
+        start: int = self.offset
+        end: int = self.offset + self.limit + 1
+        limit: int = self.limit
+        results: list[Model] = list(queryset[start:end])
+        self.has_next = len(results) > limit
+        return results[:limit]
+
+    def get_next_link(self) -> str | None:
+        """Return the URL of the next page, or None on the last page."""
+        if not self.has_next:
+            return None
+        url: str = replace_query_param(
+            self.request.build_absolute_uri(), self.limit_query_param, self.limit
+        )
+        return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Return the page of results with the links to the adjacent pages.
+
+        Args:
+            data (Any): The serialized results.
+
+        Returns:
+            Response: A Response object containing the links and the results.
+        """
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Return the schema of the paginated response for the API documentation."""
+        paginated: dict[str, Any] = super().get_paginated_response_schema(schema)
+        paginated["properties"].pop("count", None)
+        paginated["required"] = ["results"]
+        return paginated
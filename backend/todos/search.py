@@ -0,0 +1,93 @@
+"""
+Full-text search of boards and tasks.
+
+Boards and tasks keep a stored `search_vector` column generated by PostgreSQL from
+the title (weight A) and the description (weight B), so it is current after any
+write, bulk and set-based updates included, and is indexed with GIN. A search
+matches the vector against a `websearch_to_tsquery` query, e.g. `"exact phrase"
+-excluded or alternative`, and orders the matches by rank.
+
+Classes:
+    SearchVectorDeferringManager: Model manager deferring the search vector column.
+
+Functions:
+    search_document: Return the expression of the search vector of a title and description.
+    get_search_text: Return the text of the `q` query parameter.
+    search: Return the rows of the queryset matching the text, best matches first.
+
+Example:
+    from todos.search import search
+"""
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import models
+from django.db.models import F, Model, QuerySet
+from django.db.models.expressions import CombinedExpression
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+SEARCH_CONFIG: str = "english"
+SEARCH_QUERY_PARAM: str = "q"
+
+
+class SearchVectorDeferringManager(models.Manager):
+    """Model manager deferring the search vector column, which only the search reads.
+
+    Methods:
+        get_queryset: Returns the queryset without the `search_vector` column.
+    """
+
+    def get_queryset(self) -> QuerySet[Model]:
+        """Return the queryset without the `search_vector` column.
+
+        Returns:
+            QuerySet[Model]: The queryset of the model.
+        """
+        return super().get_queryset().defer("search_vector")
+
+
+def search_document() -> CombinedExpression:
+    """Return the expression of the search vector of a title and description.
+
+    Returns:
+        CombinedExpression: The weighted `tsvector` of the `title` and `description` columns.
+    """
+    return SearchVector("title", weight="A", config=SEARCH_CONFIG) + SearchVector(
+        "description", weight="B", config=SEARCH_CONFIG
+    )
+
+
+def get_search_text(request: Request) -> str:
+    """Return the text of the `q` query parameter.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Returns:
+        str: The stripped search text.
+
+    Raises:
+        ValidationError: If the parameter is missing or blank.
+    """
+    text: str = request.query_params.get(SEARCH_QUERY_PARAM, "").strip()
+    if not text:
+        raise ValidationError({SEARCH_QUERY_PARAM: ["This query parameter is required."]})
+    return text
+
+
+def search(queryset: QuerySet[Model], text: str) -> QuerySet[Model]:
+    """Return the rows of the queryset matching the text, best matches first.
+
+    Args:
+        queryset (QuerySet[Model]): Rows of a model with a `search_vector` column.
+        text (str): The search text in web search syntax.
+
+    Returns:
+        QuerySet[Model]: The matching rows annotated with their `rank`.
+    """
+    query: SearchQuery = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by("-rank", "id")
+    )
@@ -6,7 +6,10 @@ used in different API versions.
 
 Exported Classes:
 - BoardSerializerV1: Serializer for board details in version 1 of the API.
+- BoardSummarySerializerV1: Serializer for board with per-status task counts in version 1.
 - TaskSerializerV1: Serializer for task details in version 1 of the API.
+- TaskMoveSerializerV1: Serializer of a task status transition in version 1 of the API.
+- RowSerializer: Read-only serializer of `values_list()` rows for large lists.
 
 Typical usage example:
     from users.serializers import UserDetailSerializerV1
@@ -16,9 +19,18 @@ Typical usage example:
     serializer_class = TaskSerializerV1
 """
 
-from .v1 import BoardSerializerV1, TaskSerializerV1
+from .rows import RowSerializer
+from .v1 import (
+    BoardSerializerV1,
+    BoardSummarySerializerV1,
+    TaskMoveSerializerV1,
+    TaskSerializerV1,
+)
 
 __all__ = [
     "BoardSerializerV1",
+    "BoardSummarySerializerV1",
     "TaskSerializerV1",
+    "TaskMoveSerializerV1",
+    "RowSerializer",
 ]
@@ -0,0 +1,198 @@
+"""
+Read-only serialization of rows fetched with `values_list()`.
+
+`ModelSerializer.to_representation` resolves every field of every instance through
+`get_attribute` and the field's `to_representation`, which dominates the CPU time of
+large lists. A `RowSerializer` inspects the fields of a model serializer once and
+builds the same dictionaries directly from the tuples of `values_list()`, skipping
+model instantiation as well. Serializers with fields it cannot reproduce exactly,
+e.g. `SerializerMethodField`, are not supported and keep using the regular path.
+
+Classes:
+    RowSerializer: Serializes `values_list()` rows like a model serializer.
+
+Example:
+    from todos.serializers import RowSerializer
+"""
+
+from datetime import datetime, tzinfo
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterable, Type
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+from rest_framework import fields as drf_fields
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+from rest_framework.settings import api_settings
+
+Converter = Callable[[Any], Any] | None
+
+
+def _format_datetime(value: datetime, field_timezone: tzinfo | None) -> str:
+    """Return the datetime formatted like DRF's ISO 8601 `DateTimeField`."""
+    if field_timezone is not None and timezone.is_aware(value):
+        value = value.astimezone(field_timezone)
+    text: str = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+class RowSerializer:
+    """Serializes `values_list()` rows like a model serializer.
+
+    Attributes:
+        names (list[str]): The output keys, in the order of the model serializer.
+        columns (list[str]): The model columns fetched for every output key.
+
+    Methods:
+        for_serializer: Returns the row serializer of a serializer class, if supported.
+        select: Returns a row serializer of a subset of the output keys.
+        rows: Returns the queryset fetching the rows as named tuples.
+        serialize: Returns the serialized data of the rows.
+    """
+
+    def __init__(self, names: list[str], columns: list[str], converters: list[Converter]) -> None:
+        """Initialize the row serializer from the inspected serializer fields.
+
+        Args:
+            names (list[str]): The output keys, in the order of the model serializer.
+            columns (list[str]): The model columns fetched for every output key.
+            converters (list[Converter]): The conversion of every column, None keeps
+                                          the value as fetched.
+        """
+        self.names: list[str] = names
+        self.columns: list[str] = columns
+        self._converters: list[Converter] = converters
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def for_serializer(
+        cls, serializer_class: Type[serializers.ModelSerializer]
+    ) -> "RowSerializer | None":
+        """Return the row serializer of a model serializer class, or None if unsupported.
+
+        Args:
+            serializer_class (Type[ModelSerializer]): The serializer of the list.
+
+        Returns:
+            RowSerializer | None: The row serializer, cached per serializer class.
+        """
+        model: Type[Model] = serializer_class.Meta.model
+        names: list[str] = []
+        columns: list[str] = []
+        converters: list[Converter] = []
+
+        for name, field in serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if field.source == "*" or "." in field.source:
+                return None
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return None
+
+            converter: Converter | bool = cls._converter(field)
+            if converter is False:
+                return None
+            names.append(name)
+            columns.append(model_field.attname)
+            converters.append(converter)
+
+        return cls(names, columns, converters)
+
+    @staticmethod
+    def _converter(field: drf_fields.Field) -> Converter | bool:
+        """Return the conversion reproducing the field output, or False if unsupported."""
+        if isinstance(field, PrimaryKeyRelatedField):
+            return None if field.pk_field is None else False
+        if isinstance(
+            field,
+            serializers.BaseSerializer
+            | serializers.RelatedField
+            | serializers.SerializerMethodField
+            | ManyRelatedField,
+        ):
+            return False
+        if isinstance(field, drf_fields.UUIDField):
+            return str if field.uuid_format == "hex_verbose" else field.to_representation
+        if isinstance(field, drf_fields.DateTimeField):
+            output_format: Any = getattr(field, "format", api_settings.DATETIME_FORMAT)
+            if settings.USE_TZ and output_format == drf_fields.ISO_8601:
+                return _format_datetime
+            return field.to_representation
+        if isinstance(
+            field,
+            drf_fields.BooleanField
+            | drf_fields.ChoiceField
+            | drf_fields.CharField
+            | drf_fields.IntegerField,
+        ):
+            return None
+        return field.to_representation
+
+    def select(self, names: list[str], extra_columns: list[str]) -> "RowSerializer":
+        """Return a row serializer of a subset of the output keys.
+
+        Args:
+            names (list[str]): The output keys to keep.
+            extra_columns (list[str]): Columns fetched without being serialized,
+                                       e.g. the ordering fields of the paginator.
+
+        Returns:
+            RowSerializer: The row serializer of the selected keys.
+        """
+        selected: list[int] = [index for index, name in enumerate(self.names) if name in names]
+        columns: list[str] = [self.columns[index] for index in selected]
+        return RowSerializer(
+            [self.names[index] for index in selected],
+            columns + [column for column in extra_columns if column not in columns],
+            [self._converters[index] for index in selected],
+        )
+
+    def rows(self, queryset: QuerySet[Model]) -> QuerySet[Model]:
+        """Return the queryset fetching the rows as named tuples.
+
+        Named tuples expose the columns as attributes, so the cursor paginators read
+        the ordering fields from them like from model instances.
+
+        Args:
+            queryset (QuerySet[Model]): The queryset of the list.
+
+        Returns:
+            QuerySet[Model]: The `values_list()` queryset.
+        """
+        return queryset.values_list(*self.columns, named=True)
+
+    def serialize(self, rows: Iterable[tuple]) -> list[dict[str, Any]]:
+        """Return the serialized data of the rows.
+
+        Args:
+            rows (Iterable[tuple]): Rows fetched with `rows()`. Columns beyond the output
+                                    keys are ignored.
+
+        Returns:
+            list[dict[str, Any]]: The same dictionaries as the model serializer.
+        """
+        field_timezone: tzinfo | None = timezone.get_current_timezone()
+        converters: list[Converter] = [
+            (
+                partial(_format_datetime, field_timezone=field_timezone)
+                if converter is _format_datetime
+                else converter
+            )
+            for converter in self._converters
+        ]
+        names: list[str] = self.names
+
+        if not any(converters):
+            return [dict(zip(names, row)) for row in rows]
+        return [
+            {
+                name: value if converter is None or value is None else converter(value)
+                for name, converter, value in zip(names, converters, row)
+            }
+            for row in rows
+        ]
@@ -0,0 +1,75 @@
+"""
+Partial updates of model instances writing only the changed columns.
+
+`ModelSerializer.update` sets every validated attribute and calls `save()`, which
+rewrites every column of the row, e.g. a large `description` when only the title
+changed. The mixin of this module compares the validated data with the instance,
+saves only the columns whose value differs, plus `updated_at`, and skips the write
+entirely when nothing changed.
+
+Classes:
+    ChangedFieldsUpdateMixin: Serializer mixin saving only the changed columns.
+
+Example:
+    from todos.serializers.updates import ChangedFieldsUpdateMixin
+"""
+
+from typing import Any
+
+from django.db.models import Model
+
+
+class ChangedFieldsUpdateMixin:
+    """Serializer mixin saving only the changed columns of an updated instance.
+
+    Methods:
+        get_update_values: Returns the values to set on the instance.
+        get_changed_values: Returns the values that differ from the instance.
+        update: Saves the changed columns, or nothing if no value changed.
+    """
+
+    def get_update_values(self, instance: Model, validated_data: dict) -> dict[str, Any]:
+        """Return the values to set on the instance.
+
+        Args:
+            instance (Model): The instance being updated.
+            validated_data (dict): The validated data of the update.
+
+        Returns:
+            dict[str, Any]: The values to set, the validated data by default.
+        """
+        return validated_data
+
+    @staticmethod
+    def get_changed_values(instance: Model, values: dict[str, Any]) -> dict[str, Any]:
+        """Return the values that differ from the current values of the instance.
+
+        Args:
+            instance (Model): The instance being updated.
+            values (dict[str, Any]): The values to set.
+
+        Returns:
+            dict[str, Any]: The values whose column would change.
+        """
+        return {attr: value for attr, value in values.items() if getattr(instance, attr) != value}
+
+    def update(self, instance: Model, validated_data: dict) -> Model:
+        """Save the changed columns and `updated_at`, or nothing if no value changed.
+
+        Args:
+            instance (Model): The instance to update.
+            validated_data (dict): The validated data of the update.
+
+        Returns:
+            Model: The updated instance.
+        """
+        changed: dict[str, Any] = self.get_changed_values(
+            instance, self.get_update_values(instance, validated_data)
+        )
+        if not changed:
+            return instance
+
+        for attr, value in changed.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*changed, "updated_at"])
+        return instance
@@ -2,13 +2,19 @@
 
 Exported Classes:
 - BoardSerializerV1: Serializer for board details in version 1 of the API.
+- BoardSummarySerializerV1: Serializer for board with per-status task counts in version 1.
 - TaskSerializerV1: Serializer for task details in version 1 of the API.
+- TaskMoveSerializerV1: Serializer of a task status transition in version 1 of the API.
 """
 
 from .board import BoardSerializer as BoardSerializerV1
+from .board import BoardSummarySerializer as BoardSummarySerializerV1
+from .task import TaskMoveSerializer as TaskMoveSerializerV1
 from .task import TaskSerializer as TaskSerializerV1
 
 __all__ = [
     "BoardSerializerV1",
+    "BoardSummarySerializerV1",
     "TaskSerializerV1",
+    "TaskMoveSerializerV1",
 ]
@@ -3,10 +3,12 @@
 from typing import Type
 
 from rest_framework import serializers
+from todos.counters import TASK_COUNTER_FIELDS, get_task_counts
 from todos.models import Board
+from todos.serializers.updates import ChangedFieldsUpdateMixin
 
 
-class BoardSerializer(serializers.ModelSerializer):
+class BoardSerializer(ChangedFieldsUpdateMixin, serializers.ModelSerializer):
     """Serializers for board.
 
     Provides serialization and validation logic for the Board model
@@ -19,10 +21,11 @@ class BoardSerializer(serializers.ModelSerializer):
         description (str): A description of the board.
         created_at (datetime): The date and time when the board was created.
         updated_at (datetime): The date and time when the board was last updated.
-        is_archived (bool): Indicates whether the board is archived.
+        is_archived (bool): Indicates whether the board is archived, changed only by the
+                            archive and unarchive actions.
     Methods:
         create: Create a new board instance.
-        update: Update an existing board instance.
+        update: Save the changed fields of an existing board instance.
     """
 
     class Meta:
@@ -30,13 +33,20 @@ class BoardSerializer(serializers.ModelSerializer):
 
         Attributes:
             model (Type[Board]): The Board model to serialize.
-            fields (str): All fields of the Board model.
+            exclude (list[str]): Denormalized counter and search fields hidden from the API.
             read_only_fields (list[str]): Fields that are read-only and cannot be modified.
         """
 
         model: Type[Board] = Board
-        fields: str = "__all__"
-        read_only_fields: list[str] = ["id", "created_at", "updated_at", "user_id"]
+        exclude: list[str] = [*TASK_COUNTER_FIELDS.values(), "search_vector"]
+        read_only_fields: list[str] = [
+            "id",
+            "created_at",
+            "updated_at",
+            "user_id",
+            "is_archived",
+            "deleted_at",
+        ]
 
     def create(self, validated_data: dict) -> Board:
         """Create a new board instance.
@@ -49,17 +59,25 @@ class BoardSerializer(serializers.ModelSerializer):
         """
         return Board.objects.create(**validated_data)
 
-    def update(self, instance: Board, validated_data: dict) -> Board:
-        """Update an existing board instance.
+
+class BoardSummarySerializer(BoardSerializer):
+    """Serializer for board with per-status task counts.
+
+    Expects boards annotated by `todos.counters.annotate_task_counts`.
+
+    Attributes:
+        task_counts (dict[str, int]): Number of non-archived tasks keyed by task status.
+    """
+
+    task_counts: serializers.SerializerMethodField = serializers.SerializerMethodField()
+
+    def get_task_counts(self, obj: Board) -> dict[str, int]:
+        """Return the per-status task counts of the board.
 
         Args:
-            instance (Board): The board instance to update.
-            validated_data (dict): Data to update the board instance.
+            obj (Board): The annotated board instance.
 
         Returns:
-            Board: The updated board instance.
+            dict[str, int]: Number of tasks keyed by task status.
         """
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
-        return instance
+        return get_task_counts(obj)
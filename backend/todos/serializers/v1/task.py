@@ -1,12 +1,124 @@
-"""Serializer for Task model in version 1 of the API."""
+"""Serializers for Task model and its status transitions in version 1 of the API."""
 
+from datetime import datetime
+from functools import cached_property
 from typing import Type
+from uuid import UUID
 
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
+from todos.counters import refresh_task_counters
 from todos.models import Task
+from todos.models.task import StatusChoices
+from todos.serializers.updates import ChangedFieldsUpdateMixin
 
+BULK_BATCH_SIZE: int = 500
 
-class TaskSerializer(serializers.ModelSerializer):
+
+def with_completion_values(task: Task, validated_data: dict, now: datetime) -> dict:
+    """Return the validated data completed with the completion fields of a status change.
+
+    Args:
+        task (Task): The task being updated.
+        validated_data (dict): The validated data of the update.
+        now (datetime): The time of the update.
+
+    Returns:
+        dict: The values to write.
+    """
+    new_status: str | None = validated_data.get("status")
+    if new_status is None or new_status == task.status:
+        return validated_data
+    completion: dict = Task.completion_values(new_status, task.status, now)
+    return {**completion, **validated_data}
+
+
+class TaskListSerializer(serializers.ListSerializer):
+    """List serializer writing many tasks with bulk queries.
+
+    Methods:
+        tasks_by_id: Returns the updated tasks keyed by their primary key.
+        run_child_validation: Validates one item against the task it updates.
+        create: Creates all tasks with `bulk_create`.
+        update: Updates the changed tasks with `bulk_update`.
+    """
+
+    @cached_property
+    def tasks_by_id(self) -> dict[str, Task]:
+        """Return the updated tasks keyed by their primary key."""
+        return {str(task.pk): task for task in self.instance or []}
+
+    def run_child_validation(self, data: dict) -> dict:
+        """Validate one item against the task it updates.
+
+        Args:
+            data (dict): The item data, containing the `id` of the task when updating, in
+                         any form accepted by `UUID`, e.g. uppercase or without hyphens.
+
+        Returns:
+            dict: The validated item data.
+        """
+        if self.instance is not None:
+            self.child.instance = self.tasks_by_id[str(UUID(str(data["id"])))]
+            self.child.initial_data = data
+        return super().run_child_validation(data)
+
+    def create(self, validated_data: list[dict]) -> list[Task]:
+        """Create all tasks with `bulk_create`.
+
+        Args:
+            validated_data (list[dict]): The validated data of every task to create.
+
+        Returns:
+            list[Task]: The created task instances.
+        """
+        tasks: list[Task] = Task.objects.bulk_create(
+            [Task(**item) for item in validated_data], batch_size=BULK_BATCH_SIZE
+        )
+        self._refresh_counters(tasks)
+        return tasks
+
+    def update(self, instance: list[Task], validated_data: list[dict]) -> list[Task]:
+        """Update the changed tasks with `bulk_update`, skipping the unchanged ones.
+
+        Args:
+            instance (list[Task]): The tasks to update, in the order of `validated_data`.
+            validated_data (list[dict]): The validated data of every task to update.
+
+        Returns:
+            list[Task]: The updated task instances.
+        """
+        now = timezone.now()
+        fields: set[str] = set()
+        changed_tasks: list[Task] = []
+
+        for task, item in zip(instance, validated_data):
+            changed: dict = ChangedFieldsUpdateMixin.get_changed_values(
+                task, with_completion_values(task, item, now)
+            )
+            if not changed:
+                continue
+            for attr, value in changed.items():
+                setattr(task, attr, value)
+            fields.update(changed)
+            task.updated_at = now
+            changed_tasks.append(task)
+
+        if changed_tasks:
+            Task.objects.bulk_update(
+                changed_tasks, [*sorted(fields), "updated_at"], batch_size=BULK_BATCH_SIZE
+            )
+            self._refresh_counters(changed_tasks)
+        return instance
+
+    def _refresh_counters(self, tasks: list[Task]) -> None:
+        """Refresh the board task counters bypassed by the bulk queries."""
+        if settings.TODOS_BOARD_TASK_COUNTERS:
+            refresh_task_counters({task.board_id for task in tasks})
+
+
+class TaskSerializer(ChangedFieldsUpdateMixin, serializers.ModelSerializer):
     """Serializers for task.
 
     Provides serialization and validation logic for the Task model
@@ -27,7 +139,8 @@ class TaskSerializer(serializers.ModelSerializer):
 
     Methods:
         create: Create a new task instance.
-        update: Update an existing task instance.
+        get_update_values: Return the values to set on an updated task.
+        update: Save the changed fields of an existing task instance.
     """
 
     class Meta:
@@ -35,13 +148,16 @@ class TaskSerializer(serializers.ModelSerializer):
 
         Attributes:
             model (Type[Task]): The Task model to serialize.
-            fields (str): All fields of the Task model.
+            exclude (list[str]): The search vector and the board archive flag, hidden
+                                 from the API.
             read_only_fields (list[str]): Fields that are read-only and cannot be modified.
+            list_serializer_class (Type[TaskListSerializer]): Serializer used with `many=True`.
         """
 
         model: Type[Task] = Task
-        fields: str = "__all__"
-        read_only_fields: list[str] = ["id", "created_at", "updated_at", "board"]
+        exclude: list[str] = ["search_vector", "archived_with_board"]
+        read_only_fields: list[str] = ["id", "created_at", "updated_at", "board", "deleted_at"]
+        list_serializer_class: Type[TaskListSerializer] = TaskListSerializer
 
     def create(self, validated_data: dict) -> Task:
         """Create a new task instance.
@@ -54,17 +170,29 @@ class TaskSerializer(serializers.ModelSerializer):
         """
         return Task.objects.create(**validated_data)
 
-    def update(self, instance: Task, validated_data: dict) -> Task:
-        """Update an existing task instance.
+    def get_update_values(self, instance: Task, validated_data: dict) -> dict:
+        """Return the values to set on the task.
+
+        A status change also sets `completed` and `completed_at`, unless they are
+        part of the data. Only the values that differ from the task are written.
 
         Args:
             instance (Task): The task instance to update.
             validated_data (dict): The validated data for updating the task.
 
         Returns:
-            Task: The updated task instance.
+            dict: The values to set on the task.
         """
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
-        return instance
+        return with_completion_values(instance, validated_data, timezone.now())
+
+
+class TaskMoveSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Serializer of a status transition of a task.
+
+    Attributes:
+        expected_status (str): The status the client saw, the move fails if it changed since.
+        status (str): The new status of the task.
+    """
+
+    expected_status: serializers.ChoiceField = serializers.ChoiceField(choices=StatusChoices)
+    status: serializers.ChoiceField = serializers.ChoiceField(choices=StatusChoices)
@@ -0,0 +1,35 @@
+"""
+Signal handlers for the todos app.
+
+Functions:
+    update_counters_on_task_save: Keep the board task counters up to date after a task save.
+    update_counters_on_task_delete: Keep the board task counters up to date after a task delete.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from todos.counters import track_task_counters
+from todos.models import Task
+
+
+@receiver(post_save, sender=Task)
+def update_counters_on_task_save(sender, instance: Task, created: bool, **kwargs) -> None:
+    """Keep the board task counters up to date after a task save.
+
+    Args:
+        sender (Type[Task]): The model class that sent the signal.
+        instance (Task): The saved task.
+        created (bool): Whether the task was just inserted.
+    """
+    track_task_counters(instance, created=created)
+
+
+@receiver(post_delete, sender=Task)
+def update_counters_on_task_delete(sender, instance: Task, **kwargs) -> None:
+    """Keep the board task counters up to date after a task delete.
+
+    Args:
+        sender (Type[Task]): The model class that sent the signal.
+        instance (Task): The deleted task.
+    """
+    track_task_counters(instance, deleted=True)
@@ -0,0 +1,158 @@
+"""
+Delta sync of boards and tasks.
+
+With `?since=<ISO 8601 timestamp>` the list endpoints return only the rows whose
+`updated_at` is later than the timestamp, split into the rows that are still part
+of the list and tombstones of the rows that left it since (soft deleted or
+archived). Clients keep a local copy and pass the returned `next_since`, and
+`next_since_id` if it is set, to the next request.
+
+A response carries at most `TODOS_SYNC_MAX_ROWS` rows ordered by `updated_at` and
+`id`. When more rows changed, `has_more` is true and `next_since` with `next_since_id`
+point right after the last returned row, so bulk writes sharing one `updated_at`
+are paged without gaps. `updated_at` is set before the transaction of a write
+commits, so a row may become visible after later rows were already returned. The
+last page therefore sets `next_since` no later than `TODOS_SYNC_OVERLAP_SECONDS`
+before the current time, and the rows of that window are returned again by the
+next request. Clients deduplicate the rows by `id`.
+
+Functions:
+    get_since: Return the timestamp of the `since` query parameter, if any.
+    get_since_id: Return the id of the `since_id` query parameter, if any.
+    changed_after: Return the condition of the rows changed after a sync position.
+    get_sync_limit: Return the number of rows to fetch for a delta sync response.
+    delta_response: Return the delta sync response for the changed rows.
+
+Example:
+    from todos.sync import get_since
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Callable
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import Model, Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from todos.filters import get_datetime_param
+
+SINCE_QUERY_PARAM: str = "since"
+SINCE_ID_QUERY_PARAM: str = "since_id"
+
+
+def get_since(request: Request) -> datetime | None:
+    """Return the timestamp of the `since` query parameter, if any.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Returns:
+        datetime | None: The aware timestamp, or None if no delta was requested.
+
+    Raises:
+        ValidationError: If the parameter is not an ISO 8601 date and time.
+    """
+    return get_datetime_param(request, SINCE_QUERY_PARAM)
+
+
+def get_since_id(request: Request) -> UUID | None:
+    """Return the id of the `since_id` query parameter, if any.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Returns:
+        UUID | None: The id of the last row of the previous page, or None if not passed.
+
+    Raises:
+        ValidationError: If the parameter is not a UUID.
+    """
+    value: str | None = request.query_params.get(SINCE_ID_QUERY_PARAM)
+    if value is None:
+        return None
+
+    try:
+        return UUID(value)
+    except ValueError as error:
+        raise ValidationError({SINCE_ID_QUERY_PARAM: ["Expected a UUID."]}) from error
+
+
+def changed_after(since: datetime, since_id: UUID | None) -> Q:
+    """Return the condition of the rows changed after a sync position.
+
+    Args:
+        since (datetime): The timestamp passed by the client.
+        since_id (UUID | None): The id of the last row returned at `since`, if any.
+
+    Returns:
+        Q: The condition of the rows following `(since, since_id)` in the sync order.
+    """
+    if since_id is None:
+        return Q(updated_at__gt=since)
+    return Q(updated_at__gt=since) | Q(updated_at=since, id__gt=since_id)
+
+
+def get_sync_limit() -> int:
+    """Return the number of rows to fetch, one more than a response carries.
+
+    Returns:
+        int: `TODOS_SYNC_MAX_ROWS` plus the row telling whether more rows changed.
+    """
+    return settings.TODOS_SYNC_MAX_ROWS + 1
+
+
+def delta_response(
+    rows: list[Model],
+    since: datetime,
+    since_id: UUID | None,
+    serialize: Callable[[list[Model]], Any],
+) -> Response:
+    """Return the delta sync response for the rows changed since the sync position.
+
+    Args:
+        rows (list[Model]): At most `get_sync_limit()` rows changed after the position,
+                            archived ones included, ordered by `updated_at` and `id`.
+        since (datetime): The timestamp passed by the client.
+        since_id (UUID | None): The id passed by the client, if any.
+        serialize (Callable[[list[Model]], Any]): Serializes the rows still in the list.
+
+    Returns:
+        Response: A Response object with the changed rows, the tombstones of the
+                  removed rows and the position of the next request.
+    """
+    limit: int = settings.TODOS_SYNC_MAX_ROWS
+    has_more: bool = len(rows) > limit
+    rows = rows[:limit]
+
+    next_since: datetime = since
+    next_since_id: UUID | None = since_id
+    if has_more:
+        next_since, next_since_id = rows[-1].updated_at, rows[-1].pk
+    elif rows:
+        # Rows written in the overlap window may still be committing, so the next
+        # request reads the window again instead of starting after the last row.
+        horizon: datetime = timezone.now() - timedelta(seconds=settings.TODOS_SYNC_OVERLAP_SECONDS)
+        if rows[-1].updated_at <= horizon:
+            next_since, next_since_id = rows[-1].updated_at, rows[-1].pk
+        elif horizon > since:
+            next_since, next_since_id = horizon, None
+
+    changed: list[Model] = [row for row in rows if not row.is_archived]
+    removed: list[dict[str, Any]] = [
+        {"id": row.pk, "removed_at": row.updated_at} for row in rows if row.is_archived
+    ]
+
+    return Response(
+        {
+            "next_since": next_since,
+            "next_since_id": next_since_id,
+            "has_more": has_more,
+            "changed": serialize(changed),
+            "removed": removed,
+        },
+        status=status.HTTP_200_OK,
+    )
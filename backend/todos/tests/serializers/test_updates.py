@@ -0,0 +1,235 @@
+"""
+Tests of the updates writing only the changed columns.
+
+The SQL statements of the board and task updates are captured to check that only
+the columns whose value changed are written, plus `updated_at`, and that updates
+changing nothing do not write at all.
+
+Classes:
+    ChangedColumnsTestCase: Base test case capturing the columns written by UPDATE statements.
+    TaskUpdateTests: Changed columns of the single and bulk task updates.
+    BoardUpdateTests: Changed columns of the board updates.
+    TaskLoadedValuesTests: Counter updates based on the values a task was loaded with.
+"""
+
+import re
+from typing import Any
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+from todos.counters import refresh_task_counters, track_task_counters
+from todos.models import Board, Task
+from users.models import User
+
+SET_COLUMN_PATTERN: re.Pattern = re.compile(r'(?:SET |, )"(\w+)" = ')
+
+
+class ChangedColumnsTestCase(APITestCase):
+    """Base test case capturing the columns written by UPDATE statements.
+
+    Attributes:
+        user (User): The owner of the board.
+        board (Board): A board of the user.
+        task (Task): A task of the board.
+    """
+
+    user: User
+    board: Board
+    task: Task
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create the user, the board and the task."""
+        cls.user = User.objects.create_user(
+            username="owner", email="owner@example.com", password="password", is_active=True
+        )
+        cls.board = Board.objects.create(title="Board", description="Notes", user_id=cls.user)
+        cls.task = Task.objects.create(title="Task", description="Details", board=cls.board)
+
+    def setUp(self) -> None:
+        """Authenticate the requests as the owner of the board."""
+        self.client.force_authenticate(self.user)
+
+    def request(
+        self, method: str, url: str, data: Any, table: str = "todos_task"
+    ) -> tuple[Response, list[set[str]]]:
+        """Send a request and return the columns written by each UPDATE of a table.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (str): The URL of the request.
+            data (Any): The JSON payload of the request.
+            table (str): The table of the updated rows, so the updates of the board
+                         task counters, if enabled, are left out for tasks.
+
+        Returns:
+            tuple[Response, list[set[str]]]: The response and the set columns of every
+                                             UPDATE of the table.
+        """
+        with CaptureQueriesContext(connection) as context:
+            response: Response = getattr(self.client, method)(url, data, format="json")
+
+        updates: list[set[str]] = []
+        for query in context.captured_queries:
+            sql: str = query["sql"]
+            if sql.startswith(f'UPDATE "{table}" SET'):
+                assignments: str = sql[: sql.rindex(" WHERE ")]
+                updates.append(set(SET_COLUMN_PATTERN.findall(assignments)))
+        return response, updates
+
+
+class TaskUpdateTests(ChangedColumnsTestCase):
+    """Changed columns of the single and bulk task updates."""
+
+    def url(self, task: Task | None = None) -> str:
+        """Return the URL of a task of the board, or of the bulk endpoint."""
+        suffix: str = f"{task.id}/" if task is not None else "bulk/"
+        return f"/api/v1/boards/{self.board.id}/tasks/{suffix}"
+
+    def test_patch_writes_the_changed_column(self) -> None:
+        """A PATCH writes the changed title, not the description."""
+        response, updates = self.request("patch", self.url(self.task), {"title": "Renamed"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(updates, [{"title", "updated_at"}])
+        self.assertEqual(Task.objects.get(pk=self.task.pk).title, "Renamed")
+
+    def test_patch_of_the_status_writes_the_completion(self) -> None:
+        """A status change also writes the completion columns."""
+        response, updates = self.request("patch", self.url(self.task), {"status": "done"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(updates, [{"status", "completed", "completed_at", "updated_at"}])
+        self.assertTrue(response.data["completed"])
+
+    def test_put_writes_only_the_changed_columns(self) -> None:
+        """A PUT sending every field writes only the ones that differ."""
+        data: dict[str, Any] = {
+            "title": self.task.title,
+            "status": self.task.status,
+            "description": "New details",
+            "completed": self.task.completed,
+            "is_archived": self.task.is_archived,
+        }
+        response, updates = self.request("put", self.url(self.task), data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(updates, [{"description", "updated_at"}])
+
+    def test_unchanged_patch_does_not_write(self) -> None:
+        """A PATCH with the current values runs no UPDATE and keeps `updated_at`."""
+        response, updates = self.request(
+            "patch", self.url(self.task), {"title": self.task.title, "status": self.task.status}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(updates, [])
+        self.assertEqual(Task.objects.get(pk=self.task.pk).updated_at, self.task.updated_at)
+
+    def test_bulk_update_writes_the_changed_tasks(self) -> None:
+        """A bulk PATCH writes the changed columns of the changed tasks only."""
+        other: Task = Task.objects.create(title="Other", board=self.board)
+        unchanged: Task = Task.objects.create(title="Unchanged", board=self.board)
+        data: list[dict[str, Any]] = [
+            {"id": str(self.task.id), "title": "Renamed"},
+            {"id": str(other.id), "title": "Renamed other"},
+            {"id": str(unchanged.id), "title": unchanged.title},
+        ]
+        response, updates = self.request("patch", self.url(), data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(updates, [{"title", "updated_at"}])
+        self.assertEqual(Task.objects.get(pk=unchanged.pk).updated_at, unchanged.updated_at)
+
+    def test_bulk_update_accepts_uppercase_ids(self) -> None:
+        """A bulk PATCH finds the tasks whose ids are sent uppercase or without hyphens."""
+        other: Task = Task.objects.create(title="Other", board=self.board)
+        data: list[dict[str, Any]] = [
+            {"id": str(self.task.id).upper(), "title": "Renamed"},
+            {"id": other.id.hex, "title": "Renamed other"},
+        ]
+        response, updates = self.request("patch", self.url(), data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(updates, [{"title", "updated_at"}])
+        self.assertEqual(Task.objects.get(pk=self.task.pk).title, "Renamed")
+        self.assertEqual(Task.objects.get(pk=other.pk).title, "Renamed other")
+
+    def test_unchanged_bulk_update_does_not_write(self) -> None:
+        """A bulk PATCH changing nothing runs no UPDATE."""
+        data: list[dict[str, Any]] = [{"id": str(self.task.id), "title": self.task.title}]
+        response, updates = self.request("patch", self.url(), data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(updates, [])
+
+
+class BoardUpdateTests(ChangedColumnsTestCase):
+    """Changed columns of the board updates."""
+
+    def test_patch_writes_the_changed_column(self) -> None:
+        """A PATCH writes the changed title, not the description."""
+        response, updates = self.request(
+            "patch", f"/api/v1/boards/{self.board.id}/", {"title": "Renamed"}, "todos_board"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(updates, [{"title", "updated_at"}])
+
+    def test_unchanged_patch_does_not_write(self) -> None:
+        """A PATCH with the current values runs no UPDATE."""
+        response, updates = self.request(
+            "patch",
+            f"/api/v1/boards/{self.board.id}/",
+            {"title": self.board.title, "description": self.board.description},
+            "todos_board",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(updates, [])
+
+
+@override_settings(TODOS_BOARD_TASK_COUNTERS=True)
+class TaskLoadedValuesTests(ChangedColumnsTestCase):
+    """Counter updates based on the values a task was loaded with."""
+
+    def setUp(self) -> None:
+        """Authenticate the owner and count the tasks of the board."""
+        super().setUp()
+        refresh_task_counters([self.board.pk])
+
+    def test_loaded_values(self) -> None:
+        """A task read from the database remembers the values of its columns."""
+        task: Task = Task.objects.get(pk=self.task.pk)
+        loaded: dict[str, Any] = task._loaded_values  # pylint: disable=protected-access
+
+        self.assertEqual(loaded["status"], "todo")
+        self.assertEqual(loaded["board_id"], self.board.pk)
+
+    def test_status_change_moves_the_counter(self) -> None:
+        """A status change moves the counter without recounting the board."""
+        task: Task = Task.objects.get(pk=self.task.pk)
+        task.status = "done"
+        with CaptureQueriesContext(connection) as context:
+            track_task_counters(task)
+
+        # One increment or decrement per counter, no recount of the board.
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertTrue(
+            all(query["sql"].startswith("UPDATE") for query in context.captured_queries)
+        )
+        board: Board = Board.objects.get(pk=self.board.pk)
+        self.assertEqual((board.todo_count, board.done_count), (0, 1))
+
+    def test_unloaded_status_recounts_the_board(self) -> None:
+        """A task loaded without its status recounts the board instead."""
+        task: Task = Task.objects.only("id", "board_id").get(pk=self.task.pk)
+        Task.objects.filter(pk=task.pk).update(status="done")
+        task.status = "done"
+        track_task_counters(task)
+
+        board: Board = Board.objects.get(pk=self.board.pk)
+        self.assertEqual((board.todo_count, board.done_count), (0, 1))
@@ -0,0 +1,28 @@
+"""
+Tests of the system checks of the Todos application settings.
+
+Classes:
+    RealtimeBrokerCheckTests: The in-process broker is rejected with several workers.
+"""
+
+from django.test import SimpleTestCase, override_settings
+from todos.checks import check_realtime_broker
+
+
+class RealtimeBrokerCheckTests(SimpleTestCase):
+    """The in-process broker is rejected with several workers."""
+
+    @override_settings(TODOS_REALTIME_BROKER="local", SERVER_WORKERS=4)
+    def test_local_broker_with_several_workers(self) -> None:
+        """The "local" broker with several workers is an error."""
+        self.assertEqual([error.id for error in check_realtime_broker()], ["todos.E001"])
+
+    @override_settings(TODOS_REALTIME_BROKER="local", SERVER_WORKERS=1)
+    def test_local_broker_with_one_worker(self) -> None:
+        """The "local" broker with a single worker passes."""
+        self.assertEqual(check_realtime_broker(), [])
+
+    @override_settings(TODOS_REALTIME_BROKER="redis", SERVER_WORKERS=4)
+    def test_redis_broker_with_several_workers(self) -> None:
+        """The "redis" broker reaches every worker."""
+        self.assertEqual(check_realtime_broker(), [])
@@ -0,0 +1,217 @@
+"""
+Query count regression tests of the board and task endpoints.
+
+The list and detail endpoints are expected to run a fixed number of SQL queries
+whatever the number of rows, so a lookup added per row, e.g. a related object
+loaded by the serializer, makes these tests fail. The writes are pinned too, plus
+the counter updates they run when the board task counters are enabled.
+
+Classes:
+    QueryCountTestCase: Base test case authenticating the owner of a board with many tasks.
+    BoardQueryCountTests: Query counts of the board list, detail and write endpoints.
+    TaskQueryCountTests: Query counts of the task list, detail and write endpoints.
+"""
+
+from django.conf import settings
+from rest_framework.test import APITestCase
+from todos.models import Board, Task
+from users.models import User
+
+ROWS: int = 20
+
+
+class QueryCountTestCase(APITestCase):
+    """Base test case authenticating the owner of a board with many tasks.
+
+    Attributes:
+        user (User): The owner of the boards.
+        board (Board): A board of the user with `ROWS` tasks.
+        task (Task): One of the tasks of the board.
+    """
+
+    user: User
+    board: Board
+    task: Task
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create the user, `ROWS` boards and `ROWS` tasks on the first board."""
+        cls.user = User.objects.create_user(
+            username="owner", email="owner@example.com", password="password", is_active=True
+        )
+        other: User = User.objects.create_user(
+            username="other", email="other@example.com", password="password", is_active=True
+        )
+        boards: list[Board] = [
+            Board.objects.create(title=f"Board {index}", user_id=cls.user) for index in range(ROWS)
+        ]
+        Board.objects.create(title="Other board", user_id=other)
+        cls.board = boards[0]
+        # Saved one by one so the denormalized task counters, if enabled, are kept.
+        tasks: list[Task] = [
+            Task.objects.create(title=f"Task {index}", board=cls.board) for index in range(ROWS)
+        ]
+        cls.task = tasks[0]
+
+    def setUp(self) -> None:
+        """Authenticate the requests as the owner of the boards."""
+        self.client.force_authenticate(self.user)
+
+    @staticmethod
+    def counter_queries(count: int) -> int:
+        """Return the number of queries added to a write by the board task counters.
+
+        Args:
+            count (int): The number of queries added when the counters are enabled.
+
+        Returns:
+            int: `count` if the counters are enabled, else 0.
+        """
+        return count if settings.TODOS_BOARD_TASK_COUNTERS else 0
+
+
+class BoardQueryCountTests(QueryCountTestCase):
+    """Query counts of the board list, detail and write endpoints."""
+
+    def test_list(self) -> None:
+        """The list runs the ETag aggregate and the page query."""
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/v1/boards/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), ROWS)
+
+    def test_list_with_counts(self) -> None:
+        """The task counts of all the boards are loaded by one more query."""
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/v1/boards/?include=counts")
+        self.assertEqual(response.status_code, 200)
+        counts: dict[str, dict] = {
+            board["id"]: board["task_counts"] for board in response.data["results"]
+        }
+        self.assertEqual(counts[str(self.board.id)]["todo"], ROWS)
+
+    def test_list_with_sparse_fields(self) -> None:
+        """Sparse fields do not add queries."""
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/v1/boards/?fields=id,title")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data["results"][0]), {"id", "title"})
+
+    def test_next_page(self) -> None:
+        """A cursor page runs the page query only, without the ETag aggregate."""
+        first = self.client.get("/api/v1/boards/?page_size=5")
+        with self.assertNumQueries(1):
+            response = self.client.get(first.data["next"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_detail(self) -> None:
+        """The detail is loaded by one query scoped to the owner."""
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/api/v1/boards/{self.board.id}/")
+        self.assertEqual(response.status_code, 200)
+
+    def test_update(self) -> None:
+        """An update loads the board and writes the changed column."""
+        with self.assertNumQueries(2):
+            response = self.client.patch(
+                f"/api/v1/boards/{self.board.id}/", {"title": "Renamed"}, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_destroy(self) -> None:
+        """A delete loads the board and soft deletes it, without touching its tasks."""
+        with self.assertNumQueries(2):
+            response = self.client.delete(f"/api/v1/boards/{self.board.id}/")
+        self.assertEqual(response.status_code, 204)
+
+
+class TaskQueryCountTests(QueryCountTestCase):
+    """Query counts of the task list, detail and write endpoints."""
+
+    def test_list(self) -> None:
+        """The list runs the ETag aggregate and the page query, with the owner joined."""
+        with self.assertNumQueries(2):
+            response = self.client.get(f"/api/v1/boards/{self.board.id}/tasks/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), ROWS)
+
+    def test_next_page(self) -> None:
+        """A cursor page runs the page query only, without the ETag aggregate."""
+        first = self.client.get(f"/api/v1/boards/{self.board.id}/tasks/?page_size=5")
+        with self.assertNumQueries(1):
+            response = self.client.get(first.data["next"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertIn("ETag", first.headers)
+        self.assertNotIn("ETag", response.headers)
+
+    def test_filtered_and_ordered_list(self) -> None:
+        """Filters and ordering do not add queries."""
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                f"/api/v1/boards/{self.board.id}/tasks/?status=todo&ordering=-updated_at"
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), ROWS)
+
+    def test_detail(self) -> None:
+        """The detail is loaded by one query scoped to the owner of the board."""
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/api/v1/boards/{self.board.id}/tasks/{self.task.id}/")
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_of_another_user(self) -> None:
+        """A task of another user is not found in the same single query."""
+        other_board: Board = Board.objects.exclude(user_id=self.user).get()
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/api/v1/boards/{other_board.id}/tasks/{self.task.id}/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_create(self) -> None:
+        """A create loads the board of the owner and inserts the task."""
+        # With counters: one counter update.
+        with self.assertNumQueries(2 + self.counter_queries(1)):
+            response = self.client.post(
+                f"/api/v1/boards/{self.board.id}/tasks/", {"title": "New"}, format="json"
+            )
+        self.assertEqual(response.status_code, 201)
+
+    def test_update(self) -> None:
+        """An update loads the task and writes the changed columns."""
+        # With counters: the savepoint of the row lock, and two counter updates.
+        with self.assertNumQueries(2 + self.counter_queries(4)):
+            response = self.client.patch(
+                f"/api/v1/boards/{self.board.id}/tasks/{self.task.id}/",
+                {"status": "done"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_destroy(self) -> None:
+        """A delete loads the task and soft deletes it."""
+        # With counters: the savepoint of the row lock, and one counter update.
+        with self.assertNumQueries(2 + self.counter_queries(3)):
+            response = self.client.delete(f"/api/v1/boards/{self.board.id}/tasks/{self.task.id}/")
+        self.assertEqual(response.status_code, 204)
+
+    def test_move(self) -> None:
+        """A move is one conditional UPDATE in a savepoint, then the task is loaded."""
+        # With counters: two counter updates.
+        with self.assertNumQueries(4 + self.counter_queries(2)):
+            response = self.client.post(
+                f"/api/v1/boards/{self.board.id}/tasks/{self.task.id}/move/",
+                {"expected_status": "todo", "status": "done"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_conflicting_move(self) -> None:
+        """A move from an outdated status runs the same queries and changes no counter."""
+        with self.assertNumQueries(4):
+            response = self.client.post(
+                f"/api/v1/boards/{self.board.id}/tasks/{self.task.id}/move/",
+                {"expected_status": "done", "status": "todo"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 409)
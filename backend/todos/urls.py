@@ -9,10 +9,11 @@ mapping URL paths to their corresponding view functions or classes.
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 from rest_framework_nested.routers import NestedDefaultRouter
-from todos.views import BoardViewSetV1, TaskViewSetV1
+from todos.views import BoardViewSetV1, SearchViewSetV1, TaskViewSetV1
 
 ToDosRouterV1 = DefaultRouter()
 ToDosRouterV1.register(r"boards", BoardViewSetV1, basename="boards_v1")
+ToDosRouterV1.register(r"search", SearchViewSetV1, basename="search_v1")
 
 boards_router = NestedDefaultRouter(ToDosRouterV1, r"boards", lookup="board")
 boards_router.register(r"tasks", TaskViewSetV1, basename="tasks_v1")
@@ -4,9 +4,10 @@ Package include views for the todos app.
 This module contains the views for the todos app, which handle HTTP requests and responses.
 """
 
-from .v1 import BoardViewSetV1, TaskViewSetV1
+from .v1 import BoardViewSetV1, SearchViewSetV1, TaskViewSetV1
 
 __all__ = [
     "BoardViewSetV1",
     "TaskViewSetV1",
+    "SearchViewSetV1",
 ]
@@ -7,15 +7,18 @@ tailored to different API versions.
 Exported Classes:
 - BoardViewSetV1: ViewSet for CRUD operations on boards.
 - TaskViewSetV1: ViewSet for CRUD operations on tasks.
+- SearchViewSetV1: ViewSet for the full-text search of boards and tasks.
 
 Typical usage example:
     from users.views import UserViewSetV1
 """
 
 from .board import BoardViewSet as BoardViewSetV1
+from .search import SearchViewSet as SearchViewSetV1
 from .task import TaskViewSet as TaskViewSetV1
 
 __all__ = [
     "BoardViewSetV1",
     "TaskViewSetV1",
+    "SearchViewSetV1",
 ]
@@ -12,42 +12,81 @@ Example:
     from todos.views import BoardViewSetV1
 """
 
-from typing import List, Type
+from datetime import datetime
+from typing import Any, List, Type
 from uuid import UUID
 
-from django.db.models import QuerySet
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.http import HttpResponseBase
 from rest_framework import status
+from rest_framework.decorators import action
 from rest_framework.permissions import BasePermission, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
-from todos.models import Board
-from todos.serializers import BoardSerializerV1
+from todos.broker import publish_board_event
+from todos.counters import annotate_task_counts, refresh_task_counters
+from todos.mixins import (
+    AsyncReadMixin,
+    ConditionalListMixin,
+    FastListMixin,
+    SparseFieldsMixin,
+)
+from todos.models import Board, Task
+from todos.pagination import BoardCursorPagination, is_pagination_disabled
+from todos.serializers import BoardSerializerV1, BoardSummarySerializerV1
+from todos.sync import (
+    changed_after,
+    delta_response,
+    get_since,
+    get_since_id,
+    get_sync_limit,
+)
 
 
 # pylint: disable=too-many-ancestors
-class BoardViewSet(ModelViewSet):
+class BoardViewSet(
+    AsyncReadMixin, ConditionalListMixin, SparseFieldsMixin, FastListMixin, ModelViewSet
+):
     """Board ViewSet handling board for version 1 of the API.
 
-    This viewset allows authenticated users to do CRUD operations on boards.
+    This viewset allows authenticated users to do CRUD operations on boards. The list
+    and retrieve actions are served by async handlers when `TODOS_ASYNC_VIEWS` is set.
+    List pages without task counts are serialized from `values_list()` rows. The read
+    actions return only the fields requested with `?fields=`. Archiving a board
+    cascades to its tasks with set-based updates.
 
     Attributes:
         queryset (QuerySet[Board]): All board objects.
         serializer_class (BoardSerializerV1): Serializer used for board details.
         permission_classes (list[BasePermission]): List of permission classes
                                                    required to access the endpoints.
+        pagination_class (BoardCursorPagination): Cursor pagination ordered by creation time.
     Methods:
+        include_counts: Checks whether the per-status task counts were requested.
         get_queryset: Returns the queryset of boards filtered by the authenticated user.
+        get_sync_queryset: Returns the boards of the user changed since a timestamp.
+        get_serializer_class: Returns the serializer class for the current action.
+        get_version_querysets: Returns the querysets whose rows make up the board list.
+        get_archived_queryset: Returns the archived boards of the authenticated user.
         list: Returns a list of all boards.
+        alist: Returns a list of all boards using the async ORM.
         retrieve: Returns a board by their primary key.
+        aretrieve: Returns a board by their primary key using the async ORM.
         create: Creates a new board.
         update: Updates an existing board.
         destroy: Deletes a board.
+        archive: Archives a board and all its tasks.
+        unarchive: Restores an archived board and its tasks.
+        archived: Returns a list of the archived boards.
     """
 
     queryset: QuerySet[Board] = Board.objects.all()
     serializer_class: Type[BoardSerializerV1] = BoardSerializerV1
     permission_classes: List[Type[BasePermission]] = [IsAuthenticated]
+    pagination_class: Type[BoardCursorPagination] = BoardCursorPagination
 
     def get_queryset(self) -> QuerySet[Board]:
         """Return the queryset of boards filtered by the authenticated user.
@@ -58,24 +97,177 @@ class BoardViewSet(ModelViewSet):
         Returns:
             QuerySet[Board]: A queryset of boards owned by the authenticated user.
         """
-        return self.queryset.filter(user_id=self.request.user.id, is_archived=False)
+        boards: QuerySet[Board] = self.queryset.filter(
+            user_id=self.request.user.id, is_archived=False
+        )
+        if self.include_counts():
+            boards = annotate_task_counts(boards)
+        return boards
+
+    def get_sync_queryset(self, since: datetime, since_id: UUID | None) -> QuerySet[Board]:
+        """Return the boards of the user changed since the timestamp, archived ones included.
+
+        Args:
+            since (datetime): Only boards updated after this timestamp are returned.
+            since_id (UUID | None): The id of the last board returned at `since`, if any.
+
+        Returns:
+            QuerySet[Board]: A queryset of boards owned by the authenticated user.
+        """
+        boards: QuerySet[Board] = self.queryset.filter(
+            changed_after(since, since_id), user_id=self.request.user.id
+        ).order_by("updated_at", "id")
+        if self.include_counts():
+            boards = annotate_task_counts(boards)
+        return boards
+
+    def _serialize_many(self, boards: List[Board]) -> Any:
+        """Return the serialized data of the boards."""
+        return self.get_serializer(boards, many=True).data
 
-    def list(self, request: Request, *args, **kwargs) -> Response:
-        """Return a list of all boards.
+    def include_counts(self) -> bool:
+        """Check whether the per-status task counts were requested with `?include=counts`.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if the counts should be included in a list or retrieve response.
+        """
+        includes: list[str] = self.request.query_params.get("include", "").split(",")
+        return self.action in ("list", "retrieve") and "counts" in includes
+
+    def get_serializer_class(self) -> Type[BoardSerializerV1]:
+        """Return the serializer class for the current action.
+
+        Args:
+            None
+
+        Returns:
+            Type[BoardSerializerV1]: Serializer with task counts if they were requested.
+        """
+        if self.include_counts():
+            return BoardSummarySerializerV1
+        return self.serializer_class
+
+    def get_version_querysets(self) -> list[QuerySet[Model]]:
+        """Return the querysets whose rows make up the board list.
+
+        With `?include=counts` the tasks of the boards are part of the list as well.
+
+        Args:
+            None
+
+        Returns:
+            list[QuerySet[Model]]: The boards and, if counted, the tasks of the user.
+        """
+        user_id: Any = self.request.user.id
+        querysets: list[QuerySet[Model]] = [
+            self.queryset.filter(user_id=user_id, is_archived=False)
+        ]
+        if self.include_counts():
+            querysets.append(
+                Task.objects.filter(
+                    board__user_id=user_id, board__is_archived=False, is_archived=False
+                )
+            )
+        return querysets
+
+    def list(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        """Return a page of boards.
+
+        Boards are paginated with a cursor, so the listing runs a single query. The
+        previous, unpaginated list is returned when `?paginate=false` is passed. The
+        404 response for a user without boards is kept only when the
+        `TODOS_EMPTY_BOARD_LIST_404` compatibility setting is enabled. With
+        `?include=counts` every board carries its per-status task counts. A request
+        whose `If-None-Match` matches the ETag of the list gets a 304 response. With
+        `?since=<timestamp>` only the boards changed since then are returned, together
+        with tombstones of the deleted and archived ones, at most `TODOS_SYNC_MAX_ROWS`
+        per response.
 
         Args:
             request (Request): The incoming HTTP request.
 
         Returns:
-            Response: A Response object containing serialized board's data.
+            HttpResponseBase: A Response object containing serialized board's data.
+        """
+        since: datetime | None = get_since(request)
+        since_id: UUID | None = get_since_id(request)
+
+        etag, last_modified = self.get_list_validators()
+        not_modified: HttpResponseBase | None = self.get_not_modified_response(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        if since is not None:
+            limit: int = get_sync_limit()
+            changed: list[Board] = list(self.get_sync_queryset(since, since_id)[:limit])
+            return self.set_list_validators(
+                delta_response(changed, since, since_id, self._serialize_many),
+                etag,
+                last_modified,
+            )
+
+        boards: QuerySet[Board] = self.get_list_rows(self.sparse_queryset(self.get_queryset()))
+        paginated: bool = not is_pagination_disabled(request)
+
+        page: list[Board] | None = self.paginate_queryset(boards) if paginated else list(boards)
+        return self._list_response(page, paginated, etag, last_modified)
+
+    async def alist(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        """Return a page of boards like `list`, awaiting the queries.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Returns:
+            HttpResponseBase: A Response object containing serialized board's data.
         """
-        boards: QuerySet[Board] = self.get_queryset()
-        if not boards.exists():
+        since: datetime | None = get_since(request)
+        since_id: UUID | None = get_since_id(request)
+
+        etag, last_modified = await self.aget_list_validators()
+        not_modified: HttpResponseBase | None = self.get_not_modified_response(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        if since is not None:
+            limit: int = get_sync_limit()
+            changed: list[Board] = [
+                board async for board in self.get_sync_queryset(since, since_id)[:limit]
+            ]
+            return self.set_list_validators(
+                delta_response(changed, since, since_id, self._serialize_many),
+                etag,
+                last_modified,
+            )
+
+        boards: QuerySet[Board] = self.get_list_rows(self.sparse_queryset(self.get_queryset()))
+        paginated: bool = not is_pagination_disabled(request)
+
+        page: list[Board] | None = (
+            await self.apaginate_queryset(boards)
+            if paginated
+            else [board async for board in boards]
+        )
+        return self._list_response(page, paginated, etag, last_modified)
+
+    def _list_response(
+        self, page: List[Board] | None, paginated: bool, etag: str | None, last_modified: Any
+    ) -> Response:
+        """Return the response of the list actions for the fetched boards."""
+        if not page and settings.TODOS_EMPTY_BOARD_LIST_404:
             return Response({"detail": "No boards found."}, status=status.HTTP_404_NOT_FOUND)
 
-        serializer: BoardSerializerV1 = self.get_serializer(boards, many=True)
+        data: Any = self.serialize_list(page)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        if paginated:
+            response: Response = self.get_paginated_response(data)
+        else:
+            response = Response(data, status=status.HTTP_200_OK)
+        self.set_list_validators(response, etag, last_modified)
+        return response
 
     def retrieve(self, request: Request, *args, **kwargs) -> Response:
         """Return a board by their primary key.
@@ -89,7 +281,26 @@ class BoardViewSet(ModelViewSet):
         """
         try:
             pk: UUID | None = kwargs.get("pk")
-            board: Board | None = self.get_queryset().get(pk=pk)
+            board: Board | None = self.sparse_queryset(self.get_queryset()).get(pk=pk)
+        except Board.DoesNotExist:
+            return Response({"detail": "Board not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer: BoardSerializerV1 = self.get_serializer(board)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    async def aretrieve(self, request: Request, *args, **kwargs) -> Response:
+        """Return a board by their primary key like `retrieve`, awaiting the query.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            pk (uuid): The primary key of the board to retrieve.
+
+        Returns:
+            Response: A Response object containing the board's data or an error message.
+        """
+        try:
+            pk: UUID | None = kwargs.get("pk")
+            board: Board | None = await self.sparse_queryset(self.get_queryset()).aget(pk=pk)
         except Board.DoesNotExist:
             return Response({"detail": "Board not found."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -135,6 +346,9 @@ class BoardViewSet(ModelViewSet):
     def destroy(self, request: Request, *args, **kwargs) -> Response:
         """Delete a board.
 
+        The board is soft deleted in a single UPDATE. The board and its tasks are
+        removed later by the `purgedeleted` command, in bounded batches.
+
         Args:
             request (Request): The incoming HTTP request.
             pk (uuid): The primary key of the board to delete.
@@ -148,7 +362,86 @@ class BoardViewSet(ModelViewSet):
         except Board.DoesNotExist:
             return Response({"detail": "Board not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        board.delete()
+        board.soft_delete()
         return Response(
             {"detail": "Board deleted successfully."}, status=status.HTTP_204_NO_CONTENT
         )
+
+    def get_archived_queryset(self) -> QuerySet[Board]:
+        """Return the archived boards of the authenticated user, deleted ones excluded.
+
+        Returns:
+            QuerySet[Board]: A queryset of archived boards owned by the authenticated user.
+        """
+        return self.queryset.filter(
+            user_id=self.request.user.id, is_archived=True, deleted_at__isnull=True
+        )
+
+    def _set_archived(self, board: Board, archived: bool) -> Response:
+        """Archive or restore the board and its tasks, with their counters, atomically."""
+        with transaction.atomic():
+            if archived:
+                board.archive()
+            else:
+                board.unarchive()
+            if settings.TODOS_BOARD_TASK_COUNTERS:
+                refresh_task_counters([board.pk])
+            publish_board_event(board.pk, "archived" if archived else "unarchived", [])
+
+        serializer: BoardSerializerV1 = self.get_serializer(board)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["post"], url_path="archive")
+    def archive(self, request: Request, *args, **kwargs) -> Response:
+        """Archive a board together with all its tasks.
+
+        The board and its tasks are updated with set-based UPDATE statements in one
+        transaction, so the cost does not depend on loading the tasks.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            pk (uuid): The primary key of the board to archive.
+
+        Returns:
+            Response: A Response object containing the archived board's data or an error message.
+        """
+        try:
+            pk: UUID | None = kwargs.get("pk")
+            board: Board = self.get_queryset().get(pk=pk)
+        except Board.DoesNotExist:
+            return Response({"detail": "Board not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        return self._set_archived(board, True)
+
+    @action(detail=True, methods=["post"], url_path="unarchive")
+    def unarchive(self, request: Request, *args, **kwargs) -> Response:
+        """Restore an archived board together with its tasks that were not deleted.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            pk (uuid): The primary key of the board to restore.
+
+        Returns:
+            Response: A Response object containing the restored board's data or an error message.
+        """
+        try:
+            pk: UUID | None = kwargs.get("pk")
+            board: Board = self.get_archived_queryset().get(pk=pk)
+        except Board.DoesNotExist:
+            return Response({"detail": "Board not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        return self._set_archived(board, False)
+
+    @action(detail=False, methods=["get"], url_path="archived")
+    def archived(self, request: Request, *args, **kwargs) -> Response:
+        """Return a page of the archived boards.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Returns:
+            Response: A Response object containing serialized board's data.
+        """
+        boards: QuerySet[Board] = self.get_list_rows(self.get_archived_queryset())
+        page: list[Board] | None = self.paginate_queryset(boards)
+        return self.get_paginated_response(self.serialize_list(page))
@@ -0,0 +1,125 @@
+"""
+Search viewset for API version 1.
+
+This module provides the full-text search over the boards and tasks of the
+authenticated user.
+
+Classes:
+    SearchViewSetV1: ViewSet searching the boards and tasks of the user in API v1.
+
+Example:
+    from todos.views import SearchViewSetV1
+"""
+
+from typing import List, Type
+
+from django.db.models import QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import BasePermission, IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import ModelSerializer
+from rest_framework.viewsets import GenericViewSet
+from todos.mixins import AsyncReadMixin
+from todos.models import Board, Task
+from todos.pagination import SearchPagination
+from todos.search import get_search_text, search
+from todos.serializers import BoardSerializerV1, TaskSerializerV1
+
+SEARCH_TYPE_QUERY_PARAM: str = "type"
+
+
+# pylint: disable=too-many-ancestors
+class SearchViewSet(AsyncReadMixin, GenericViewSet):
+    """Search ViewSet for version 1 of the API.
+
+    `GET /search/?q=<text>` returns the tasks of all the user's boards whose title or
+    description match the text, best matches first; `&type=boards` searches the boards
+    instead. The matches are found with the GIN index of the search vectors and the
+    ranked results are paginated with limit and offset.
+
+    Attributes:
+        permission_classes (list[BasePermission]): List of permission classes
+                                                   required to access the endpoint.
+        pagination_class (SearchPagination): Limit/offset pagination without a COUNT query.
+        serializer_classes (dict[str, ModelSerializer]): Serializer used per search type.
+    Methods:
+        get_search_type: Returns the searched model, "tasks" or "boards".
+        get_serializer_class: Returns the serializer of the searched model.
+        get_queryset: Returns the ranked matches among the rows of the user.
+        list: Returns a page of ranked matches.
+        alist: Returns a page of ranked matches using the async ORM.
+    """
+
+    permission_classes: List[Type[BasePermission]] = [IsAuthenticated]
+    pagination_class: Type[SearchPagination] = SearchPagination
+    serializer_classes: dict[str, Type[ModelSerializer]] = {
+        "tasks": TaskSerializerV1,
+        "boards": BoardSerializerV1,
+    }
+
+    def get_search_type(self) -> str:
+        """Return the searched model, "tasks" (default) or "boards".
+
+        Returns:
+            str: The value of the `type` query parameter.
+
+        Raises:
+            ValidationError: If the type is not supported.
+        """
+        search_type: str = self.request.query_params.get(SEARCH_TYPE_QUERY_PARAM, "tasks")
+        if search_type not in self.serializer_classes:
+            expected: str = ", ".join(self.serializer_classes)
+            raise ValidationError({SEARCH_TYPE_QUERY_PARAM: [f"Expected one of: {expected}."]})
+        return search_type
+
+    def get_serializer_class(self) -> Type[ModelSerializer]:
+        """Return the serializer of the searched model.
+
+        Returns:
+            Type[ModelSerializer]: The board or task serializer.
+        """
+        return self.serializer_classes[self.get_search_type()]
+
+    def get_queryset(self) -> QuerySet[Board] | QuerySet[Task]:
+        """Return the ranked matches among the non-archived rows of the user.
+
+        Returns:
+            QuerySet[Board] | QuerySet[Task]: The matches annotated with their rank.
+        """
+        user_id = self.request.user.id
+        if self.get_search_type() == "boards":
+            queryset: QuerySet = Board.objects.filter(
+                user_id=user_id, deleted_at__isnull=True, is_archived=False
+            )
+        else:
+            queryset = Task.objects.filter(
+                board__user_id=user_id, board__deleted_at__isnull=True, is_archived=False
+            )
+        return search(queryset, get_search_text(self.request))
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """Return a page of ranked matches.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Returns:
+            Response: A Response object containing the serialized matches.
+        """
+        page: list = self.paginate_queryset(self.get_queryset())
+        serializer: ModelSerializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    async def alist(self, request: Request, *args, **kwargs) -> Response:
+        """Return a page of ranked matches like `list`, awaiting the query.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Returns:
+            Response: A Response object containing the serialized matches.
+        """
+        page: list = await self.apaginate_queryset(self.get_queryset())
+        serializer: ModelSerializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
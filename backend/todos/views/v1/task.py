@@ -12,46 +12,113 @@ Example:
     from todos.views import TaskViewSetV1
 """
 
-from typing import List, Type
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime
+from typing import Any, List, Type
 from uuid import UUID
 
-from django.db.models import QuerySet
-from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+from django.http import HttpResponseBase
+from django.shortcuts import aget_object_or_404, get_object_or_404
+from django.utils import timezone
 from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.filters import BaseFilterBackend
 from rest_framework.permissions import BasePermission, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
+from todos.broker import publish_board_event
+from todos.counters import refresh_task_counters, track_task_move
+from todos.filters import TaskFilter, TaskOrderingFilter
+from todos.mixins import (
+    AsyncReadMixin,
+    ConditionalListMixin,
+    FastListMixin,
+    SparseFieldsMixin,
+)
 from todos.models import Board, Task
-from todos.serializers import TaskSerializerV1
+from todos.pagination import (
+    TaskCursorPagination,
+    is_pagination_disabled,
+    is_streaming_requested,
+)
+from todos.serializers import TaskMoveSerializerV1, TaskSerializerV1
+from todos.sync import (
+    changed_after,
+    delta_response,
+    get_since,
+    get_since_id,
+    get_sync_limit,
+)
+
+MAX_BULK_ITEMS: int = 10000
+
+
+def _parse_id(value: Any) -> UUID | None:
+    """Return the value as UUID, or None if it is not a valid task id."""
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _index_errors(errors: list | dict) -> dict[int, Any]:
+    """Return the errors of a `many=True` serializer keyed by the index of the item."""
+    if isinstance(errors, dict):
+        return {int(index): detail for index, detail in errors.items()}
+    return {index: detail for index, detail in enumerate(errors) if detail}
 
 
 # pylint: disable=too-many-ancestors
-class TaskViewSet(ModelViewSet):
+class TaskViewSet(
+    AsyncReadMixin, ConditionalListMixin, SparseFieldsMixin, FastListMixin, ModelViewSet
+):
     """Task ViewSet handling tasks for version 1 of the API.
 
-    This viewset allows authenticated users to do CRUD operations on tasks.
+    This viewset allows authenticated users to do CRUD operations on tasks. The list
+    and retrieve actions are served by async handlers when `TODOS_ASYNC_VIEWS` is set.
+    Every write publishes a diff event to the WebSocket subscribers of the board.
+    List pages are serialized from `values_list()` rows. The read actions return only
+    the fields requested with `?fields=`. The list is filtered by status, completion
+    and date ranges and ordered by a whitelisted field in SQL, see `todos.filters`.
 
     Attributes:
         queryset (QuerySet[Task]): All task objects.
         serializer_class (TaskSerializerV1): Serializer used for task details.
         permission_classes (list[BasePermission]): List of permission classes
                                                    required to access the endpoints.
+        pagination_class (TaskCursorPagination): Cursor pagination ordered by creation time.
+        filter_backends (list[BaseFilterBackend]): Filters and ordering of the list.
     Methods:
         get_queryset: Returns the queryset of tasks filtered by the authenticated user.
+        get_sync_queryset: Returns the tasks of the board changed since a timestamp.
+        order_list: Returns the tasks in the order of the paginated list.
         list: Returns a list of all tasks.
+        alist: Returns a list of all tasks using the async ORM.
         retrieve: Returns a task by their primary key.
+        aretrieve: Returns a task by their primary key using the async ORM.
         perform_create: Creates a new task.
         update: Updates an existing task.
         destroy: Deletes a task.
+        move: Moves a task to another status if it still has the expected one.
+        bulk: Creates, updates or deletes many tasks at once.
     """
 
     serializer_class: Type[TaskSerializerV1] = TaskSerializerV1
     permission_classes: List[Type[BasePermission]] = [IsAuthenticated]
+    pagination_class: Type[TaskCursorPagination] = TaskCursorPagination
+    filter_backends: List[Type[BaseFilterBackend]] = [TaskFilter, TaskOrderingFilter]
 
     def get_queryset(self) -> QuerySet[Task]:
         """Return the queryset of tasks filtered by the authenticated user and board id.
 
+        The ownership of the board is checked by joining `board__user_id` in the same
+        SQL statement, so no separate board lookup is needed. Tasks of deleted boards
+        waiting for the purge are not accessible.
+
         Args:
             None
 
@@ -60,22 +127,161 @@ class TaskViewSet(ModelViewSet):
         """
         board_id: UUID = self.kwargs.get("board_pk")
 
-        get_object_or_404(Board, pk=board_id)
+        return Task.objects.filter(
+            board_id=board_id,
+            board__user_id=self.request.user.id,
+            board__deleted_at__isnull=True,
+            is_archived=False,
+        )
+
+    def write_transaction(self) -> AbstractContextManager:
+        """Return the transaction of a single task write.
+
+        With the board task counters enabled, the task is locked while it is updated
+        or deleted (see `get_object_for_write`), which needs a transaction.
 
-        return Task.objects.filter(board_id=board_id, is_archived=False)
+        Returns:
+            AbstractContextManager: An atomic block, or a no-op without counters.
+        """
+        return transaction.atomic() if settings.TODOS_BOARD_TASK_COUNTERS else nullcontext()
+
+    def get_object_for_write(self, pk: UUID | None) -> Task:
+        """Return the task to update or delete.
 
-    def list(self, request: Request, *args, **kwargs) -> Response:
-        """Return a list of tasks.
+        With the board task counters enabled, the row is locked with `FOR UPDATE`, so
+        the values the task is loaded with, from which the counter changes are
+        computed, cannot be changed by a concurrent write before this one commits.
 
         Args:
-            request (Request): The incoming HTTP request.
+            pk (UUID | None): The primary key of the task.
 
         Returns:
-            Response: A Response object containing serialized task data.
+            Task: The task, 404 if it is not found.
         """
         queryset: QuerySet[Task] = self.get_queryset()
-        serializer: TaskSerializerV1 = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        if settings.TODOS_BOARD_TASK_COUNTERS:
+            queryset = queryset.select_for_update(of=("self",))
+        return get_object_or_404(queryset, pk=pk)
+
+    def get_sync_queryset(self, since: datetime, since_id: UUID | None) -> QuerySet[Task]:
+        """Return the tasks of the board changed since the timestamp, archived ones included.
+
+        Args:
+            since (datetime): Only tasks updated after this timestamp are returned.
+            since_id (UUID | None): The id of the last task returned at `since`, if any.
+
+        Returns:
+            QuerySet[Task]: A queryset of tasks owned by the authenticated user.
+        """
+        return Task.objects.filter(
+            changed_after(since, since_id),
+            board_id=self.kwargs.get("board_pk"),
+            board__user_id=self.request.user.id,
+            board__deleted_at__isnull=True,
+        ).order_by("updated_at", "id")
+
+    def order_list(self, queryset: QuerySet[Task]) -> QuerySet[Task]:
+        """Return the tasks in the order of the paginated list.
+
+        Args:
+            queryset (QuerySet[Task]): The tasks of the list.
+
+        Returns:
+            QuerySet[Task]: The tasks ordered by the `ordering` parameter or by creation time.
+        """
+        return queryset.order_by(*self.paginator.get_ordering(self.request, queryset, self))
+
+    def _serialize_many(self, tasks: List[Task]) -> Any:
+        """Return the serialized data of the tasks."""
+        return self.get_serializer(tasks, many=True).data
+
+    def list(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        """Return a page of tasks.
+
+        Tasks are paginated with a cursor ordered by `(created_at, id)`, or by the field
+        of `?ordering=`, and filtered by `?status=`, `?completed=` and the date ranges
+        of `TaskFilter`. The previous, unpaginated list of all tasks is returned when
+        `?paginate=false` is passed, and streamed as it is read from the database when
+        `?stream=true` is passed.
+        A request whose `If-None-Match` matches the ETag of the list gets a 304 response.
+        With `?since=<timestamp>` only the tasks changed since then are returned,
+        together with tombstones of the deleted and archived ones, at most
+        `TODOS_SYNC_MAX_ROWS` per response; the filters do not apply to the delta sync.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Returns:
+            HttpResponseBase: A Response object containing serialized task data.
+        """
+        since: datetime | None = get_since(request)
+        since_id: UUID | None = get_since_id(request)
+
+        etag, last_modified = self.get_list_validators()
+        not_modified: HttpResponseBase | None = self.get_not_modified_response(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        queryset: QuerySet[Task] = self.get_list_rows(
+            self.sparse_queryset(self.filter_queryset(self.get_queryset()))
+        )
+
+        if since is not None:
+            limit: int = get_sync_limit()
+            tasks: list[Task] = list(self.get_sync_queryset(since, since_id)[:limit])
+            response: HttpResponseBase = delta_response(
+                tasks, since, since_id, self._serialize_many
+            )
+        elif is_streaming_requested(request):
+            response = self.get_streaming_response(self.order_list(queryset))
+        elif is_pagination_disabled(request):
+            rows: list[Any] = list(self.order_list(queryset))
+            response = Response(self.serialize_list(rows), status=status.HTTP_200_OK)
+        else:
+            page: list[Task] | None = self.paginate_queryset(queryset)
+            response = self.get_paginated_response(self.serialize_list(page))
+
+        return self.set_list_validators(response, etag, last_modified)
+
+    async def alist(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        """Return a page of tasks like `list`, awaiting the queries.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Returns:
+            HttpResponseBase: A Response object containing serialized task data.
+        """
+        since: datetime | None = get_since(request)
+        since_id: UUID | None = get_since_id(request)
+
+        etag, last_modified = await self.aget_list_validators()
+        not_modified: HttpResponseBase | None = self.get_not_modified_response(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        queryset: QuerySet[Task] = self.get_list_rows(
+            self.sparse_queryset(self.filter_queryset(self.get_queryset()))
+        )
+
+        if since is not None:
+            limit: int = get_sync_limit()
+            tasks: list[Task] = [
+                task async for task in self.get_sync_queryset(since, since_id)[:limit]
+            ]
+            response: HttpResponseBase = delta_response(
+                tasks, since, since_id, self._serialize_many
+            )
+        elif is_streaming_requested(request):
+            response = self.aget_streaming_response(self.order_list(queryset))
+        elif is_pagination_disabled(request):
+            rows: list[Any] = [row async for row in self.order_list(queryset)]
+            response = Response(self.serialize_list(rows), status=status.HTTP_200_OK)
+        else:
+            page: list[Task] | None = await self.apaginate_queryset(queryset)
+            response = self.get_paginated_response(self.serialize_list(page))
+
+        return self.set_list_validators(response, etag, last_modified)
 
     def retrieve(self, request: Request, *args, **kwargs) -> Response:
         """Return a task by their primary key.
@@ -86,12 +292,25 @@ class TaskViewSet(ModelViewSet):
         Returns:
             Response: A Response object containing serialized task data.
         """
-        board_id: UUID = self.kwargs.get("board_pk")
         pk: UUID | None = kwargs.get("pk")
 
-        task: Task = get_object_or_404(
-            Task, pk=pk, board_id=board_id, board_user_id=request.user.id
-        )
+        task: Task = get_object_or_404(self.sparse_queryset(self.get_queryset()), pk=pk)
+
+        serializer: TaskSerializerV1 = self.get_serializer(task)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    async def aretrieve(self, request: Request, *args, **kwargs) -> Response:
+        """Return a task by their primary key like `retrieve`, awaiting the query.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            pk (UUID): The primary key of the task to retrieve.
+        Returns:
+            Response: A Response object containing serialized task data.
+        """
+        pk: UUID | None = kwargs.get("pk")
+
+        task: Task = await aget_object_or_404(self.sparse_queryset(self.get_queryset()), pk=pk)
 
         serializer: TaskSerializerV1 = self.get_serializer(task)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -105,11 +324,14 @@ class TaskViewSet(ModelViewSet):
             Response: A Response object containing the created task's data.
         """
         board_id: UUID = self.kwargs.get("board_pk")
-        board: Board = get_object_or_404(Board, id=board_id, user_id=request.user)
+        board: Board = get_object_or_404(
+            Board, id=board_id, user_id=request.user, deleted_at__isnull=True
+        )
 
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         serializer.save(board=board)
+        publish_board_event(board.id, "created", [serializer.data])
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def update(self, request: Request, *args, **kwargs) -> Response:
@@ -121,35 +343,267 @@ class TaskViewSet(ModelViewSet):
         Returns:
             Response: A Response object containing the updated task's data.
         """
-        board_id: UUID = self.kwargs.get("board_pk")
         pk: UUID | None = kwargs.get("pk")
 
-        task: Task = get_object_or_404(
-            Task, pk=pk, board_id=board_id, board_user_id=request.user.id
-        )
-        serializer: TaskSerializerV1 = self.get_serializer(
-            task,
-            data=request.data,
-            partial=kwargs.get("partial", False),
-        )
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+        with self.write_transaction():
+            task: Task = self.get_object_for_write(pk)
+            serializer: TaskSerializerV1 = self.get_serializer(
+                task,
+                data=request.data,
+                partial=kwargs.get("partial", False),
+            )
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+        publish_board_event(task.board_id, "updated", [serializer.data])
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def destroy(self, request: Request, *args, **kwargs) -> Response:
         """Delete a task.
 
+        The task is soft deleted, so the delta sync can report it as a tombstone.
+
         Args:
             request (Request): The incoming HTTP request.
             pk (UUID): The primary key of the task to delete.
         Returns:
             Response: A Response object indicating the deletion status.
         """
-        board_id: UUID = self.kwargs.get("board_pk")
         pk: UUID | None = kwargs.get("pk")
 
-        task: Task = get_object_or_404(
-            Task, pk=pk, board_id=board_id, board_user_id=request.user.id
-        )
-        task.delete()
+        with self.write_transaction():
+            task: Task = self.get_object_for_write(pk)
+            task.soft_delete()
+        publish_board_event(task.board_id, "deleted", [{"id": task.id}])
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=True, methods=["post"], url_path="move")
+    def move(self, request: Request, *args, **kwargs) -> Response:
+        """Move a task to another status if it still has the expected status.
+
+        The transition is a single conditional `UPDATE ... WHERE status = <expected>`,
+        which also sets `completed` and `completed_at`, so concurrent moves of the same
+        task cannot overwrite each other: the first one wins and the others get 409
+        with the current task.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            pk (UUID): The primary key of the task to move.
+        Returns:
+            Response: A Response object containing the task, with 409 if its status
+                      was not the expected one.
+        """
+        pk: UUID | None = kwargs.get("pk")
+        board_id: UUID = self.kwargs.get("board_pk")
+
+        move: TaskMoveSerializerV1 = TaskMoveSerializerV1(data=request.data)
+        move.is_valid(raise_exception=True)
+        expected_status: str = move.validated_data["expected_status"]
+        new_status: str = move.validated_data["status"]
+
+        moved: bool = False
+        if new_status != expected_status:
+            now = timezone.now()
+            with transaction.atomic():
+                moved = bool(
+                    Task.objects.filter(
+                        Exists(
+                            Board.objects.filter(
+                                pk=OuterRef("board_id"),
+                                user_id=request.user.id,
+                                deleted_at__isnull=True,
+                            )
+                        ),
+                        pk=pk,
+                        board_id=board_id,
+                        is_archived=False,
+                        status=expected_status,
+                    ).update(
+                        status=new_status,
+                        updated_at=now,
+                        **Task.completion_values(new_status, expected_status, now),
+                    )
+                )
+                if moved:
+                    track_task_move(board_id, expected_status, new_status)
+
+        task: Task = get_object_or_404(self.get_queryset(), pk=pk)
+        serializer: TaskSerializerV1 = self.get_serializer(task)
+        if not moved and (new_status != expected_status or task.status != expected_status):
+            return Response(serializer.data, status=status.HTTP_409_CONFLICT)
+
+        if moved:
+            publish_board_event(task.board_id, "updated", [serializer.data])
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["post", "patch", "delete"], url_path="bulk")
+    def bulk(self, request: Request, *args, **kwargs) -> Response:
+        """Create, update or delete many tasks at once.
+
+        The payload is a list of tasks for POST, a list of partial tasks with their `id`
+        for PATCH and a list of task ids for DELETE. Valid items are written with bulk
+        queries inside a single transaction, invalid ones are reported per item.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Returns:
+            Response: A Response object containing the written tasks and per-item errors.
+        """
+        items: Any = request.data
+        if not isinstance(items, list):
+            return Response(
+                {"detail": "Expected a list of items."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > MAX_BULK_ITEMS:
+            return Response(
+                {"detail": f"Too many items, the limit is {MAX_BULK_ITEMS}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if request.method == "POST":
+            return self._bulk_create(items)
+        if request.method == "PATCH":
+            return self._bulk_update(items)
+        return self._bulk_destroy(items)
+
+    def _bulk_response(
+        self, results: list, errors: dict[int, Any], success_status: int
+    ) -> Response:
+        """Build the response of a bulk operation.
+
+        Args:
+            results (list): The written tasks or the ids of the deleted tasks.
+            errors (dict[int, Any]): Errors keyed by the index of the failed item.
+            success_status (int): Status code used when no item failed.
+
+        Returns:
+            Response: 400 if every item failed, 207 if some failed, `success_status` otherwise.
+        """
+        if not errors:
+            response_status: int = success_status
+        elif results:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+
+        return Response(
+            {
+                "results": results,
+                "errors": [
+                    {"index": index, "errors": detail} for index, detail in sorted(errors.items())
+                ],
+            },
+            status=response_status,
+        )
+
+    def _bulk_create(self, items: list) -> Response:
+        """Create the valid tasks with `bulk_create`.
+
+        Args:
+            items (list): The tasks to create.
+
+        Returns:
+            Response: A Response object containing the created tasks and per-item errors.
+        """
+        board_id: UUID = self.kwargs.get("board_pk")
+        board: Board = get_object_or_404(
+            Board, id=board_id, user_id=self.request.user, deleted_at__isnull=True
+        )
+
+        serializer: TaskSerializerV1 = self.get_serializer(data=items, many=True)
+        errors: dict[int, Any] = {}
+        if not serializer.is_valid():
+            errors = _index_errors(serializer.errors)
+            valid: list = [item for index, item in enumerate(items) if index not in errors]
+            serializer = self.get_serializer(data=valid, many=True)
+            serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            serializer.save(board=board)
+        publish_board_event(board.id, "created", serializer.data)
+        return self._bulk_response(serializer.data, errors, status.HTTP_201_CREATED)
+
+    def _bulk_update(self, items: list) -> Response:
+        """Update the valid tasks with `bulk_update`.
+
+        Args:
+            items (list): The partial tasks to update, each containing its `id`.
+
+        Returns:
+            Response: A Response object containing the updated tasks and per-item errors.
+        """
+        errors: dict[int, Any] = {}
+        ids: dict[int, UUID] = {}
+        for index, item in enumerate(items):
+            task_id: UUID | None = _parse_id(item.get("id")) if isinstance(item, dict) else None
+            if task_id is None:
+                errors[index] = {"id": ["A valid task id is required."]}
+            else:
+                ids[index] = task_id
+
+        with transaction.atomic():
+            tasks: dict[UUID, Task] = (
+                self.get_queryset().select_for_update().in_bulk(list(ids.values()))
+            )
+            for index, task_id in ids.items():
+                if task_id not in tasks:
+                    errors[index] = {"id": ["Task not found."]}
+
+            indexes: list[int] = [index for index in ids if index not in errors]
+            serializer: TaskSerializerV1 = self.get_serializer(
+                [tasks[ids[index]] for index in indexes],
+                data=[items[index] for index in indexes],
+                many=True,
+                partial=True,
+            )
+            if not serializer.is_valid():
+                invalid: dict[int, Any] = _index_errors(serializer.errors)
+                errors.update({indexes[position]: detail for position, detail in invalid.items()})
+                indexes = [index for index in indexes if index not in errors]
+                serializer = self.get_serializer(
+                    [tasks[ids[index]] for index in indexes],
+                    data=[items[index] for index in indexes],
+                    many=True,
+                    partial=True,
+                )
+                serializer.is_valid(raise_exception=True)
+
+            serializer.save()
+        publish_board_event(self.kwargs.get("board_pk"), "updated", serializer.data)
+        return self._bulk_response(serializer.data, errors, status.HTTP_200_OK)
+
+    def _bulk_destroy(self, items: list) -> Response:
+        """Soft delete the tasks with a single UPDATE statement.
+
+        Args:
+            items (list): The ids of the tasks to delete.
+
+        Returns:
+            Response: A Response object containing the deleted ids and per-item errors.
+        """
+        errors: dict[int, Any] = {}
+        ids: dict[int, UUID] = {}
+        for index, item in enumerate(items):
+            task_id: UUID | None = _parse_id(item)
+            if task_id is None:
+                errors[index] = {"id": ["A valid task id is required."]}
+            else:
+                ids[index] = task_id
+
+        with transaction.atomic():
+            tasks: QuerySet[Task] = self.get_queryset().filter(pk__in=list(ids.values()))
+            found: set[UUID] = set(tasks.values_list("pk", flat=True))
+            now = timezone.now()
+            tasks.update(deleted_at=now, is_archived=True, updated_at=now)
+            if settings.TODOS_BOARD_TASK_COUNTERS and found:
+                refresh_task_counters([self.kwargs.get("board_pk")])
+
+        for index, task_id in ids.items():
+            if task_id not in found:
+                errors[index] = {"id": ["Task not found."]}
+
+        deleted: list[str] = [str(task_id) for task_id in ids.values() if task_id in found]
+        publish_board_event(
+            self.kwargs.get("board_pk"), "deleted", [{"id": task_id} for task_id in deleted]
+        )
+        return self._bulk_response(deleted, errors, status.HTTP_200_OK)
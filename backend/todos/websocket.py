@@ -0,0 +1,148 @@
+"""
+WebSocket endpoint of the real-time board events.
+
+`ws(s)://<host>/api/v1/boards/<board id>/events/` streams the events published by
+`todos.broker` for the board as JSON text frames. The connection is authenticated
+with the `access_token` cookie, like the REST API, and refused with close code 4403
+unless the board belongs to the user, or with 4404 if the board id is not a UUID.
+It is closed with code 4401 when the access token expires, so the client refreshes
+the token and reconnects. Clients never send messages; anything they send is ignored.
+
+Functions:
+    board_events: ASGI application serving the WebSocket of a board.
+
+Example:
+    from todos.websocket import board_events
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.http.cookie import parse_cookie
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.tokens import Token
+from todos.broker import board_channel, get_broker
+from todos.models import Board
+from users.authenticate import CustomCookiesAuthentication
+from users.models import User
+
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+CLOSE_UNAVAILABLE: int = 1013
+CLOSE_TOKEN_EXPIRED: int = 4401
+CLOSE_FORBIDDEN: int = 4403
+CLOSE_NOT_FOUND: int = 4404
+
+
+def _headers(scope: dict[str, Any]) -> dict[str, str]:
+    """Return the headers of the handshake request keyed by lowercase name."""
+    return {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+
+
+def _origin_allowed(headers: dict[str, str]) -> bool:
+    """Return whether the handshake comes from an allowed origin.
+
+    Browsers send cookies with cross-site WebSocket handshakes, so the origin is
+    checked against the CORS origins outside of development.
+    """
+    if settings.DEBUG:
+        return True
+    return headers.get("origin") in settings.CORS_ALLOWED_ORIGINS
+
+
+def _authenticate(headers: dict[str, str], board_id: uuid.UUID) -> Token | None:
+    """Return the access token of the handshake if its user owns the board.
+
+    Args:
+        headers (dict[str, str]): The headers of the handshake request.
+        board_id (uuid.UUID): The id of the requested board.
+
+    Returns:
+        Token | None: The validated access token, or None if the connection is refused.
+    """
+    raw_token: str | None = parse_cookie(headers.get("cookie", "")).get(
+        settings.SIMPLE_JWT["ACCESS_TOKEN_NAME"]
+    )
+    if not raw_token:
+        return None
+
+    authentication = CustomCookiesAuthentication()
+    try:
+        token: Token = authentication.get_validated_token(raw_token)
+        user: User = authentication.get_user(token)
+        owned: bool = Board.objects.filter(
+            pk=board_id, user_id=user.id, deleted_at__isnull=True
+        ).exists()
+    except (AuthenticationFailed, InvalidToken, TokenError):
+        return None
+    finally:
+        close_old_connections()
+
+    return token if owned else None
+
+
+async def _forward(channel: str, send: Send) -> None:
+    """Send the events published on the channel to the client."""
+    async for message in get_broker().subscribe(channel):
+        await send({"type": "websocket.send", "text": json.dumps(message, cls=JSONEncoder)})
+
+
+async def board_events(scope: dict[str, Any], receive: Receive, send: Send, board_id: str) -> None:
+    """Serve the WebSocket of a board until either side closes it.
+
+    Args:
+        scope (dict[str, Any]): The ASGI connection scope.
+        receive (Receive): Awaits the next message from the client.
+        send (Send): Sends a message to the client.
+        board_id (str): The id of the board.
+    """
+    if (await receive())["type"] != "websocket.connect":
+        return
+
+    if get_broker() is None:
+        await send({"type": "websocket.close", "code": CLOSE_UNAVAILABLE})
+        return
+
+    try:
+        board_uuid: uuid.UUID = uuid.UUID(board_id)
+    except ValueError:
+        await send({"type": "websocket.close", "code": CLOSE_NOT_FOUND})
+        return
+
+    headers: dict[str, str] = _headers(scope)
+    token: Token | None = None
+    if _origin_allowed(headers):
+        token = await sync_to_async(_authenticate)(headers, board_uuid)
+    if token is None:
+        await send({"type": "websocket.close", "code": CLOSE_FORBIDDEN})
+        return
+
+    await send({"type": "websocket.accept"})
+    forward: asyncio.Task = asyncio.create_task(_forward(board_channel(board_uuid), send))
+    expires_at: float = token.get("exp", 0)
+    try:
+        while True:
+            timeout: float = expires_at - time.time()
+            if timeout <= 0:
+                await send({"type": "websocket.close", "code": CLOSE_TOKEN_EXPIRED})
+                return
+            try:
+                message: dict[str, Any] = await asyncio.wait_for(receive(), timeout)
+            except asyncio.TimeoutError:
+                continue
+            if message["type"] == "websocket.disconnect":
+                return
+    finally:
+        forward.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await forward
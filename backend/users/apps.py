@@ -5,6 +5,7 @@ This file defines the application configuration for the Users app.
 """
 
 from django.apps import AppConfig
+from django.core.checks import Tags, register
 
 
 class UsersConfig(AppConfig):
@@ -12,3 +13,16 @@ class UsersConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "users"
+
+    def ready(self) -> None:
+        """Register the signal handlers and the throttle cache check of the Users application.
+
+        The throttles of the project authenticate and limit the users, so their cache
+        is checked here.
+        """
+        # pylint: disable=import-outside-toplevel,unused-import
+        from users import signals  # noqa: F401
+
+        from backend.throttling import check_throttle_cache
+
+        register(check_throttle_cache, Tags.caches)
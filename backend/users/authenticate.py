@@ -1,10 +1,30 @@
 """Custom authentication class that enforces CSRF protection."""
 
+import time
+from functools import lru_cache
+
 from django.conf import settings
 from rest_framework import exceptions
 from rest_framework.authentication import CSRFCheck
 from rest_framework.request import Request
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from users.cache import get_token_cache, get_user_cache
+from users.models import User
+
+
+@lru_cache(maxsize=None)
+def get_csrf_check() -> CSRFCheck:
+    """Return the CSRF checker shared by all requests.
+
+    The checker keeps no per-request state, so one instance is built per process.
+
+    Returns:
+        CSRFCheck: The CSRF checker.
+    """
+    return CSRFCheck(get_response=lambda request: None)
 
 
 class CustomCookiesAuthentication(JWTAuthentication):
@@ -12,6 +32,8 @@ class CustomCookiesAuthentication(JWTAuthentication):
 
     Methods:
         _enforce_csrf: Enforces CSRF validation on the request.
+        get_validated_token: Returns the validated token, using the token cache.
+        get_user: Returns the user of the token, using the authentication user cache.
         authenticate: Authenticates the user and enforces CSRF validation.
     """
 
@@ -24,12 +46,71 @@ class CustomCookiesAuthentication(JWTAuthentication):
         Raises:
             PermissionDenied: If CSRF validation fails.
         """
-        check = CSRFCheck(get_response=lambda request: None)
+        check: CSRFCheck = get_csrf_check()
         check.process_request(request)
         reason = check.process_view(request, None, (), {})
         if reason:
             raise exceptions.PermissionDenied(f"CSRF Failed: {reason}")
 
+    def get_validated_token(self, raw_token: bytes | str) -> Token:
+        """Return the validated token, using the token cache.
+
+        Validated tokens are cached by their signature until they expire, so a token
+        is decoded and verified once instead of on every request.
+
+        Args:
+            raw_token (bytes | str): The encoded JWT.
+
+        Raises:
+            InvalidToken: If the token is not valid.
+
+        Returns:
+            Token: The validated token.
+        """
+        token_cache = get_token_cache()
+        if token_cache is None:
+            return super().get_validated_token(raw_token)
+
+        if isinstance(raw_token, str):
+            raw_token = raw_token.encode()
+        signature: bytes = raw_token.rpartition(b".")[2]
+
+        cached: tuple[bytes, Token] | None = token_cache.get(signature)
+        if cached is not None and cached[0] == raw_token:
+            return cached[1]
+
+        validated_token: Token = super().get_validated_token(raw_token)
+        ttl: float = validated_token.get("exp", 0) - time.time()
+        if ttl > 0:
+            token_cache.set(signature, (raw_token, validated_token), ttl)
+        return validated_token
+
+    def get_user(self, validated_token: Token) -> User:
+        """Return the user of the token, using the authentication user cache.
+
+        Args:
+            validated_token (Token): The validated JWT.
+
+        Raises:
+            AuthenticationFailed: If the user does not exist or is inactive.
+
+        Returns:
+            User: The authenticated user.
+        """
+        user_cache = get_user_cache()
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_cache is None or user_id is None:
+            return super().get_user(validated_token)
+
+        user: User | None = user_cache.get(user_id)
+        if user is None:
+            user = super().get_user(validated_token)
+            user_cache.set(user_id, user)
+        elif api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        return user
+
     def authenticate(self, request: Request):
         """Authenticate the user and enforces CSRF validation.
 
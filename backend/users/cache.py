@@ -0,0 +1,253 @@
+"""
+Cache of the users resolved during authentication.
+
+The JWT already carries the user id, so the `User` row resolved for it is cached to
+avoid a `SELECT` on every API request. Entries expire after a short TTL and are
+invalidated when the user is saved or deleted.
+
+Two backends are available, selected by the `USERS_AUTH_CACHE_BACKEND` setting:
+- "local": a per-process LRU cache. Invalidation only reaches the current process,
+  other workers see changes once the TTL expires.
+- "django": the Django cache configured by `USERS_AUTH_CACHE_ALIAS`, shared by all workers.
+Any other value disables the cache.
+
+The claims of validated access tokens are cached per process as well, keyed by the
+token signature, until the token expires (`USERS_AUTH_TOKEN_CACHE_MAX_SIZE`, 0 disables).
+
+Classes:
+    LocalTTLCache: Thread-safe per-process LRU cache with TTL-based eviction.
+    LocalUserCache: Per-process LRU cache of users.
+    DjangoUserCache: User cache stored in a Django cache backend.
+
+Functions:
+    get_user_cache: Return the user cache configured in the settings.
+    get_token_cache: Return the cache of validated tokens configured in the settings.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from users.models import User
+
+
+class LocalTTLCache:
+    """Thread-safe per-process LRU cache with TTL-based eviction.
+
+    Attributes:
+        max_size (int): Maximum number of cached entries.
+
+    Methods:
+        get: Return the cached value, or None.
+        set: Cache the value for the given number of seconds.
+        delete: Remove the value from the cache.
+        clear: Remove all values from the cache.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of cached entries.
+        """
+        self.max_size: int = max_size
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or None if it is missing or expired.
+
+        Args:
+            key (Any): The key of the entry.
+
+        Returns:
+            Any: The cached value.
+        """
+        with self._lock:
+            entry: tuple[float, Any] | None = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        """Cache the value, evicting the least recently used entry when full.
+
+        Args:
+            key (Any): The key of the entry.
+            value (Any): The value to cache.
+            ttl (float): Number of seconds after which the entry expires.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Any) -> None:
+        """Remove the value from the cache.
+
+        Args:
+            key (Any): The key of the entry.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+class LocalUserCache:
+    """Per-process LRU cache of users with TTL-based eviction.
+
+    Users are copied on the way in and out, so requests never share an instance.
+
+    Attributes:
+        ttl (float): Number of seconds after which an entry expires.
+
+    Methods:
+        get: Return a copy of the cached user, or None.
+        set: Cache the user.
+        delete: Remove the user from the cache.
+        clear: Remove all users from the cache.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of cached users.
+            ttl (float): Number of seconds after which an entry expires.
+        """
+        self.ttl: float = ttl
+        self._cache: LocalTTLCache = LocalTTLCache(max_size)
+
+    def get(self, user_id: Any) -> User | None:
+        """Return a copy of the cached user, or None if it is missing or expired.
+
+        Args:
+            user_id (Any): The primary key of the user.
+
+        Returns:
+            User | None: The cached user.
+        """
+        user: User | None = self._cache.get(str(user_id))
+        return copy.copy(user) if user is not None else None
+
+    def set(self, user_id: Any, user: User) -> None:
+        """Cache the user.
+
+        Args:
+            user_id (Any): The primary key of the user.
+            user (User): The user to cache.
+        """
+        self._cache.set(str(user_id), copy.copy(user), self.ttl)
+
+    def delete(self, user_id: Any) -> None:
+        """Remove the user from the cache.
+
+        Args:
+            user_id (Any): The primary key of the user.
+        """
+        self._cache.delete(str(user_id))
+
+    def clear(self) -> None:
+        """Remove all users from the cache."""
+        self._cache.clear()
+
+
+class DjangoUserCache:
+    """User cache stored in a Django cache backend, shared by all workers.
+
+    Attributes:
+        alias (str): Alias of the Django cache.
+        ttl (float): Number of seconds after which an entry expires.
+
+    Methods:
+        get: Return the cached user, or None.
+        set: Cache the user.
+        delete: Remove the user from the cache.
+        clear: Remove all users from the cache.
+    """
+
+    key_prefix: str = "users:auth:"
+
+    def __init__(self, alias: str, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            alias (str): Alias of the Django cache.
+            ttl (float): Number of seconds after which an entry expires.
+        """
+        self.alias: str = alias
+        self.ttl: float = ttl
+
+    def get(self, user_id: Any) -> User | None:
+        """Return the cached user, or None if it is missing or expired.
+
+        Args:
+            user_id (Any): The primary key of the user.
+
+        Returns:
+            User | None: The cached user.
+        """
+        return caches[self.alias].get(f"{self.key_prefix}{user_id}")
+
+    def set(self, user_id: Any, user: User) -> None:
+        """Cache the user.
+
+        Args:
+            user_id (Any): The primary key of the user.
+            user (User): The user to cache.
+        """
+        caches[self.alias].set(f"{self.key_prefix}{user_id}", user, timeout=self.ttl)
+
+    def delete(self, user_id: Any) -> None:
+        """Remove the user from the cache.
+
+        Args:
+            user_id (Any): The primary key of the user.
+        """
+        caches[self.alias].delete(f"{self.key_prefix}{user_id}")
+
+    def clear(self) -> None:
+        """Remove all users from the cache.
+
+        The Django cache may be shared with other data, so the entries simply expire.
+        """
+
+
+@lru_cache(maxsize=None)
+def get_user_cache() -> LocalUserCache | DjangoUserCache | None:
+    """Return the user cache configured in the settings.
+
+    Returns:
+        LocalUserCache | DjangoUserCache | None: The user cache, or None if disabled.
+    """
+    backend: str = settings.USERS_AUTH_CACHE_BACKEND
+    if backend == "local":
+        return LocalUserCache(settings.USERS_AUTH_CACHE_MAX_SIZE, settings.USERS_AUTH_CACHE_TTL)
+    if backend == "django":
+        return DjangoUserCache(settings.USERS_AUTH_CACHE_ALIAS, settings.USERS_AUTH_CACHE_TTL)
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_token_cache() -> LocalTTLCache | None:
+    """Return the cache of validated tokens configured in the settings.
+
+    Returns:
+        LocalTTLCache | None: The token cache, or None if disabled.
+    """
+    max_size: int = settings.USERS_AUTH_TOKEN_CACHE_MAX_SIZE
+    return LocalTTLCache(max_size) if max_size > 0 else None
@@ -0,0 +1,84 @@
+"""
+Command to measure the authentication overhead per request.
+
+This command authenticates the same cookie-based request many times, once through
+the plain simplejwt path (full JWT decode, new CSRF checker and user query on every
+request) and once through `CustomCookiesAuthentication`, and prints the average time
+per request of both, so regressions of the authentication fast path can be tracked.
+"""
+
+import sys
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.authentication import CSRFCheck
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+from users.authenticate import CustomCookiesAuthentication
+from users.cache import get_token_cache, get_user_cache
+
+
+class Command(BaseCommand):
+    """Command to measure the authentication overhead per request."""
+
+    help = "Measure the authentication overhead per request."
+
+    def add_arguments(self, parser) -> None:
+        """Add the command arguments.
+
+        Args:
+            parser (CommandParser): The parser of the command arguments.
+        """
+        parser.add_argument("--iterations", type=int, default=1000)
+        parser.add_argument("--username", type=str, default=None)
+
+    def _measure(self, authenticate: Callable[[], object], iterations: int) -> float:
+        """Return the average duration of one authentication in microseconds."""
+        authenticate()
+        start: float = time.perf_counter()
+        for _ in range(iterations):
+            authenticate()
+        return (time.perf_counter() - start) / iterations * 1_000_000
+
+    def handle(self, *args, **options) -> None:
+        """Authenticate a request repeatedly through both paths and print the timings."""
+        users = get_user_model().objects.filter(is_active=True)
+        if options["username"]:
+            users = users.filter(username=options["username"])
+        user = users.first()
+        if user is None:
+            raise CommandError("An active user is required to run the benchmark.")
+
+        iterations: int = options["iterations"]
+        raw_token: str = str(AccessToken.for_user(user))
+        django_request = RequestFactory().get("/api/v1/boards/")
+        django_request.COOKIES[settings.SIMPLE_JWT["AUTH_COOKIE"]] = raw_token
+        request: Request = Request(django_request)
+
+        baseline: JWTAuthentication = JWTAuthentication()
+
+        def authenticate_baseline() -> object:
+            validated_token = JWTAuthentication.get_validated_token(baseline, raw_token)
+            check = CSRFCheck(get_response=lambda request: None)
+            check.process_request(request)
+            check.process_view(request, None, (), {})
+            return JWTAuthentication.get_user(baseline, validated_token)
+
+        for cache in (get_token_cache(), get_user_cache()):
+            if cache is not None:
+                cache.clear()
+
+        results: dict[str, float] = {
+            "baseline": self._measure(authenticate_baseline, iterations),
+            "fast path": self._measure(
+                lambda: CustomCookiesAuthentication().authenticate(request), iterations
+            ),
+        }
+
+        for name, duration in results.items():
+            sys.stdout.write(f"{name}: {duration:.1f} us per request \n")
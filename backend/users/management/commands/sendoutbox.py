@@ -0,0 +1,175 @@
+"""
+Command to deliver the queued emails of the outbox.
+
+This command sends the pending emails of `EmailOutbox` in batches over a single
+reused SMTP connection. A batch is claimed in a short transaction and sent outside
+of it, so no row lock is held while talking to the SMTP server. Failed deliveries
+are retried with exponential backoff until the maximum number of attempts is
+reached. With `--loop` the command keeps polling the outbox, which is how it runs as
+a background worker.
+"""
+
+import sys
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from users.models import EmailOutbox
+from users.models.email_outbox import EmailStatusChoices
+
+
+class Command(BaseCommand):
+    """Command to deliver the queued emails of the outbox."""
+
+    help = "Send the pending emails of the outbox over a single SMTP connection."
+
+    def add_arguments(self, parser) -> None:
+        """Add the command arguments.
+
+        Args:
+            parser (CommandParser): The parser of the command arguments.
+        """
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--max-attempts", type=int, default=5)
+        parser.add_argument("--backoff", type=int, default=30, help="Base delay in seconds.")
+        parser.add_argument("--loop", action="store_true", help="Keep polling the outbox.")
+        parser.add_argument("--interval", type=float, default=5, help="Polling interval.")
+        parser.add_argument(
+            "--lease", type=int, default=600, help="Seconds a claimed batch is kept from others."
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Send the pending emails once, or keep polling the outbox with `--loop`."""
+        while True:
+            sent, failed = self.send_batch(
+                options["batch_size"], options["max_attempts"], options["backoff"], options["lease"]
+            )
+            if sent or failed:
+                sys.stdout.write(f"Sent {sent} emails, {failed} failed. \n")
+
+            if not options["loop"]:
+                return
+            if not sent and not failed:
+                time.sleep(options["interval"])
+
+    def send_batch(
+        self, batch_size: int, max_attempts: int, backoff: int, lease: int = 600
+    ) -> tuple[int, int]:
+        """Send one batch of due emails over a single SMTP connection.
+
+        The batch is claimed in a short transaction: its rows are locked with
+        `SKIP LOCKED` and their `next_attempt_at` is moved `lease` seconds ahead, so
+        other workers skip them once it commits. The emails are then sent outside of
+        any transaction, and every result is saved by its own UPDATE. The emails of a
+        worker stopped while sending are due again when their lease expires.
+
+        Args:
+            batch_size (int): Maximum number of emails sent in the batch.
+            max_attempts (int): Number of attempts after which an email is marked failed.
+            backoff (int): Base delay in seconds, doubled after every failed attempt.
+            lease (int): Seconds during which the claimed emails are not sent by others.
+
+        Returns:
+            tuple[int, int]: Number of sent and failed emails.
+        """
+        sent: int = 0
+        failed: int = 0
+
+        emails: list[EmailOutbox] = self._claim(batch_size, lease)
+        if not emails:
+            return sent, failed
+
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            for email in emails:
+                failed += 1
+                self._schedule_retry(email, error, max_attempts, backoff)
+                self._save_result(email)
+            return sent, failed
+
+        try:
+            for email in emails:
+                send_error: Exception | None = self._send(email, connection)
+                if send_error is None:
+                    sent += 1
+                else:
+                    failed += 1
+                    self._schedule_retry(email, send_error, max_attempts, backoff)
+                self._save_result(email)
+        finally:
+            connection.close()
+
+        return sent, failed
+
+    def _claim(self, batch_size: int, lease: int) -> list[EmailOutbox]:
+        """Claim a batch of due emails by moving their next attempt past the lease.
+
+        Args:
+            batch_size (int): Maximum number of emails claimed.
+            lease (int): Seconds during which the claimed emails are not due.
+
+        Returns:
+            list[EmailOutbox]: The claimed emails.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            emails: list[EmailOutbox] = list(
+                EmailOutbox.objects.select_for_update(skip_locked=True)
+                .filter(status=EmailStatusChoices.PENDING, next_attempt_at__lte=now)
+                .order_by("next_attempt_at")[:batch_size]
+            )
+            if emails:
+                EmailOutbox.objects.filter(pk__in=[email.pk for email in emails]).update(
+                    next_attempt_at=now + timedelta(seconds=lease)
+                )
+        return emails
+
+    @staticmethod
+    def _save_result(email: EmailOutbox) -> None:
+        """Save the result of a delivery attempt with a single UPDATE."""
+        email.save(update_fields=["status", "attempts", "next_attempt_at", "last_error", "sent_at"])
+
+    def _send(self, email: EmailOutbox, connection: BaseEmailBackend) -> Exception | None:
+        """Send the email over the open connection and mark it sent.
+
+        Args:
+            email (EmailOutbox): The email to send.
+            connection (BaseEmailBackend): The open email connection.
+
+        Returns:
+            Exception | None: The delivery error, or None if the email was sent.
+        """
+        message: EmailMessage = EmailMessage(
+            subject=email.subject,
+            body=email.body,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[email.recipient],
+            connection=connection,
+        )
+        try:
+            message.send()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return error
+
+        email.status = EmailStatusChoices.SENT
+        email.sent_at = timezone.now()
+        return None
+
+    def _schedule_retry(
+        self, email: EmailOutbox, error: Exception, max_attempts: int, backoff: int
+    ) -> None:
+        """Record a failed attempt and schedule the next one with exponential backoff."""
+        email.attempts += 1
+        email.last_error = str(error)
+        if email.attempts >= max_attempts:
+            email.status = EmailStatusChoices.FAILED
+        else:
+            delay: timedelta = timedelta(seconds=backoff * 2 ** (email.attempts - 1))
+            email.next_attempt_at = timezone.now() + delay
@@ -4,11 +4,16 @@ Exported Classes:
 - User: Custom user model extending Django's AbstractUser.
     Functions:
     - __str__: Returns the username of the user.
+- EmailOutbox: Outbox of emails delivered asynchronously.
+    Functions:
+    - __str__: Returns the subject and recipient of the email.
 
 Typical usage:
     from users.models import User
+    from users.models import EmailOutbox
 """
 
+from .email_outbox import EmailOutbox
 from .user import User
 
-__all__: list[str] = ["User"]
+__all__: list[str] = ["User", "EmailOutbox"]
@@ -0,0 +1,69 @@
+"""Defines the EmailOutbox model."""
+
+import uuid
+
+from django.db import models
+from django.utils import timezone
+
+
+# pylint: disable=too-many-ancestors
+class EmailStatusChoices(models.TextChoices):
+    """Enumeration for outbox email status choices.
+
+    Attributes:
+    PENDING (str): Represents an email waiting to be sent or retried.
+    SENT (str): Represents an email that has been delivered to the SMTP relay.
+    FAILED (str): Represents an email that could not be sent after all attempts.
+    """
+
+    PENDING = "pending", "Pending"
+    SENT = "sent", "Sent"
+    FAILED = "failed", "Failed"
+
+
+class EmailOutbox(models.Model):
+    """Outbox of emails delivered asynchronously by the `sendoutbox` command.
+
+    Attributes:
+        id (UUIDField): Unique identifier for the email.
+        recipient (str): The email address of the recipient.
+        subject (str): The subject of the email.
+        body (str): The plain text body of the email.
+        status (str): The delivery status of the email (e.g., pending, sent, failed).
+        attempts (int): The number of failed delivery attempts.
+        next_attempt_at (datetime): The date and time before which the email is not retried.
+        last_error (str): The error of the last failed delivery attempt.
+        created_at (datetime): The date and time when the email was queued.
+        sent_at (datetime): The date and time when the email was sent.
+
+    Methods:
+        __str__: Returns the subject and recipient of the email.
+    """
+
+    id: models.UUIDField = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    recipient: models.EmailField = models.EmailField()
+    subject: models.CharField = models.CharField(max_length=255)
+    body: models.TextField = models.TextField()
+    status: models.CharField = models.CharField(
+        choices=EmailStatusChoices, max_length=20, default=EmailStatusChoices.PENDING
+    )
+    attempts: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    next_attempt_at: models.DateTimeField = models.DateTimeField(default=timezone.now)
+    last_error: models.TextField = models.TextField(blank=True, default="")
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+    sent_at: models.DateTimeField = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        """Meta options for EmailOutbox.
+
+        Attributes:
+            indexes (list[models.Index]): Index used to fetch the emails due for delivery.
+        """
+
+        indexes: list[models.Index] = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_status_next_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Return the subject and recipient of the email."""
+        return f"{self.subject} <{self.recipient}>"
@@ -4,6 +4,7 @@ import uuid
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class User(AbstractUser):
@@ -37,6 +38,23 @@ class User(AbstractUser):
 
     REQUIRED_FIELDS: list[str] = ["email", "password"]
 
+    class Meta(AbstractUser.Meta):
+        """Meta options for User.
+
+        Attributes:
+            indexes (list[models.Index]): Index backing the keyset pagination of users.
+            constraints (list[models.UniqueConstraint]): Case-insensitive uniqueness of the
+                username and email, enforced by the database on insert.
+        """
+
+        indexes: list[models.Index] = [
+            models.Index(fields=["date_joined", "id"], name="user_joined_idx"),
+        ]
+        constraints: list[models.UniqueConstraint] = [
+            models.UniqueConstraint(Lower("username"), name="user_username_ci_unique"),
+            models.UniqueConstraint(Lower("email"), name="user_email_ci_unique"),
+        ]
+
     def __str__(self) -> str:
         """Return the username of the user."""
         return self.username
@@ -0,0 +1,28 @@
+"""
+Pagination classes for the users app.
+
+Classes:
+    UserCursorPagination: Keyset (cursor) pagination for users ordered by join date.
+
+Example:
+    from users.pagination import UserCursorPagination
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """Keyset (cursor) pagination for users.
+
+    Users are ordered by `(date_joined, id)`, so no COUNT over the whole user table
+    is needed and any page costs the same as the first one.
+
+    Attributes:
+        ordering (tuple[str, ...]): Fields used to order the paginated queryset.
+        page_size_query_param (str): Query parameter used to override the page size.
+        max_page_size (int): Upper bound for the page size requested by the client.
+    """
+
+    ordering: tuple[str, ...] = ("date_joined", "id")
+    page_size_query_param: str = "page_size"
+    max_page_size: int = 1000
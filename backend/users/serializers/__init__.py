@@ -5,6 +5,7 @@ This module provides versioned serializers for the User model, used in different
 
 Exported Classes:
 - UserDetailSerializerV1: Serializer for user details in version 1 of the API.
+- UserSummarySerializerV1: Serializer for the lightweight user representation in version 1.
 - RegisterSerializerV1: Serializer for user registration in version 1 of the API.
 - LoginSerializerV1: Serializer for user login in version 1 of the API.
 
@@ -18,10 +19,12 @@ from .v1 import (
     LoginSerializerV1,
     RegisterSerializerV1,
     UserDetailSerializerV1,
+    UserSummarySerializerV1,
 )
 
 __all__: list[str] = [
     "UserDetailSerializerV1",
+    "UserSummarySerializerV1",
     "RegisterSerializerV1",
     "LoginSerializerV1",
 ]
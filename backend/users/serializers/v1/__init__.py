@@ -2,6 +2,7 @@
 
 Exported Classes:
 - UserDetailSerializerV1: Serializer for user details in version 1 of the API.
+- UserSummarySerializerV1: Serializer for the lightweight user representation in version 1.
 - RegisterSerializerV1: Serializer for user registration in version 1 of the API.
 - LoginSerializerV1: Serializer for user login in version 1 of the API.
 """
@@ -9,9 +10,11 @@ Exported Classes:
 from .login import LoginSerializer as LoginSerializerV1
 from .register import RegisterSerializer as RegisterSerializerV1
 from .user import UserDetailSerializer as UserDetailSerializerV1
+from .user import UserSummarySerializer as UserSummarySerializerV1
 
 __all__: list[str] = [
     "UserDetailSerializerV1",
+    "UserSummarySerializerV1",
     "RegisterSerializerV1",
     "LoginSerializerV1",
 ]
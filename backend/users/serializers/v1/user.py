@@ -29,3 +29,35 @@ class UserDetailSerializer(serializers.ModelSerializer):
         fields: str = "__all__"
 
         read_only_fields: list[str] = ["id", "username", "email"]
+
+
+class UserSummarySerializer(serializers.ModelSerializer):
+    """Serializer for the lightweight user representation.
+
+    Used by the paginated user directory and the `me` endpoint. Only plain columns
+    are serialized, so the directory can load them with `only()`.
+
+    Attributes:
+        id (UUID): Unique identifier for the user.
+        username (str): Username used for login.
+        email (str): User's email address.
+        first_name (str): First name of the user.
+        last_name (str): Last name of the user.
+        is_active (bool): Indicates if the user account is active.
+        is_staff (bool): Indicates if the user has staff privileges.
+    """
+
+    class Meta:
+        """Meta options for UserSummarySerializer."""
+
+        model: Type[User] = User
+        fields: list[str] = [
+            "id",
+            "username",
+            "email",
+            "first_name",
+            "last_name",
+            "is_active",
+            "is_staff",
+        ]
+        read_only_fields: list[str] = fields
@@ -0,0 +1,28 @@
+"""
+Signal handlers for the users app.
+
+Functions:
+    invalidate_cached_user: Remove a saved or deleted user from the authentication cache.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from users.cache import get_user_cache
+from users.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance: User, **kwargs) -> None:
+    """Remove a saved or deleted user from the authentication cache.
+
+    Every save is treated as a change, which covers changes of `is_active` and of the
+    password.
+
+    Args:
+        sender (Type[User]): The model class that sent the signal.
+        instance (User): The saved or deleted user.
+    """
+    user_cache = get_user_cache()
+    if user_cache is not None:
+        user_cache.delete(instance.pk)
@@ -2,6 +2,7 @@
 Package containing test modules for the users app.
 
 Includes tests organized by categories:
+- commands: tests for the management commands of the users app.
 - models: tests for user-related data models.
 - serializers: tests for user data serialization and validation.
 - views: tests for user-related views and API endpoints.
@@ -0,0 +1 @@
+"""Management commands tests for the users app."""
@@ -0,0 +1,53 @@
+"""
+Tests of the `benchmarkauth` command.
+
+Classes:
+    BenchmarkAuthTests: The benchmark runs and its cached path makes no queries.
+"""
+
+import io
+from contextlib import redirect_stdout
+from typing import Callable
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from users.management.commands.benchmarkauth import Command
+from users.models import User
+
+ITERATIONS: int = 5
+
+
+class BenchmarkAuthTests(TestCase):
+    """The benchmark runs and its cached path makes no queries."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create the active user the benchmark authenticates."""
+        User.objects.create_user(
+            username="bench", email="bench@example.com", password="password", is_active=True
+        )
+
+    def test_cached_path_makes_no_queries(self) -> None:
+        """After its warm-up, the fast path authenticates without querying the database."""
+        queries: list[int] = []
+        measure = Command._measure  # pylint: disable=protected-access
+
+        def count_queries(command: Command, authenticate: Callable[[], object], iterations: int):
+            authenticate()
+            with CaptureQueriesContext(connection) as context:
+                duration: float = measure(command, authenticate, iterations)
+            queries.append(len(context.captured_queries))
+            return duration
+
+        output: io.StringIO = io.StringIO()
+        with mock.patch.object(Command, "_measure", count_queries), redirect_stdout(output):
+            call_command("benchmarkauth", iterations=ITERATIONS)
+
+        baseline, fast_path = queries
+        self.assertEqual(baseline, ITERATIONS + 1)
+        self.assertEqual(fast_path, 0)
+        self.assertIn("baseline:", output.getvalue())
+        self.assertIn("fast path:", output.getvalue())
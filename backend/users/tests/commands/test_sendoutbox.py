@@ -0,0 +1,70 @@
+"""
+Tests of the `sendoutbox` command.
+
+Classes:
+    SendOutboxTests: Delivery, retries and claims of the outbox emails.
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+from users.management.commands.sendoutbox import Command
+from users.models import EmailOutbox
+from users.models.email_outbox import EmailStatusChoices
+
+
+class SendOutboxTests(TransactionTestCase):
+    """Delivery, retries and claims of the outbox emails.
+
+    A `TransactionTestCase` is used so the command runs outside of a test transaction,
+    as it does in the worker.
+    """
+
+    def queue(self, **kwargs) -> EmailOutbox:
+        """Queue an email to a test recipient."""
+        return EmailOutbox.objects.create(
+            recipient="user@example.com", subject="Activate", body="Link", **kwargs
+        )
+
+    def test_sends_outside_of_a_transaction(self) -> None:
+        """The emails are sent with no transaction open and are marked sent."""
+        email: EmailOutbox = self.queue()
+        in_atomic_block: list[bool] = []
+        send = EmailMessage.send
+
+        def record_and_send(message: EmailMessage, *args, **kwargs) -> int:
+            in_atomic_block.append(connection.in_atomic_block)
+            return send(message, *args, **kwargs)
+
+        with mock.patch.object(EmailMessage, "send", record_and_send):
+            self.assertEqual(Command().send_batch(10, 5, 30), (1, 0))
+
+        self.assertEqual(in_atomic_block, [False])
+        self.assertEqual(len(mail.outbox), 1)
+        email.refresh_from_db()
+        self.assertEqual(email.status, EmailStatusChoices.SENT)
+        self.assertIsNotNone(email.sent_at)
+
+    def test_failed_send_is_retried_later(self) -> None:
+        """A failed delivery records the error and is scheduled after the backoff."""
+        email: EmailOutbox = self.queue()
+
+        with mock.patch.object(EmailMessage, "send", side_effect=OSError("Refused")):
+            self.assertEqual(Command().send_batch(10, 5, 30), (0, 1))
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, EmailStatusChoices.PENDING)
+        self.assertEqual((email.attempts, email.last_error), (1, "Refused"))
+        self.assertGreater(email.next_attempt_at, timezone.now() + timedelta(seconds=25))
+
+    def test_claimed_emails_are_skipped(self) -> None:
+        """An email claimed by another worker is not sent until its lease expires."""
+        self.queue(next_attempt_at=timezone.now() + timedelta(seconds=600))
+
+        self.assertEqual(Command().send_batch(10, 5, 30), (0, 0))
+        self.assertEqual(mail.outbox, [])
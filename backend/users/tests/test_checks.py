@@ -0,0 +1,32 @@
+"""
+Tests of the throttle cache system check.
+
+Classes:
+    ThrottleCacheCheckTests: The throttles warn about caches not shared by the workers.
+"""
+
+from django.test import SimpleTestCase, override_settings
+
+from backend.throttling import check_throttle_cache
+
+FILE_CACHE: dict = {"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache"}}
+REDIS_CACHE: dict = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
+
+
+class ThrottleCacheCheckTests(SimpleTestCase):
+    """The throttles warn about caches not shared by the workers."""
+
+    @override_settings(DEBUG=False, CACHES=FILE_CACHE)
+    def test_file_cache_in_production(self) -> None:
+        """The file cache is a warning in production."""
+        self.assertEqual([warning.id for warning in check_throttle_cache()], ["backend.W001"])
+
+    @override_settings(DEBUG=False, CACHES=REDIS_CACHE)
+    def test_redis_cache_in_production(self) -> None:
+        """The Redis cache passes."""
+        self.assertEqual(check_throttle_cache(), [])
+
+    @override_settings(DEBUG=True, CACHES=FILE_CACHE)
+    def test_file_cache_in_development(self) -> None:
+        """The single development worker may use the file cache."""
+        self.assertEqual(check_throttle_cache(), [])
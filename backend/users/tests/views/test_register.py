@@ -0,0 +1,95 @@
+"""
+Tests of the user registration endpoint.
+
+Classes:
+    ConcurrentRegistrationTests: Duplicate signups racing each other.
+"""
+
+import threading
+
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+from users.models import EmailOutbox, User
+
+REGISTER_URL: str = "/api/v1/auth/register/"
+THREADS: int = 8
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class ConcurrentRegistrationTests(TransactionTestCase):
+    """Duplicate signups racing each other.
+
+    Every request runs in its own thread with its own database connection, and the
+    threads are released together, so the inserts race instead of seeing each
+    other's committed user. A `TransactionTestCase` is needed for the threads to
+    share the committed rows.
+    """
+
+    def register_concurrently(self, payloads: list[dict[str, str]]) -> list[Response]:
+        """Send the registration requests at the same time, one thread per payload.
+
+        Args:
+            payloads (list[dict[str, str]]): The data of every registration request.
+
+        Returns:
+            list[Response]: The responses, in the order of the payloads.
+        """
+        barrier: threading.Barrier = threading.Barrier(len(payloads))
+        responses: list[Response | None] = [None] * len(payloads)
+
+        def register(index: int) -> None:
+            client: APIClient = APIClient()
+            try:
+                barrier.wait()
+                responses[index] = client.post(REGISTER_URL, payloads[index], format="json")
+            finally:
+                connection.close()
+
+        threads: list[threading.Thread] = [
+            threading.Thread(target=register, args=(index,)) for index in range(len(payloads))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return responses
+
+    def test_duplicate_signups_create_one_user(self) -> None:
+        """Exactly one signup succeeds, the others get 400 and queue no email."""
+        payload: dict[str, str] = {
+            "username": "racer",
+            "email": "racer@example.com",
+            "password": "Secret-password-1",
+        }
+        responses: list[Response] = self.register_concurrently([payload] * THREADS)
+
+        statuses: list[int] = sorted(response.status_code for response in responses)
+        self.assertEqual(statuses, [201] + [400] * (THREADS - 1))
+        self.assertEqual(User.objects.count(), 1)
+        self.assertEqual(EmailOutbox.objects.count(), 1)
+        self.assertEqual(EmailOutbox.objects.get().recipient, payload["email"])
+
+    def test_signups_differing_in_case_create_one_user(self) -> None:
+        """The username and email are unique case-insensitively under concurrency too."""
+        payloads: list[dict[str, str]] = [
+            {
+                "username": "Racer" if index % 2 else "racer",
+                "email": "RACER@example.com" if index % 2 else "racer@example.com",
+                "password": "Secret-password-1",
+            }
+            for index in range(THREADS)
+        ]
+        responses: list[Response] = self.register_concurrently(payloads)
+
+        self.assertEqual(sum(response.status_code == 201 for response in responses), 1)
+        self.assertTrue(
+            all(
+                response.data == {"detail": "User already exists."}
+                for response in responses
+                if response.status_code != 201
+            )
+        )
+        self.assertEqual(User.objects.count(), 1)
+        self.assertEqual(EmailOutbox.objects.count(), 1)
@@ -12,25 +12,27 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 from users.models import User
-from users.serializers import UserDetailSerializerV1
+from users.pagination import UserCursorPagination
+from users.serializers import UserDetailSerializerV1, UserSummarySerializerV1
 
 
 class UserProfileViewSet(GenericViewSet):
     """User ViewSet handling user details for version 1 of the API.
 
-    This viewset allows authenticated users to retrieve a list of all users or
-    fetch a specific user by their ID.
+    This viewset allows authenticated users to page through the user directory,
+    fetch a specific user by their ID or fetch their own profile.
 
     Attributes:
         queryset (QuerySet): All user objects.
         serializer_class (Type[Serializer]): Serializer used for user details.
         permission_classes (list): List of permission classes required to access the endpoints.
-        pagination_class (None): Pagination is disabled for this view.
+        pagination_class (UserCursorPagination): Cursor pagination of the user directory.
     Methods:
         get_permissions: Returns the list of permission instances required for the current action.
         get_serializer: Returns the appropriate serializer based on the action.
-        list: Returns a list of all users.
+        list: Returns a page of users.
         retrieve: Returns a user by their primary key.
+        me: Returns the authenticated user.
         create: Creates a new user if the provided data is valid.
         activate: Activates a user account by clicking the link with the token.
     """
@@ -38,10 +40,12 @@ class UserProfileViewSet(GenericViewSet):
     queryset: QuerySet[User] = User.objects.all()
     serializer_class: Type[UserDetailSerializerV1] = UserDetailSerializerV1
     permission_classes: List[Type[BasePermission]] = [IsAuthenticated]
-    pagination_class: None = None
+    pagination_class: Type[UserCursorPagination] = UserCursorPagination
 
     def list(self, request: Request, *args, **kwargs) -> Response:
-        """Return a list of all users.
+        """Return a page of users.
+
+        Only the columns of the lightweight user representation are loaded.
 
         Args:
             request (Request): The incoming HTTP request.
@@ -49,10 +53,13 @@ class UserProfileViewSet(GenericViewSet):
         Returns:
             Response: A Response object containing serialized user data.
         """
-        queryset: QuerySet[User] = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
+        queryset: QuerySet[User] = self.get_queryset().only(
+            *UserSummarySerializerV1.Meta.fields, "date_joined"
+        )
+        page: list[User] | None = self.paginate_queryset(queryset)
+        serializer = UserSummarySerializerV1(page, many=True)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.get_paginated_response(serializer.data)
 
     def retrieve(self, request: Request, pk: UUID, *args, **kwargs) -> Response:
         """Return a user by their primary key.
@@ -73,6 +80,22 @@ class UserProfileViewSet(GenericViewSet):
 
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=["get"])
+    def me(self, request: Request, *args, **kwargs) -> Response:
+        """Return the authenticated user.
+
+        The user is the one resolved from the token, so no additional query is made.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Returns:
+            Response: A Response object containing the authenticated user's data.
+        """
+        serializer = UserSummarySerializerV1(request.user)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     @action(
         detail=True,
         methods=["get"],
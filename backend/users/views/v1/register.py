@@ -16,16 +16,15 @@ from typing import List, Type
 from uuid import UUID
 
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
-from django.db import IntegrityError
-from django.db.models import Q, QuerySet
+from django.db import IntegrityError, transaction
+from django.db.models import QuerySet
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, BasePermission
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from users.models import User
+from users.models import EmailOutbox, User
 from users.serializers import RegisterSerializerV1
 
 
@@ -42,7 +41,7 @@ class UserRegisterView(APIView):
     Methods:
         get_serializer: Returns the serializer class for the current action.
         get_queryset: Returns the queryset of all user objects.
-        post: Creates a new user with the provided data.
+        post: Creates a new user and queues the activation email.
     """
 
     queryset: QuerySet[User] = User.objects.all()
@@ -73,6 +72,12 @@ class UserRegisterView(APIView):
     def post(self, request: Request, *args, **kwargs) -> Response:
         """Create a new user with the provided data.
 
+        The user is inserted right away and a duplicate username or email, compared
+        case-insensitively, is reported by the unique constraints of `User`, so the
+        check cannot race with concurrent signups. The activation email is queued in
+        the outbox in the same transaction and delivered by the `sendoutbox` worker,
+        so no SMTP round trip happens here.
+
         Args:
             request (Request): The incoming HTTP request containing user data.
 
@@ -82,34 +87,29 @@ class UserRegisterView(APIView):
         serializer: Type[RegisterSerializerV1] = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        users: QuerySet[User] = self.get_queryset().filter(
-            Q(username=serializer.validated_data["username"])
-            | Q(email=serializer.validated_data["email"])
-        )
-        if users.exists():
-            return Response({"detail": "User already exists."}, status=status.HTTP_400_BAD_REQUEST)
-
         try:
-            new_user: User = serializer.save()
+            with transaction.atomic():
+                new_user: User = serializer.save()
 
-            user_id: UUID = new_user.id
-            token: str = default_token_generator.make_token(new_user)
+                user_id: UUID = new_user.id
+                token: str = default_token_generator.make_token(new_user)
 
-            activation_link: str = (
-                f"http://localhost:8000/api/v1/profile/{user_id}/activate/{token}/"
-            )
+                activation_link: str = (
+                    f"http://localhost:8000/api/v1/profile/{user_id}/activate/{token}/"
+                )
 
-            send_mail(
-                subject="Activate your account",
-                message=f"Click the link to activate your account: {activation_link}",
-                from_email="noreply@yourdomain.com",
-                recipient_list=[new_user.email],
-            )
+                EmailOutbox.objects.create(
+                    recipient=new_user.email,
+                    subject="Activate your account",
+                    body=f"Click the link to activate your account: {activation_link}",
+                )
 
-        except (ValidationError, IntegrityError) as e:
+        except IntegrityError:
+            return Response({"detail": "User already exists."}, status=status.HTTP_400_BAD_REQUEST)
+        except ValidationError as e:
             return Response(
                 {
-                    "detail": "Error occurred during user creation or email sending.",
+                    "detail": "Error occurred during user creation.",
                     "error": str(e),
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
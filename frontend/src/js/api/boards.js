@@ -4,8 +4,8 @@ import { API_V1_BASE_URL } from './api.js';
 
 const csrfToken = getCsrfToken();
 
-export async function getBoards(isRetry = false) {
-    const response = await fetch(`${API_V1_BASE_URL}/boards/`, {
+export async function getBoardsPage(url, isRetry = false) {
+    const response = await fetch(url, {
         method: 'GET',
         headers: {
             'Content-Type': 'application/json',
@@ -15,7 +15,7 @@ export async function getBoards(isRetry = false) {
 
     if (response.status == 401 && !isRetry) {
         await refreshToken();
-        await getBoards(true);
+        return await getBoardsPage(url, true);
     }
 
     if (!response.ok) {
@@ -26,6 +26,11 @@ export async function getBoards(isRetry = false) {
   return await response.json();
 }
 
+// Returns one page, { results, next }; pass `next` back to load the following page.
+export async function getBoards(next = null) {
+    return await getBoardsPage(next || `${API_V1_BASE_URL}/boards/`);
+}
+
 export async function getBoard(board_id, isRetry = false) {
   const response = await fetch(`${API_V1_BASE_URL}/boards/${board_id}`, {
     method: 'GET',
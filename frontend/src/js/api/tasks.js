@@ -4,8 +4,8 @@ import { API_V1_BASE_URL } from './api.js';
 
 const csrfToken = getCsrfToken();
 
-export async function getTasks(board_id, isRetry = false) {
-    const response = await fetch(`${API_V1_BASE_URL}/boards/${board_id}/tasks/`, {
+export async function getTasksPage(url, isRetry = false) {
+    const response = await fetch(url, {
         method: 'GET',
         headers: {
             'Content-Type': 'application/json',
@@ -15,7 +15,7 @@ export async function getTasks(board_id, isRetry = false) {
 
     if (response.status == 401 && !isRetry) {
         await refreshToken();
-        return await getTasks(board_id, true);
+        return await getTasksPage(url, true);
     }
 
     if (!response.ok) {
@@ -26,8 +26,63 @@ export async function getTasks(board_id, isRetry = false) {
   return await response.json();
 }
 
-export async function getTask(board_id, task_id, isRetry = false) {
-  const response = await fetch(`${API_V1_BASE_URL}/boards/${board_id}/tasks/${task_id}/`, {
+function fieldsQuery(fields) {
+    return fields ? `?fields=${fields.join(',')}` : '';
+}
+
+// Filters are passed as query parameters, e.g. { status: 'done', ordering: '-updated_at' }.
+// Returns the first page, { results, next }; load the following ones with getTasksPage(next).
+export async function getTasks(board_id, fields = null, filters = {}) {
+    const params = new URLSearchParams(filters);
+    if (fields) params.set('fields', fields.join(','));
+    const query = params.toString();
+    return await getTasksPage(`${API_V1_BASE_URL}/boards/${board_id}/tasks/${query ? `?${query}` : ''}`);
+}
+
+// Pass back `next_since` and `next_since_id` of the previous response; repeat while `has_more`.
+export async function getTaskChanges(board_id, since, since_id = null) {
+    const params = new URLSearchParams({ since });
+    if (since_id) params.set('since_id', since_id);
+    const url = `${API_V1_BASE_URL}/boards/${board_id}/tasks/?${params}`;
+    return await getTasksPage(url);
+}
+
+export function subscribeTaskEvents(board_id, onEvent) {
+    const url = `${API_V1_BASE_URL.replace(/^http/, 'ws')}/boards/${board_id}/events/`;
+    let socket = null;
+    let closed = false;
+
+    const connect = () => {
+        socket = new WebSocket(url);
+        socket.onmessage = (message) => onEvent(JSON.parse(message.data));
+        socket.onclose = async (event) => {
+            if (closed || [4403, 4404, 1013].includes(event.code)) return;
+
+            if (event.code === 4401) {
+                try {
+                    await refreshToken();
+                } catch (error) {
+                    return;
+                }
+                connect();
+                return;
+            }
+
+            setTimeout(() => !closed && connect(), 5000);
+        };
+    };
+
+    connect();
+
+    return () => {
+        closed = true;
+        socket.close();
+    };
+}
+
+export async function getTask(board_id, task_id, fields = null, isRetry = false) {
+  const url = `${API_V1_BASE_URL}/boards/${board_id}/tasks/${task_id}/${fieldsQuery(fields)}`;
+  const response = await fetch(url, {
     method: 'GET',
     headers: {
       'Content-Type': 'application/json',
@@ -37,7 +92,7 @@ export async function getTask(board_id, task_id, isRetry = false) {
 
   if (response.status === 401 && !isRetry) {
     await refreshToken();
-    return await getTask(board_id, task_id, true);
+    return await getTask(board_id, task_id, fields, true);
   }
 
   if (!response.ok) {
@@ -107,6 +162,36 @@ export async function updateTask(board_id, task_id, title, description, status,
     return await response.json();
 }
 
+// Moves the task only if its status is still `expected_status`; on a conflict the
+// current task is returned with `moved: false`.
+export async function moveTask(board_id, task_id, expected_status, status, isRetry = false) {
+    const response = await fetch(`${API_V1_BASE_URL}/boards/${board_id}/tasks/${task_id}/move/`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': csrfToken,
+        },
+        credentials: 'include',
+        body: JSON.stringify({ expected_status, status }),
+    });
+
+    if (response.status === 401 && !isRetry) {
+      await refreshToken();
+      return await moveTask(board_id, task_id, expected_status, status, true);
+    }
+
+    if (response.status === 409) {
+      return { moved: false, task: await response.json() };
+    }
+
+    if (!response.ok) {
+      const errorData = await response.json();
+      throw new Error(errorData.detail || 'Error during move task!');
+    }
+
+    return { moved: true, task: await response.json() };
+}
+
 export async function deleteTask(board_id, task_id, isRetry = false) {
     const response = await fetch(`${API_V1_BASE_URL}/boards/${board_id}/tasks/${task_id}/`, {
         method: 'DELETE',
@@ -2,7 +2,7 @@ import { API_V1_BASE_URL } from '../api/api.js';
 
 async function checkIfLoggedIn() {
   try {
-    const response = await fetch(`${API_V1_BASE_URL}/users/profile/`, {
+    const response = await fetch(`${API_V1_BASE_URL}/users/profile/me/`, {
       credentials: 'include',
     });
 
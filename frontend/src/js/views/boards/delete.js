@@ -5,6 +5,7 @@ import { loadBoardsToNavbar } from './list.js';
 export function mountDeleteBoard() {
   const app = {
     boards: [],
+    nextBoardsUrl: null,
     selectedBoardID: '',
     errorMessage: '',
     showModal: false,
@@ -13,8 +14,19 @@ export function mountDeleteBoard() {
 
     async fetchBoards() {
       try {
-        const data = await getBoards();
-        this.boards = data;
+        const { results, next } = await getBoards();
+        this.boards = results;
+        this.nextBoardsUrl = next;
+      } catch (err) {
+        this.errorMessage = 'Error during fetch boards: ' + err.message;
+      }
+    },
+
+    async loadMoreBoards() {
+      try {
+        const { results, next } = await getBoards(this.nextBoardsUrl);
+        this.boards = [...this.boards, ...results];
+        this.nextBoardsUrl = next;
       } catch (err) {
         this.errorMessage = 'Error during fetch boards: ' + err.message;
       }
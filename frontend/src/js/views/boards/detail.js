@@ -1,11 +1,15 @@
 import { createApp } from 'https://unpkg.com/petite-vue?module';
 import { getBoard } from '../../api/boards.js';
-import { getTasks, updateTask } from '../../api/tasks.js';
+import { getTask, getTasks, getTasksPage, moveTask, subscribeTaskEvents } from '../../api/tasks.js';
+
+// Fields of the task cards; descriptions are loaded on demand.
+const CARD_FIELDS = ['id', 'title', 'status', 'completed', 'created_at', 'updated_at', 'completed_at'];
 
 export function mountBoardDetail() {
   const app = {
     board: null,
     tasks: [],
+    nextTasksUrl: null,
     errorMessage: '',
     statuses: ['todo', 'in progress', 'done'],
     selectedStatus: null,
@@ -13,14 +17,9 @@ export function mountBoardDetail() {
     sortKey: 'created_at',
     sortOrder: 'desc',
 
+    // Tasks are filtered by the server; the loaded ones are sorted locally.
     get filteredTasks() {
-      let result = this.tasks;
-
-      if (this.selectedStatus) {
-        result = result.filter(t => t.status === this.selectedStatus);
-      }
-
-      return result.slice().sort((a, b) => {
+      return this.tasks.slice().sort((a, b) => {
         const dateA = a[this.sortKey] ? new Date(a[this.sortKey]) : null;
         const dateB = b[this.sortKey] ? new Date(b[this.sortKey]) : null;
 
@@ -32,6 +31,15 @@ export function mountBoardDetail() {
       });
     },
 
+    matchesFilter(task) {
+      return !this.selectedStatus || task.status === this.selectedStatus;
+    },
+
+    async selectStatus(status) {
+      this.selectedStatus = status;
+      await this.fetchTasks();
+    },
+
     setSort(key, order) {
       this.sortKey = key;
       this.sortOrder = order;
@@ -51,21 +59,72 @@ export function mountBoardDetail() {
         return;
       }
 
+      await this.fetchTasks();
+    },
+
+    async fetchTasks() {
+      const filters = this.selectedStatus ? { status: this.selectedStatus } : {};
+
+      try {
+        const { results, next } = await getTasks(this.board.id, CARD_FIELDS, filters);
+        this.tasks = results;
+        this.nextTasksUrl = next;
+      } catch (err) {
+        this.errorMessage = 'Error during fetch task: ' + err.message;
+      }
+    },
+
+    // Pages after the first one are loaded on demand.
+    async loadMoreTasks() {
       try {
-        this.tasks = await getTasks(boardId);
+        const { results, next } = await getTasksPage(this.nextTasksUrl);
+        const ids = new Set(results.map(t => t.id));
+        this.tasks = [...this.tasks.filter(t => !ids.has(t.id)), ...results];
+        this.nextTasksUrl = next;
       } catch (err) {
         this.errorMessage = 'Error during fetch task: ' + err.message;
       }
     },
 
+    subscribeEvents() {
+      const boardId = window.activeBoard?.id;
+      if (!boardId) return;
+
+      window.closeBoardEvents?.();
+      window.closeBoardEvents = subscribeTaskEvents(boardId, (event) => this.applyEvent(event));
+    },
+
+    applyEvent({ event, tasks }) {
+      // Archiving or restoring the board changes all its tasks at once.
+      if (event === 'archived' || event === 'unarchived') return this.fetchData();
+
+      const ids = new Set(tasks.map(t => t.id));
+      const kept = this.tasks.filter(t => !ids.has(t.id));
+
+      this.tasks = event === 'deleted' ? kept : [...kept, ...tasks.filter(t => this.matchesFilter(t))];
+    },
+
+    async loadDescription(taskId) {
+      const task = this.tasks.find(t => t.id === taskId);
+      if (!task || 'description' in task) return;
+
+      try {
+        const { description } = await getTask(this.board.id, taskId, ['description']);
+        this.tasks = this.tasks.map(t => (t.id === taskId ? { ...t, description } : t));
+      } catch (err) {
+        console.error('Error during fetch task description:', err);
+      }
+    },
+
     async updateTaskStatus(taskId, status) {
       try {
         const task = this.tasks.find(t => t.id === taskId);
 
         if (!task) throw new Error('Task not found');
 
-        await updateTask(this.board.id, taskId, null, null, status, null);
-        await this.fetchData();
+        const { moved, task: current } = await moveTask(this.board.id, taskId, task.status, status);
+        this.applyEvent({ event: 'updated', tasks: [current] });
+        if (!moved) console.warn('Task was moved by someone else:', current.status);
 
       } catch (err) {
         console.error('Error during update task status:', err);
@@ -78,11 +137,12 @@ export function mountBoardDetail() {
       const { mountCreateTask } = await import('../tasks/create.js');
 
       mountCreateTask(this.board.id, (newTask) => {
-        this.tasks.push(newTask);
+        this.applyEvent({ event: 'created', tasks: [newTask] });
       });
     },
 
     async loadUpdateTaskForm(taskId) {
+      await this.loadDescription(taskId);
       const task = this.tasks.find(t => t.id === taskId);
 
       await window.loadView(`./forms/tasks/update.html`);
@@ -113,4 +173,5 @@ export function mountBoardDetail() {
   vueApp.mount('#board-detail');
 
   app.fetchData();
+  app.subscribeEvents();
 }
@@ -15,26 +15,54 @@ export function mountBoardList() {
   }).mount('#board-list');
 }
 
+function appendBoardButtons(nav, boards) {
+  boards.forEach(board => {
+    const btn = document.createElement('button');
+
+    btn.textContent = board.title;
+    btn.className = 'btn btn-outline-secondary btn-sm mx-1';
+
+    btn.onclick = () => {
+      window.activeBoard = board;
+      window.loadView(`./forms/boards/detail.html?id=${board.id}`);
+    };
+
+    nav.appendChild(btn);
+  });
+}
+
+// Boards are loaded one page at a time; the "More" button loads the next page.
+function appendMoreButton(nav, next) {
+  if (!next) return;
+
+  const more = document.createElement('button');
+
+  more.textContent = 'More';
+  more.className = 'btn btn-link btn-sm mx-1';
+
+  more.onclick = async () => {
+    more.remove();
+    try {
+      const page = await getBoards(next);
+      appendBoardButtons(nav, page.results);
+      appendMoreButton(nav, page.next);
+    } catch (err) {
+      nav.appendChild(more);
+    }
+  };
+
+  nav.appendChild(more);
+}
+
 export async function loadBoardsToNavbar() {
   const nav = document.getElementById('board-nav');
   nav.innerHTML = '';
 
   try {
-    const boards = await getBoards();
-
-    boards.forEach(board => {
-      const btn = document.createElement('button');
-
-      btn.textContent = board.title;
-      btn.className = 'btn btn-outline-secondary btn-sm mx-1';
-
-      btn.onclick = () => {
-        window.activeBoard = board;
-        window.loadView(`./forms/boards/detail.html?id=${board.id}`);
-      };
+    const { results, next } = await getBoards();
 
-      nav.appendChild(btn);
-    });
+    appendBoardButtons(nav, results);
+    appendMoreButton(nav, next);
 
   } catch (err) {
     nav.innerHTML = '<span class="text-danger">Error during get boards!</span>';
@@ -5,6 +5,7 @@ import { loadBoardsToNavbar } from './list.js';
 export function mountUpdateBoard() {
   const app = {
     boards: [],
+    nextBoardsUrl: null,
     selectedBoardID: '',
     title: '',
     description: '',
@@ -15,14 +16,25 @@ export function mountUpdateBoard() {
 
     async fetchBoards() {
       try {
-        const data = await getBoards();
-        this.boards = data;
+        const { results, next } = await getBoards();
+        this.boards = results;
+        this.nextBoardsUrl = next;
         this.onBoardChange();
       } catch (err) {
         this.errorMessage = 'Error during fetch boards: ' + err.message;
       }
     },
 
+    async loadMoreBoards() {
+      try {
+        const { results, next } = await getBoards(this.nextBoardsUrl);
+        this.boards = [...this.boards, ...results];
+        this.nextBoardsUrl = next;
+      } catch (err) {
+        this.errorMessage = 'Error during fetch boards: ' + err.message;
+      }
+    },
+
     onBoardChange() {
       if (!this.selectedBoardID) {
         this.title = '';